@@ -51,6 +51,7 @@ class Config:
         self.MAX_TOTAL_POSITIONS = int(os.getenv('MAX_TOTAL_POSITIONS', '10'))
         self.MAX_PORTFOLIO_DELTA = float(os.getenv('MAX_PORTFOLIO_DELTA', '100'))
         self.MAX_PORTFOLIO_THETA = float(os.getenv('MAX_PORTFOLIO_THETA', '-500'))
+        self.MIN_TRADE_CASH = float(os.getenv('MIN_TRADE_CASH', '100'))  # Skip trade evaluation below this cash
 
         # =====================================================================
         # WHEEL STRATEGY CONFIGURATION
@@ -226,6 +227,11 @@ class Config:
         }
 
         self.BATCH_SIZE = int(os.getenv('GROK_BATCH_SIZE', '10'))
+        self.GROK_PROMPT_TOKEN_BUDGET = int(os.getenv('GROK_PROMPT_TOKEN_BUDGET', '8000'))  # prompt + completion
+        self.GROK_POSITION_CHECK_MIN_SECONDS = int(os.getenv('GROK_POSITION_CHECK_MIN_SECONDS', '60'))
+        self.GROK_POSITION_CHECK_MAX_SECONDS = int(os.getenv('GROK_POSITION_CHECK_MAX_SECONDS', '900'))
+        self.GROK_POSITION_CHECKS_PER_DAY = int(os.getenv('GROK_POSITION_CHECKS_PER_DAY', '150'))  # Grok position-review budget
+        self.GROK_PNL_MOVE_THRESHOLD = float(os.getenv('GROK_PNL_MOVE_THRESHOLD', '0.05'))  # |Δ unrealized_plpc| counted as a move
         self.QUALITY_GATE_SIZE = int(os.getenv('QUALITY_GATE_SIZE', '30'))
 
         # =====================================================================
@@ -255,6 +261,8 @@ class Config:
             'main': os.getenv('MAIN_LOG_FILE', 'logs/openbb_options_bot.log'),
             'grok': os.getenv('GROK_LOG_FILE', 'logs/grok_interactions.log')
         }
+        # Per-candidate detail lines on the console (approval breakdown, validation passes)
+        self.VERBOSE_OUTPUT = os.getenv('VERBOSE_OUTPUT', 'true').lower() == 'true'
 
         # =====================================================================
         # EMERGENCY AND SAFETY PARAMETERS
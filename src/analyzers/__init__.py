@@ -14,7 +14,7 @@ from .openbb_client import OpenBBClient
 from .iv_analyzer import IVAnalyzer
 from .regime_analyzer import MarketRegimeAnalyzer
 from .flow_analyzer import FlowAnalyzer
-from .technical_analyzer import TechnicalAnalyzer
+from .technical_analyzer import TechnicalAnalyzer, Technicals
 from .economic_calendar import EconomicCalendar
 from .sentiment_analyzer import SentimentAnalyzer
 
@@ -24,6 +24,7 @@ __all__ = [
     'MarketRegimeAnalyzer',
     'FlowAnalyzer',
     'TechnicalAnalyzer',
+    'Technicals',
     'EconomicCalendar',
     'SentimentAnalyzer',
 ]
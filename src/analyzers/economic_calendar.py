@@ -10,8 +10,9 @@ Monitors:
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class EconomicCalendar:
@@ -25,15 +26,18 @@ class EconomicCalendar:
         self.cache_expiry = 14400  # 4 hours (4 * 3600)
         self.last_refresh_date = None  # Track last refresh date for daily reset
 
-    def get_next_earnings(self, symbol: str) -> Optional[datetime]:
-        """Get next earnings date for symbol"""
-        # FIXED: Issue #14 - Force refresh on new trading day
+    def _reset_cache_if_new_day(self):
+        """FIXED: Issue #14 - Force refresh on new trading day"""
         current_date = datetime.now().date()
         if self.last_refresh_date != current_date:
             logging.info(f"New trading day detected, clearing earnings cache (was: {self.last_refresh_date}, now: {current_date})")
             self.earnings_cache.clear()
             self.last_refresh_date = current_date
 
+    def get_next_earnings(self, symbol: str) -> Optional[datetime]:
+        """Get next earnings date for symbol"""
+        self._reset_cache_if_new_day()
+
         # Check cache
         if symbol in self.earnings_cache:
             cached_time, cached_date = self.earnings_cache[symbol]
@@ -67,10 +71,36 @@ class EconomicCalendar:
             logging.debug(f"Could not get earnings for {symbol}: {e}")
             return None
 
+    def check_earnings_risk_bulk(self, symbols: List[str], max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Bulk version of check_earnings_risk - one call for many symbols.
+
+        Earnings dates not already cached are looked up concurrently, then each
+        symbol is assessed from the warm cache.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        self._reset_cache_if_new_day()
+
+        now = time.time()
+        uncached = [s for s in symbols
+                    if s not in self.earnings_cache or now - self.earnings_cache[s][0] >= self.cache_expiry]
+        if len(uncached) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(uncached))) as executor:
+                earnings_dates = dict(zip(uncached, executor.map(self.get_next_earnings, uncached)))
+        else:
+            earnings_dates = {s: self.get_next_earnings(s) for s in uncached}
+
+        return {
+            s: self._assess_earnings_risk(earnings_dates[s] if s in earnings_dates else self.get_next_earnings(s))
+            for s in symbols
+        }
+
     def check_earnings_risk(self, symbol: str) -> Dict:
         """Check if symbol has earnings risk"""
-        earnings_date = self.get_next_earnings(symbol)
+        return self._assess_earnings_risk(self.get_next_earnings(symbol))
 
+    def _assess_earnings_risk(self, earnings_date: Optional[datetime]) -> Dict:
+        """Classify earnings risk from the next earnings date"""
         if not earnings_date:
             return {
                 'risk': 'UNKNOWN',
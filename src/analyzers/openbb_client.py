@@ -7,21 +7,74 @@ Provides a robust client for accessing OpenBB financial data with:
 - Auto-reset after timeout
 - Comprehensive error handling
 - Automatic Greeks calculation when not provided
+- Concurrent (aiohttp) multi-symbol quote fetching
+- Opt-in short-TTL quote/options-chain caching (display paths; trading paths stay fresh)
 """
 
+import asyncio
+import copy
 import logging
 import time
+import threading
+import aiohttp
 import requests
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple, Any
 from datetime import datetime, timedelta
 from src.utils.greeks_calculator import GreeksCalculator
 
 
+class TTLCache:
+    """Small thread-safe TTL cache (key -> value, expires ttl seconds after it was stored)
+
+    Values are deep-copied on the way in and out so one caller mutating a quote/chain
+    cannot leak into another caller's copy.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> Optional[Any]:
+        """Return the cached value, or None if missing/expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        """Store value (None is never cached so failures are retried)"""
+        if value is None:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            now = time.monotonic()
+            if len(self._data) >= self.maxsize and key not in self._data:
+                # Drop expired entries first, then the oldest insertion if still full
+                self._data = {k: v for k, v in self._data.items() if v[0] > now}
+                if len(self._data) >= self.maxsize:
+                    self._data.pop(next(iter(self._data)))
+            self._data[key] = (now + self.ttl, value)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class OpenBBClient:
     """Client for OpenBB REST API with error handling and retry logic"""
 
-    def __init__(self, base_url='http://127.0.0.1:6900/api/v1'):
+    def __init__(self, base_url='http://127.0.0.1:6900/api/v1', quote_cache_seconds: float = 30,
+                 chain_cache_seconds: float = 15):
         self.base_url = base_url
+        # Short TTL caches - only consulted with cached=True (portfolio display); every fetch refreshes them
+        self.quote_cache = TTLCache(ttl=quote_cache_seconds, maxsize=1024)
+        self.chain_cache = TTLCache(ttl=chain_cache_seconds, maxsize=256)
         self.max_retries = 3
         self.retry_delay = 1.0
         self.consecutive_failures = 0
@@ -90,13 +143,20 @@ class OpenBBClient:
 
         return None
 
-    def get_options_chains(self, symbol: str, provider='yfinance') -> Optional[Dict]:
+    def get_options_chains(self, symbol: str, provider='yfinance', cached: bool = False) -> Optional[Dict]:
         """
         Get complete options chain with Greeks and IV
 
         IMPORTANT: YFinance provider does NOT include Greeks in the response.
         This method automatically calculates Greeks using Black-Scholes model.
+
+        cached=True may return a chain up to chain_cache_seconds old (display use only).
         """
+        if cached:
+            hit = self.chain_cache.get((symbol, provider))
+            if hit is not None:
+                return hit
+
         url = f'{self.base_url}/derivatives/options/chains'
         params = {'symbol': symbol, 'provider': provider}
 
@@ -128,6 +188,7 @@ class OpenBBClient:
             except Exception as e:
                 logging.debug(f"Could not calculate Greeks for {symbol}: {e}")
 
+        self.chain_cache.set((symbol, provider), result)
         return result
 
     def get_options_expirations(self, symbol: str) -> List[datetime]:
@@ -168,8 +229,19 @@ class OpenBBClient:
         time.sleep(0.1)
         return result
 
-    def get_quote(self, symbol: str) -> Optional[Dict]:
-        """Get current quote data"""
+    def get_quote(self, symbol: str, cached: bool = False) -> Optional[Dict]:
+        """Get current quote data (cached=True may return a quote up to quote_cache_seconds old)"""
+        if cached:
+            hit = self.quote_cache.get(symbol)
+            if hit is not None:
+                return hit
+
+        result = self._raw_get_quote(symbol)
+        self.quote_cache.set(symbol, result)
+        return result
+
+    def _raw_get_quote(self, symbol: str) -> Optional[Dict]:
+        """Fetch current quote data from the API (uncached)"""
         url = f'{self.base_url}/equity/price/quote'
         params = {'symbol': symbol, 'provider': 'yfinance'}
 
@@ -177,6 +249,64 @@ class OpenBBClient:
         time.sleep(0.05)
         return result
 
+    def log_quote_cache_info(self):
+        """Log quote cache hit/miss counts (used to tune the TTL/size from real traffic)"""
+        cache = self.quote_cache
+        logging.info(f"Quote cache: {cache.hits} hits, {cache.misses} misses, {len(cache)}/{cache.maxsize} entries")
+
+    async def get_quote_async(self, symbol: str, session: aiohttp.ClientSession) -> Optional[Dict]:
+        """Get current quote data over a shared aiohttp session (no blocking sleep)"""
+        if self.circuit_breaker_active:
+            return None
+
+        url = f'{self.base_url}/equity/price/quote'
+        params = {'symbol': symbol, 'provider': 'yfinance'}
+
+        try:
+            async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=20)) as response:
+                if response.status == 200:
+                    self.consecutive_failures = 0
+                    return await response.json()
+                logging.debug(f"Async quote request failed for {symbol}: {response.status}")
+        except Exception as e:
+            logging.debug(f"Async quote request failed for {symbol}: {e}")
+            self.consecutive_failures += 1
+        return None
+
+    async def get_quotes_async(self, symbols: List[str],
+                               session: Optional[aiohttp.ClientSession] = None,
+                               cached: bool = False) -> Dict[str, Optional[Dict]]:
+        """Fetch quotes for many symbols concurrently over one keep-alive connection pool"""
+        symbols = list(dict.fromkeys(s for s in symbols if s))
+        if not symbols:
+            return {}
+
+        # With cached=True serve what the TTL cache already holds; only fetch the rest
+        quotes = {s: self.quote_cache.get(s) if cached else None for s in symbols}
+        missing = [s for s, q in quotes.items() if q is None]
+        if not missing:
+            return quotes
+
+        if session is None:
+            connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+            async with aiohttp.ClientSession(connector=connector) as own_session:
+                results = await asyncio.gather(*[self.get_quote_async(s, own_session) for s in missing])
+        else:
+            results = await asyncio.gather(*[self.get_quote_async(s, session) for s in missing])
+
+        for symbol, result in zip(missing, results):
+            self.quote_cache.set(symbol, result)
+            quotes[symbol] = result
+        return quotes
+
+    def get_quotes(self, symbols: List[str], cached: bool = False) -> Dict[str, Optional[Dict]]:
+        """Synchronous wrapper for concurrent multi-symbol quote fetching"""
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.get_quotes_async(symbols, cached=cached))
+        finally:
+            loop.close()
+
     # ========================================================================
     # SPRINT 1: QUICK WINS - New endpoints for enhanced scanning
     # ========================================================================
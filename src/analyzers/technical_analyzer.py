@@ -11,9 +11,50 @@ Provides:
 import logging
 import time
 import statistics
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 
+@dataclass(slots=True, frozen=True)
+class Technicals:
+    """Flat technical analysis result (slot attributes instead of nested dicts)"""
+    rsi: float = 50.0
+    rsi_status: str = 'neutral'
+    support: float = 0.0
+    resistance: float = 0.0
+    near_support: bool = False
+    near_resistance: bool = False
+    trend_dir: str = 'sideways'
+    trend_strength: float = 0.0
+    short_ma: float = 0.0
+    long_ma: float = 0.0
+    annual_vol: float = 0.0
+    avg_daily_range_pct: float = 0.0
+
+    def as_dict(self) -> Dict:
+        """Legacy nested-dict view for callers not yet migrated to attributes"""
+        return {
+            'rsi': self.rsi,
+            'rsi_status': self.rsi_status,
+            'support_resistance': {
+                'support': self.support,
+                'resistance': self.resistance,
+                'near_support': self.near_support,
+                'near_resistance': self.near_resistance
+            },
+            'trend': {
+                'direction': self.trend_dir,
+                'strength': self.trend_strength,
+                'short_ma': self.short_ma,
+                'long_ma': self.long_ma
+            },
+            'volatility': {
+                'annual_volatility': self.annual_vol,
+                'avg_daily_range_pct': self.avg_daily_range_pct
+            }
+        }
+
+
 class TechnicalAnalyzer:
     """Advanced technical analysis for entry/exit timing"""
 
@@ -22,7 +63,7 @@ class TechnicalAnalyzer:
         self.technical_cache = {}
         self.cache_expiry = 900  # 15 minutes
 
-    def analyze_technicals(self, symbol: str) -> Dict:
+    def analyze_technicals(self, symbol: str) -> Technicals:
         """Comprehensive technical analysis"""
         cache_key = f"technical_{symbol}"
 
@@ -60,13 +101,20 @@ class TechnicalAnalyzer:
             # Volatility analysis
             volatility = self._calculate_volatility(closes)
 
-            result = {
-                'rsi': rsi,
-                'rsi_status': 'overbought' if rsi > 70 else 'oversold' if rsi < 30 else 'neutral',
-                'support_resistance': support_resistance,
-                'trend': trend,
-                'volatility': volatility
-            }
+            result = Technicals(
+                rsi=rsi,
+                rsi_status='overbought' if rsi > 70 else 'oversold' if rsi < 30 else 'neutral',
+                support=support_resistance['support'],
+                resistance=support_resistance['resistance'],
+                near_support=support_resistance.get('near_support', False),
+                near_resistance=support_resistance.get('near_resistance', False),
+                trend_dir=trend['direction'],
+                trend_strength=trend['strength'],
+                short_ma=trend.get('short_ma', 0.0),
+                long_ma=trend.get('long_ma', 0.0),
+                annual_vol=volatility.get('annual_volatility', 0.0),
+                avg_daily_range_pct=volatility.get('avg_daily_range_pct', 0.0)
+            )
 
             # Cache result
             self.technical_cache[cache_key] = (time.time(), result)
@@ -160,12 +208,6 @@ class TechnicalAnalyzer:
             'avg_daily_range_pct': avg_range_pct
         }
 
-    def _default_technicals(self) -> Dict:
+    def _default_technicals(self) -> Technicals:
         """Default technical analysis when data unavailable"""
-        return {
-            'rsi': 50,
-            'rsi_status': 'neutral',
-            'support_resistance': {'support': 0, 'resistance': 0, 'near_support': False, 'near_resistance': False},
-            'trend': {'direction': 'sideways', 'strength': 0},
-            'volatility': {'annual_volatility': 0, 'avg_daily_range_pct': 0}
-        }
+        return Technicals()
@@ -15,22 +15,38 @@ NOTE: All sector-based logic has been removed. Risk management now uses:
 """
 
 import os
+import re
 import sys
 import logging
+import logging.handlers
+import queue
+import atexit
 import asyncio
 import aiohttp
 import time
+import math
 import json
+import hashlib
+import random
+import traceback
+import heapq
 import requests
+from bisect import bisect_left, bisect_right
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta, time as dt_time
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, NamedTuple, Optional, Tuple, Union
 from colorama import Fore, Style
-from collections import deque
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from itertools import islice
+from operator import itemgetter
 from alpaca.trading.client import TradingClient
 from alpaca.trading.enums import OrderSide, OrderType, TimeInForce, QueryOrderStatus
 from alpaca.trading.requests import LimitOrderRequest, OptionLegRequest, GetOrdersRequest
-import statistics
-import pytz
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import modular components
@@ -53,6 +69,7 @@ from src.strategies import (
 )
 from src.order_management import ReplacementAnalyzer, BatchOrderManager
 from src.ui.interactive_ui import InteractiveUI
+from src.utils import APICache, TokenBucket
 from src.utils.validators import (
     validate_contract_liquidity, get_contract_price,
     calculate_dynamic_limit_price, validate_grok_response,
@@ -60,7 +77,194 @@ from src.utils.validators import (
 )
 
 
+# (option type char, is long) -> strategy inferred for positions reconciled from Alpaca
+_STRATEGY_MAP = {
+    ('C', True): 'LONG_CALL',
+    ('C', False): 'SHORT_CALL',
+    ('P', True): 'LONG_PUT',
+    ('P', False): 'SHORT_PUT',
+}
+
+
+# Hold-rationale signal matchers (substring semantics, matched case-insensitively in one pass)
+_HOLD_RE = re.compile(r'hold|monitor|wait|long-term|positioning|potential|set-up|developing|patience', re.I)
+_EXIT_RE = re.compile(r'exit|sell', re.I)
+# Checked in order - first match wins (e.g. BULL_CALL_SPREAD is a spread, not a momentum play)
+_STRATEGY_RATIONALE = (
+    (re.compile(r'long', re.I), "Directional bet needs time to work"),
+    (re.compile(r'spread|straddle', re.I), "Complex strategy may benefit from time decay or volatility change"),
+    (re.compile(r'bull|bear', re.I), "Momentum strategy - market may turn favorable"),
+)
+
+
+# Pre-Grok quality gate buckets: score = SCORE[searchsorted(THRESH, value)]
+_SPREAD_THRESH = np.array([0.05, 0.10, 0.15])        # bid/ask spread % (lower is better)
+_SPREAD_SCORE = np.array([30, 20, 10, 0])
+_VOLUME_THRESH = np.array([10000, 20000, 50000])     # both volume AND OI must clear a tier
+_OI_THRESH = np.array([25000, 50000, 100000])
+_LIQUIDITY_SCORE = np.array([0, 10, 18, 25])
+_SIGNAL_THRESH = np.array([2, 3, 4])                 # confirming signal count
+_SIGNAL_SCORE = np.array([0, 10, 15, 20])
+_IV_EXTREME_THRESH = np.array([20, 30])              # |IV rank - 50|
+_IV_EXTREME_SCORE = np.array([0, 10, 15])
+_FRESHNESS_THRESH = np.array([5, 10, 15])            # data age in minutes
+_FRESHNESS_SCORE = np.array([10, 7, 4, 0])
+
+# Shared read-only default for chained .get() lookups on missing nested dicts - no {} allocated per miss
+_EMPTY = MappingProxyType({})
+
+# Completion tokens requested per batch - reserved out of the prompt token budget
+_GROK_MAX_COMPLETION_TOKENS = 2000
+
+# Grok responses worth retrying: rate limited or gateway/server temporarily unavailable
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Transient Grok request failures -> label used in retry logs
+_GROK_TRANSIENT_ERRORS = (
+    (asyncio.TimeoutError, "timeout"),
+    (aiohttp.ClientConnectionError, "connection error"),
+)
+
+# Common filler words dropped from Grok reasons for the concise UI summary
+_FILLER_WORDS = frozenset({'the', 'a', 'an', 'is', 'are', 'and', 'or', 'with', 'for', 'to', 'of', 'in',
+                           'that', 'this', 'be', 'has', 'have', 'from', 'at', 'by', 'on', 'as'})
+
+# PHASE 2: IV rank strategy guidance, indexed by
+# bisect_right(_IV_LOW_BREAKS, iv) + bisect_left(_IV_HIGH_BREAKS, iv):
+# <30 cheap | 30-40 none | 40-60 neutral | 60-70 none | >70 expensive
+_IV_LOW_BREAKS = (30, 40)
+_IV_HIGH_BREAKS = (60, 70)
+_IV_ANNOTATIONS = (
+    " [💰 CHEAP OPTIONS - Good for BUYING (debit spreads, long calls/puts)]",
+    "",
+    " [⚖️ NEUTRAL IV - Use with caution for spreads]",
+    "",
+    " [💸 EXPENSIVE OPTIONS - Good for SELLING (credit spreads)]",
+)
+
+# PROMPT IMPROVEMENT 1.3: Earnings proximity warning by risk level
+_EARNINGS_TAGS = {
+    'HIGH': " [⚠️ EARNINGS: {} days - IV CRUSH RISK!]",
+    'MODERATE': " [⚠️ Earnings: {} days]",
+}
+
+
+# Static tail of every batch Grok prompt
+# PROMPT IMPROVEMENT 1.5: Multi-leg strategy bonuses / 1.4: Quantified confidence scoring rubric
+_BATCH_PROMPT_SUFFIX = """STRATEGY SELECTION BONUSES (add to base confidence):
+- IRON_CONDOR in low volatility (IV rank <30): +10%
+- STRADDLE/STRANGLE in high IV rank (>70): +15%
+- Credit spreads vs naked short options: +5% (defined risk benefit)
+- Debit spreads vs naked long options: +3% (lower cost, defined risk)
+- Calendar spreads for term structure plays: +10%
+- Multi-leg strategies (general sophistication bonus): +5%
+
+STRATEGY PENALTIES (subtract from confidence):
+- Naked short call/put: -10% (undefined risk)
+- Strategies against market regime: -20% (e.g., bullish in BEAR_TRAP)
+- Overlapping positions in same underlying: -15%
+- Strategy not suited for IV environment: -15%
+
+CONFIDENCE SCORING RUBRIC (BE PRECISE AND CONSISTENT):
+
+95-100% - PERFECT SETUP (All 5 factors aligned):
+  ✓ Strong directional/volatility signal from scanner (BIG_MOVE, HIGH_IV_RANK, etc.)
+  ✓ IV environment favors strategy (IV rank extreme <25 or >75)
+  ✓ Excellent liquidity (spread <5%, volume >1000, OI >5000)
+  ✓ Favorable Greeks profile for chosen strategy
+  ✓ No earnings within 14 days OR earnings play with clear directional edge
+
+85-94% - STRONG SETUP (4/5 factors aligned, minor concerns)
+70-84% - GOOD SETUP (3/5 factors present, some risks)
+50-69% - MARGINAL SETUP (2/5 factors, significant risks)
+<50% - WEAK SETUP (use only for diversification, low conviction)
+
+AUTOMATIC CONFIDENCE REDUCTIONS:
+- Earnings within 7 days: -20% (unless specifically earnings play)
+- Bid-ask spread >10%: -15%
+- Bid-ask spread >15%: -25%
+- Volume <100 or OI <1000: -20%
+- Volume <50 or OI <500: -30%
+- Already 10%+ portfolio exposure to this symbol: -25%
+- Already 15%+ portfolio exposure to this symbol: -35%
+- Sector already >30% of portfolio: -15%
+- Sector already >40% of portfolio: -25%
+- Wide spread (>10%) + low volume (<100): -35% (compounding risk)
+
+IMPORTANT RULES:
+- Reserve 95%+ for truly exceptional setups (1-2 per week maximum)
+- Most good trades should be 75-85% confidence
+- Be conservative - overconfidence leads to losses
+- Consider ALL factors, not just one strong signal
+- Respect portfolio limits and diversification
+- Ensure adequate buying power for position sizing
+
+Provide ONLY the formatted lines, one per symbol. No other text."""
+
+
+# Precomputed portfolio-summary templates (ANSI codes embedded once at import)
+_RULE_LINE = f"{Colors.HEADER}{'='*80}{Colors.RESET}\n"
+_PORTFOLIO_HEADER = (f"\n{_RULE_LINE}"
+                     f"{Colors.HEADER}                          CURRENT PORTFOLIO STATUS{Colors.RESET}\n"
+                     f"{_RULE_LINE}\n")
+_POSITION_ROW_TMPL = (
+    f"{Colors.DIM}  {{idx:2d}}. {{sym:25s}} Qty: {{qty:3d}}  Entry: ${{entry:7.2f}}  Current: ${{current:7.2f}}\n"
+    f"      Stock: ${{stock_price:>7.2f}} {{stock_color}}({{stock_pct:>+6.2f}}%){Colors.RESET}  "
+    f"Value: ${{market_val:>10,.2f}}  {{pl_color}}P&L: ${{pl:>+10,.2f}} ({{pl_pct:>+6.1%}}){Colors.RESET}\n\n"
+)
+_SPREAD_ROW_TMPL = (
+    f"{Colors.DIM}  {{idx:2d}}. {{sym:25s}} Qty: {{qty:3d}}  Strikes: ${{short_strike:.2f}}/${{long_strike:.2f}}\n"
+    f"      Stock: ${{stock_price:>7.2f}} {{stock_color}}({{stock_pct:>+6.2f}}%){Colors.RESET}  "
+    f"DTE: {{dte:3d}}  {{pl_color}}P&L: ${{pl:>+10,.2f}} ({{pl_pct:>+6.1%}}){Colors.RESET}\n"
+    f"      Credit: ${{credit:.2f}}  Current: ${{current:.2f}}  Max Profit: ${{max_profit:.0f}}  Max Risk: ${{max_risk:.0f}}\n\n"
+)
+
+_GROK_RESULT_ROW_TMPL = (
+    f"  {{idx:>2}}  {{sym:6}}  {{conf_color}}{{conf:3d}}%{Colors.RESET}  {{strategy:18}}  {{strikes:12}}  {{expiry:8}}  "
+    f"{Colors.DIM}{{reason}}{Colors.RESET}\n"
+)
+
+# Static parts of the Grok position-review prompt (one row per position goes between them)
+_GROK_POSITION_PROMPT_HEADER = """You are an expert options trader. Analyze these positions and recommend exit actions.
+
+IMPORTANT: Consider the STRATEGY used for each position when making recommendations.
+- Different strategies have different exit criteria
+- Multi-leg strategies (spreads, straddles) may need both legs managed
+- Some strategies are meant to expire worthless (credit spreads)
+
+POSITIONS:
+"""
+
+_GROK_POSITION_PROMPT_FOOTER = """
+For each position, respond with ONE of these actions:
+- HOLD: Keep position open
+- EXIT: Close position immediately
+- TAKE_PROFIT: Exit to lock in gains
+- CUT_LOSS: Exit to prevent further loss
+
+Format: SYMBOL|ACTION|REASON
+Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
+
+_GROK_POSITION_PROMPT_ROW_TMPL = (
+    "{idx}. {symbol} | Strategy: {strategy} | Strikes: {strikes}\n"
+    "   Entry: ${entry_price:.2f} | Current: ${current_price:.2f} | P&L: {pnl_pct:+.1%}\n"
+    "   Stock Price: ${stock_price:.2f} | Original Reason: {entry_reason}\n"
+)
+
+
+class _PassThroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records unformatted so the listener's handler formats them
+
+    The stock prepare() formats on the logging thread; records only cross threads in this
+    process, so the listener can format (timestamp, %-args, exc_info) and write instead.
+    """
+
+    def prepare(self, record):
+        return record
+
+
 # Helper function for extracting underlying symbol from OCC format
+# (cached - the same position/order symbols are re-parsed every scan)
+@lru_cache(maxsize=4096)
 def extract_underlying_symbol(full_symbol: str) -> str:
     """Extract underlying stock symbol from OCC format or return as-is for stocks"""
     if len(full_symbol) > 15:  # OCC options format: TICKER + YYMMDD + C/P + STRIKE (15 chars)
@@ -68,30 +272,299 @@ def extract_underlying_symbol(full_symbol: str) -> str:
     return full_symbol
 
 
+def _index_by_underlying(items) -> Dict[str, List]:
+    """Group Alpaca positions/orders by underlying symbol (stock symbols map to themselves)"""
+    by_underlying = defaultdict(list)
+    for item in items:
+        by_underlying[extract_underlying_symbol(item.symbol)].append(item)
+    return by_underlying
+
+
+# Strategy-name tokens that mean more than one leg (several positions may share an underlying)
+_MULTI_LEG_TOKENS = frozenset({'SPREAD', 'STRADDLE', 'STRANGLE', 'BUTTERFLY', 'CONDOR', 'COLLAR'})
+# Strategies the multi-leg order manager can close atomically
+_ATOMIC_CLOSE_STRATEGIES = frozenset({
+    'BULL_CALL_SPREAD', 'BEAR_PUT_SPREAD',
+    'BULL_PUT_SPREAD', 'BEAR_CALL_SPREAD',
+    'IRON_CONDOR', 'STRADDLE', 'STRANGLE',
+})
+
+
+@lru_cache(maxsize=256)
+def _is_multi_leg_strategy(strategy: str) -> bool:
+    """True if any '_'/space-separated token of the strategy name is a multi-leg keyword"""
+    return not _MULTI_LEG_TOKENS.isdisjoint(strategy.upper().replace(' ', '_').split('_'))
+
+
+@lru_cache(maxsize=512)
+def _primary_source(source: str) -> str:
+    """First entry of a comma-separated discovery-source string ('' if none)"""
+    return source.split(',', 1)[0] if source else ''
+
+
+@lru_cache(maxsize=256)
+def _parse_expiration(expiration: str) -> datetime:
+    """Parse a YYYY-MM-DD expiration (cached - the same few expiries repeat every refresh)"""
+    return datetime.fromisoformat(expiration)
+
+
+def _option_greek(opt: Dict, name: str) -> float:
+    """Greek from whichever provider field is populated (e.g. delta/greeks_delta/theoretical_delta), NaN if none"""
+    value = opt.get(name) or opt.get(f'greeks_{name}') or opt.get(f'theoretical_{name}')
+    return value if isinstance(value, (int, float)) else np.nan
+
+
+# One Grok batch reply line: SYMBOL|STRATEGY|STRIKES|EXPIRY|CONFIDENCE[|REASON] (extra fields ignored)
+_BATCH_LINE_RE = re.compile(r'^([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)(?:\|([^|\n]*))?', re.MULTILINE)
+_NON_DIGIT_RE = re.compile(r'\D')
+# One Grok position-review reply line: SYMBOL|ACTION|REASON (extra fields ignored)
+_POSITION_REVIEW_LINE_RE = re.compile(r'^([^|\n]*)\|([^|\n]*)\|([^|\n]*)', re.MULTILINE)
+
+# First two legs of a Grok strikes field, e.g. "450/455" or "450/455/470/475"
+_STRIKE_PAIR_RE = re.compile(r'\s*(\d+(?:\.\d+)?)\s*/\s*(\d+(?:\.\d+)?)\s*(?:/|$)')
+
+# Minimum spread width by stock price tier: <$20 | <$100 | <$500 (allows $3-5 spreads) | $500+
+_SPREAD_PRICE_TIERS = (20.0, 100.0, 500.0)
+_MIN_SPREAD_WIDTHS = (0.50, 1.00, 2.50, 5.00)
+
+# Post-validation IV-rank rejections, in rule order: long vol, short vol, debit, credit, single leg
+_IV_REJECT_REASONS = (
+    "IV rank {iv_rank:.0f}% too HIGH for buying {strategy} (max 50% - avoid IV crush!)",
+    "IV rank {iv_rank:.0f}% too LOW for selling {strategy} (min 70%)",
+    "IV rank {iv_rank:.0f}% too high for debit spread (max 40% - avoid buying expensive options)",
+    "IV rank {iv_rank:.0f}% too low for credit spread (min 60% - need expensive premium to sell)",
+    "IV rank {iv_rank:.0f}% too high for single leg (max 30%)",
+)
+
+# Strategy classification flags (see classify_strategy)
+_STRAT_DEBIT, _STRAT_CREDIT, _STRAT_SINGLE, _STRAT_CONDOR = 1, 2, 4, 8
+_STRAT_VOLATILITY, _STRAT_LONG, _STRAT_SHORT, _STRAT_SPREAD = 16, 32, 64, 128
+
+# Keyword -> flags. Keywords that contain another keyword ('LONG CALL' > 'LONG',
+# 'IRON CONDOR' > 'CONDOR') carry its flags too, since the regex consumes the longer match
+_STRATEGY_KEYWORD_FLAGS = {
+    'BULL CALL': _STRAT_DEBIT, 'BEAR PUT': _STRAT_DEBIT, 'DEBIT': _STRAT_DEBIT,
+    'BULL PUT': _STRAT_CREDIT, 'BEAR CALL': _STRAT_CREDIT, 'CREDIT': _STRAT_CREDIT,
+    'LONG CALL': _STRAT_SINGLE | _STRAT_LONG, 'LONG PUT': _STRAT_SINGLE | _STRAT_LONG,
+    'IRON CONDOR': _STRAT_CONDOR, 'CONDOR': _STRAT_CONDOR,
+    'STRADDLE': _STRAT_VOLATILITY, 'STRANGLE': _STRAT_VOLATILITY,
+    'LONG': _STRAT_LONG, 'SHORT': _STRAT_SHORT, 'SPREAD': _STRAT_SPREAD,
+}
+_STRATEGY_KEYWORD_RE = re.compile(
+    '|'.join(sorted(map(re.escape, _STRATEGY_KEYWORD_FLAGS), key=len, reverse=True))
+)
+
+
+@dataclass(slots=True, frozen=True)
+class StrategyClass:
+    """Strategy-type classification of a Grok strategy name, computed once at parse time"""
+    is_debit_spread: bool
+    is_credit_spread: bool
+    is_single_leg: bool
+    is_iron_condor: bool
+    is_volatility_play: bool
+    is_long_vol: bool   # only meaningful for volatility plays
+    is_short_vol: bool
+
+
+@lru_cache(maxsize=256)
+def classify_strategy(strategy: str) -> StrategyClass:
+    """Classify a strategy name (case-insensitive) from one regex pass over its keywords"""
+    flags = 0
+    for keyword in _STRATEGY_KEYWORD_RE.findall(strategy.upper()):
+        flags |= _STRATEGY_KEYWORD_FLAGS[keyword]
+
+    is_short_vol = bool(flags & _STRAT_SHORT)
+    return StrategyClass(
+        is_debit_spread=bool(flags & _STRAT_DEBIT),
+        is_credit_spread=bool(flags & _STRAT_CREDIT),
+        is_single_leg=bool(flags & _STRAT_SINGLE) and not flags & _STRAT_SPREAD,
+        is_iron_condor=bool(flags & _STRAT_CONDOR),
+        is_volatility_play=bool(flags & _STRAT_VOLATILITY),
+        is_long_vol=bool(flags & _STRAT_LONG) or not is_short_vol,
+        is_short_vol=is_short_vol,
+    )
+
+
+class ValidationCtx(NamedTuple):
+    """Inputs shared by the post-validation rules for one Grok recommendation"""
+    symbol: str
+    strategy: str
+    strategy_class: StrategyClass
+    iv_rank: float
+    stock_price: float
+    spread_width: Optional[float]   # None when the strikes are not a parseable spread
+    min_spread_width: float
+
+
+def _log_vol_borderline(ctx: ValidationCtx) -> None:
+    if ctx.strategy_class.is_volatility_play and ctx.strategy_class.is_long_vol and ctx.iv_rank > 40:
+        logging.warning(f"{ctx.symbol}: IV rank {ctx.iv_rank:.0f}% borderline for buying {ctx.strategy} (prefer <40%)")
+
+
+def _log_debit_borderline(ctx: ValidationCtx) -> None:
+    if ctx.strategy_class.is_debit_spread and ctx.iv_rank > 30:
+        logging.warning(f"{ctx.symbol}: IV rank {ctx.iv_rank:.0f}% is borderline for debit spread (prefer <30%)")
+
+
+def _log_credit_borderline(ctx: ValidationCtx) -> None:
+    if ctx.strategy_class.is_credit_spread and ctx.iv_rank < 70:
+        logging.warning(f"{ctx.symbol}: IV rank {ctx.iv_rank:.0f}% is acceptable for credit spread but prefer >70%")
+
+
+def _log_spread_pricing(ctx: ValidationCtx) -> None:
+    if ctx.spread_width is None:
+        return
+    # Debit: never pay more than 60% of width; credit: collect at least 30% (actual price not known here)
+    if ctx.strategy_class.is_debit_spread:
+        logging.info(f"{ctx.symbol}: Spread width ${ctx.spread_width:.2f} - ensure debit < ${ctx.spread_width * 0.60:.2f} (60% of width)")
+    if ctx.strategy_class.is_credit_spread:
+        logging.info(f"{ctx.symbol}: Spread width ${ctx.spread_width:.2f} - ensure credit > ${ctx.spread_width * 0.30:.2f} (30% of width)")
+
+
+def _iv_reason(index: int):
+    return lambda ctx: _IV_REJECT_REASONS[index].format(iv_rank=ctx.iv_rank, strategy=ctx.strategy)
+
+
+# Post-validation rules as (rejects, reason, advisory), checked in order until the first
+# reject. advisory (optional) logs soft warnings once its rule has passed. The confidence
+# gate and the portfolio exposure check run outside the table, before and after it.
+# Strategy/IV rules only need the strategy class and IV rank, so validate_batch can run them
+# for a whole batch up front; the spread-width rule needs the strikes and live stock price.
+_STRATEGY_IV_RULES = (
+    # Iron condors need naked options, which paper trading does not allow
+    (lambda ctx: ctx.strategy_class.is_iron_condor and config.ALPACA_MODE == 'paper',
+     lambda ctx: "Iron Condor not allowed in paper trading (requires naked options)",
+     None),
+    # Volatility plays: buy straddles/strangles only in LOW IV (avoid IV crush), sell only in HIGH IV
+    (lambda ctx: ctx.strategy_class.is_volatility_play and ctx.strategy_class.is_long_vol and ctx.iv_rank > 50,
+     _iv_reason(0),
+     _log_vol_borderline),
+    (lambda ctx: (ctx.strategy_class.is_volatility_play and not ctx.strategy_class.is_long_vol
+                  and ctx.strategy_class.is_short_vol and ctx.iv_rank < 70),
+     _iv_reason(1),
+     None),
+    # Debit spreads only when IV is LOW (cheap options)
+    (lambda ctx: ctx.strategy_class.is_debit_spread and ctx.iv_rank > 40,
+     _iv_reason(2),
+     _log_debit_borderline),
+    # Credit spreads only when IV is ELEVATED - 60% minimum to be sure we sell expensive premium
+    (lambda ctx: ctx.strategy_class.is_credit_spread and ctx.iv_rank < 60,
+     _iv_reason(3),
+     _log_credit_borderline),
+    # Single legs only when IV is VERY LOW
+    (lambda ctx: ctx.strategy_class.is_single_leg and ctx.iv_rank > 30,
+     _iv_reason(4),
+     None),
+)
+
+_SPREAD_WIDTH_RULES = (
+    # Spread width must clear the stock-price tier minimum
+    (lambda ctx: ctx.spread_width is not None and ctx.spread_width < ctx.min_spread_width,
+     lambda ctx: (f"Spread width ${ctx.spread_width:.2f} too narrow "
+                  f"(min ${ctx.min_spread_width:.2f} for ${ctx.stock_price:.2f} stock)"),
+     _log_spread_pricing),
+)
+
+_POST_VALIDATION_RULES = _STRATEGY_IV_RULES + _SPREAD_WIDTH_RULES
+
+
+@lru_cache(maxsize=1024)
+def _shorten_reason(reason: str, max_length: int) -> str:
+    """Keyword summary of a Grok reason - the same reasons recur across batches and cycles"""
+    # Extract key phrases and signals
+    keywords = []
+    length = 0  # len(' '.join(keywords)), kept as a running total
+
+    for word in reason.split():
+        cleaned = word.strip('.,;:').lower()
+        # Keep important words (not filler) and percentage numbers
+        if cleaned not in _FILLER_WORDS or '%' in word or word.isupper():
+            length += len(word) + (1 if keywords else 0)
+            keywords.append(word)
+
+        # Stop when we have enough content
+        if length >= max_length - 3:
+            break
+
+    # Join keywords
+    concise = ' '.join(keywords)
+
+    # Intelligently truncate at word boundary if still too long
+    if len(concise) > max_length:
+        concise = concise[:max_length].rsplit(' ', 1)[0]
+        if len(concise) < max_length - 3:  # If truncation removed too much, add ellipsis
+            concise += '...'
+
+    return concise if concise else "Analysis unavailable"
+
+
+def _mean_or_zero(values: np.ndarray) -> float:
+    """Mean of a (possibly empty) array, 0 when empty"""
+    return float(values.mean()) if values.size else 0.0
+
+
+def create_pooled_http_session(pool_connections: int = 16, pool_maxsize: int = 32) -> requests.Session:
+    """Create a keep-alive requests.Session so all Alpaca clients share one TLS connection pool"""
+    session = requests.Session()
+    # Only retry connection setup - Alpaca's RESTClient already retries 429/504 responses itself
+    retry = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+
+def parse_occ_symbol(symbol: str) -> Optional[Tuple[str, int, str, int]]:
+    """
+    Parse an OCC option symbol in one pass over its fixed-width 15-char tail.
+
+    Format: TICKER + YYMMDD + C/P + STRIKE*1000 (8 digits), e.g. SPY251219C00450000
+
+    Returns:
+        (underlying, yymmdd, option_type, strike_millis) or None for stocks/malformed symbols
+    """
+    if len(symbol) <= 15:
+        return None
+
+    date_digits = symbol[-15:-9]
+    option_type = symbol[-9]
+    strike_digits = symbol[-8:]
+    if option_type not in ('C', 'P') or not date_digits.isdigit() or not strike_digits.isdigit():
+        return None
+
+    return symbol[:-15], int(date_digits), option_type, int(strike_digits)
+
+
 class OptionsBot:
     """Main options trading bot - PRODUCTION READY v3.0 - FIXED ALL CRITICAL ISSUES"""
 
-    def reconcile_positions_on_startup(self):
+    def reconcile_positions_on_startup(self, positions: Optional[List] = None):
         """Reconcile existing Alpaca positions with strategy database on startup"""
         try:
             logging.info("Reconciling positions with strategy database on startup...")
-            positions = self.trading_client.get_all_positions()
+            if positions is None:
+                positions = self.trading_client.get_all_positions()
 
             if not positions:
                 logging.info("No positions to reconcile")
                 return
 
             reconciled_count = 0
+            now = datetime.now()  # One clock read for the whole pass
 
-            for position in positions:
+            # Look up existing strategies for every underlying in a single query
+            underlyings = [self._extract_underlying(p.symbol) for p in positions]
+            existing = self.trade_journal.get_position_strategies(underlyings)
+            new_records = []  # Written in one transaction after the loop
+
+            for position, underlying in zip(positions, underlyings):
                 symbol = position.symbol
-                underlying = self._extract_underlying(symbol)
 
                 # Check if strategy already exists
-                existing_strategy = self.trade_journal.get_position_strategy(underlying)
+                existing_strategy = existing.get(underlying)
 
                 if existing_strategy:
-                    logging.info(f"Strategy already exists for {underlying}: {existing_strategy['strategy']}")
+                    logging.info("Strategy already exists for %s: %s", underlying, existing_strategy['strategy'])
                     continue
 
                 # Extract details from position and symbol
@@ -103,17 +576,9 @@ class OptionsBot:
                 strategy = "STOCK_POSITION"  # Default
                 if len(symbol) > 6:  # Option contract
                     # Extract strategy from OCC symbol
-                    try:
-                        date_end = len(underlying) + 6  # Symbol + 6 digits for YYYYMMDD
-                        if date_end < len(symbol):
-                            option_type_char = symbol[date_end]
-
-                            if option_type_char.upper() == 'C':
-                                strategy = "LONG_CALL" if qty > 0 else "SHORT_CALL"
-                            elif option_type_char.upper() == 'P':
-                                strategy = "LONG_PUT" if qty > 0 else "SHORT_PUT"
-                    except:
-                        pass
+                    date_end = len(underlying) + 6  # Symbol + 6 digits for YYMMDD
+                    if date_end < len(symbol):
+                        strategy = _STRATEGY_MAP.get((symbol[date_end].upper(), qty > 0), strategy)
 
                 # Create strategy record
                 position_tracking = {
@@ -124,58 +589,64 @@ class OptionsBot:
                     'quantity': qty,
                     'confidence': 70,  # Default confidence for reconciled positions
                     'strikes': self._extract_strikes_from_symbol(symbol),
-                    'expiry': self._extract_expiry_from_symbol(symbol),
+                    'expiry': self._extract_expiry_from_symbol(symbol, now),
                     'reason': f"Reconciled from Alpaca position on startup - {strategy}"
                 }
 
-                self.trade_journal.track_active_position(position_tracking)
+                new_records.append(position_tracking)
+                existing[underlying] = position_tracking  # Later legs on the same underlying are already covered
                 reconciled_count += 1
-                logging.info(f"Reconciled {underlying}: Created strategy '{strategy}' from position")
+                logging.info("Reconciled %s: Created strategy '%s' from position", underlying, strategy)
 
-            logging.info(f"Position reconciliation complete: {reconciled_count} positions added to strategy DB")
+            self.trade_journal.track_active_positions_bulk(new_records)
+            logging.info("Position reconciliation complete: %d positions added to strategy DB", reconciled_count)
 
         except Exception as e:
-            logging.error(f"Error reconciling positions on startup: {e}")
+            logging.error("Error reconciling positions on startup: %s", e)
 
     def _extract_strikes_from_symbol(self, symbol: str) -> str:
         """Extract strike prices from OCC symbol"""
-        try:
-            if len(symbol) >= 15:  # OCC format with strike
-                # Last 8 digits are strike price * 1000
-                strike_digits = symbol[-8:]
-                strike_price = float(strike_digits) / 1000
-                return f"{strike_price:.2f}"
-        except (ValueError, IndexError):
-            pass
+        parsed = parse_occ_symbol(symbol)
+        if parsed:
+            # Last 8 digits are strike price * 1000 - format with integer math (no float round-trip)
+            strike_millis = parsed[3]
+            return f"{strike_millis // 1000}.{(strike_millis % 1000) // 10:02d}"
         return "UNKNOWN"
 
-    def _extract_expiry_from_symbol(self, symbol: str) -> str:
-        """Extract expiration date from OCC symbol and convert to DTE"""
-        try:
-            if len(symbol) >= 12:  # Following format has 12+ characters
-                # YYMMDD format in symbol
-                underlying = self._extract_underlying(symbol)
-                date_start = len(underlying)
-                if date_start + 6 <= len(symbol):
-                    expiry_str = symbol[date_start:date_start+6]  # YYMMDD
-
-                    if len(expiry_str) == 6:
-                        # Convert YYMMDD to datetime
-                        expiry_date = datetime.strptime(expiry_str, '%y%m%d')
-                        now = datetime.now()
-                        days_to_expiry = (expiry_date - now).days
-
-                        if days_to_expiry > 0:
-                            return f"{days_to_expiry}DTE"
-        except (ValueError, IndexError):
-            pass
+    def _extract_expiry_from_symbol(self, symbol: str, now: Optional[datetime] = None) -> str:
+        """Extract expiration date from OCC symbol and convert to DTE (pass `now` when looping)"""
+        parsed = parse_occ_symbol(symbol)
+        if parsed:
+            yymmdd = parsed[1]
+            try:
+                # Build the date from integer YYMMDD fields (no strptime format parsing)
+                expiry_date = datetime(2000 + yymmdd // 10000, yymmdd // 100 % 100, yymmdd % 100)
+            except ValueError:
+                return "UNKNOWN"
+
+            days_to_expiry = (expiry_date - (now or datetime.now())).days
+            if days_to_expiry > 0:
+                return f"{days_to_expiry}DTE"
         return "UNKNOWN"
 
     def _extract_underlying(self, full_symbol: str) -> str:
         """Extract underlying stock symbol from OCC format or return as-is for stocks"""
-        if len(full_symbol) > 15:  # OCC options format: TICKER + YYMMDD + C/P + STRIKE (15 chars)
-            return full_symbol[:-15]
-        return full_symbol
+        return extract_underlying_symbol(full_symbol)
+
+    def _fetch_quotes(self, symbols, cached: bool = False) -> Dict[str, Optional[Dict]]:
+        """Fetch OpenBB quotes for many symbols concurrently (aiohttp + asyncio.gather)
+
+        cached=True lets display paths reuse quotes up to the client's TTL old; trading paths fetch fresh.
+        """
+        symbols = [s for s in set(symbols) if s]
+        if not symbols:
+            return {}
+
+        try:
+            return self.openbb.get_quotes(symbols, cached=cached)
+        except Exception as e:
+            logging.debug("Concurrent quote fetch failed, falling back to sequential: %s", e)
+            return {s: self.openbb.get_quote(s, cached=cached) for s in symbols}
 
     def __init__(self):
         # FIX #2: Initialize alert_manager before setup_alpaca so we can alert on account issues
@@ -185,23 +656,26 @@ class OptionsBot:
         self.openbb = OpenBBClient()
         self.scan_cache = ScanResultCache()
 
-        # Check OpenBB server
+        # Check OpenBB server while the Alpaca connection/account check runs in parallel
         print(f"{Colors.INFO}[*] Checking OpenBB REST API server...{Colors.RESET}")
 
-        for attempt in range(5):
-            if self.api_server.is_running():
-                print(f"{Colors.SUCCESS}[OK] OpenBB API server running{Colors.RESET}")
-                break
-            if attempt < 4:
-                print(f"{Colors.DIM}  Attempt {attempt+1}/5 failed, waiting 3 seconds...{Colors.RESET}")
-                time.sleep(3)
-        else:
-            print(f"{Colors.ERROR}[!] OpenBB API not running. Please start it manually:{Colors.RESET}")
-            print(f"{Colors.DIM}    python -m uvicorn openbb_core.api.rest_api:app --host 127.0.0.1 --port 6900{Colors.RESET}")
-            sys.exit(1)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            alpaca_future = executor.submit(self.setup_alpaca)
+
+            loop = asyncio.new_event_loop()
+            try:
+                openbb_running = loop.run_until_complete(self.api_server.wait_until_running_async())
+            finally:
+                loop.close()
+
+            if not openbb_running:
+                print(f"{Colors.ERROR}[!] OpenBB API not running. Please start it manually:{Colors.RESET}")
+                print(f"{Colors.DIM}    python -m uvicorn openbb_core.api.rest_api:app --host 127.0.0.1 --port 6900{Colors.RESET}")
+                sys.exit(1)
+            print(f"{Colors.SUCCESS}[OK] OpenBB API server running{Colors.RESET}")
 
-        # Initialize components
-        self.setup_alpaca()
+            # Initialize components (re-raises SystemExit if account checks failed)
+            alpaca_future.result()
 
         self.market_calendar = MarketCalendar()
         self.iv_analyzer = IVAnalyzer(self.openbb)
@@ -212,7 +686,8 @@ class OptionsBot:
         self.earnings_calendar = EconomicCalendar()
 
         # GROK DEBUG: Log API key status before scanner init
-        logging.warning(f"[GROK INIT] About to initialize scanner - XAI_API_KEY present: {bool(config.XAI_API_KEY)}, length: {len(config.XAI_API_KEY) if config.XAI_API_KEY else 0}")
+        logging.warning("[GROK INIT] About to initialize scanner - XAI_API_KEY present: %s, length: %d",
+                        bool(config.XAI_API_KEY), len(config.XAI_API_KEY) if config.XAI_API_KEY else 0)
 
         self.market_scanner = ExpertMarketScanner(
             self.openbb,
@@ -245,7 +720,7 @@ class OptionsBot:
             config=config
         )
         self.wheel_strategy.wheel_db = self.wheel_manager  # Link database manager
-        logging.info(f"[WHEEL] The Wheel Strategy initialized - 50-95% win rate expected")
+        logging.info("[WHEEL] The Wheel Strategy initialized - 50-95% win rate expected")
 
         # BULL PUT SPREAD STRATEGY: Initialize spread strategy with separate Alpaca account
         self.spread_trading_client = None
@@ -262,10 +737,11 @@ class OptionsBot:
                     secret_key=config.ALPACA_BULL_PUT_SECRET_KEY,
                     paper=True  # Always paper mode for now
                 )
+                self._attach_http_session(self.spread_trading_client)
 
                 # Verify spread account
                 spread_account = self.spread_trading_client.get_account()
-                logging.info(f"[SPREAD] Connected to spread account - Portfolio: ${float(spread_account.portfolio_value):,.2f}")
+                logging.info("[SPREAD] Connected to spread account - Portfolio: $%.2f", float(spread_account.portfolio_value))
 
                 # Initialize spread manager with separate database
                 self.spread_manager = SpreadManager(db_path='spreads.db')
@@ -278,20 +754,20 @@ class OptionsBot:
                     config=config
                 )
                 self.spread_strategy.spread_db = self.spread_manager  # Link database manager
-                logging.info(f"[SPREAD] Bull Put Spread Strategy initialized - 65-75% win rate expected")
+                logging.info("[SPREAD] Bull Put Spread Strategy initialized - 65-75% win rate expected")
 
                 # Initialize PDT tracker for spread account (<$25k, needs PDT protection)
                 self.pdt_tracker = PDTTracker(db_path='spreads.db')
-                logging.info(f"[SPREAD] PDT tracker initialized - protecting against pattern day trading violations")
+                logging.info("[SPREAD] PDT tracker initialized - protecting against pattern day trading violations")
 
                 # CRITICAL: Reconcile existing Alpaca positions on startup
                 imported = self.spread_manager.reconcile_spreads_from_alpaca(self.spread_trading_client)
                 if imported > 0:
                     print(f"{Colors.SUCCESS}[SPREAD] Imported {imported} existing spread(s) from Alpaca{Colors.RESET}")
-                    logging.info(f"[SPREAD] Reconciliation complete: {imported} spreads imported")
+                    logging.info("[SPREAD] Reconciliation complete: %d spreads imported", imported)
 
             except Exception as e:
-                logging.error(f"[SPREAD] Failed to initialize spread strategy: {e}")
+                logging.error("[SPREAD] Failed to initialize spread strategy: %s", e)
                 self.spread_trading_client = None
                 self.spread_manager = None
                 self.spread_strategy = None
@@ -306,7 +782,7 @@ class OptionsBot:
             self.wheel_manager,  # Pass wheel_manager to skip exit checks for Wheel positions
             config  # Pass config for Wheel profit target access
         )
-        logging.info(f"[POSITION MANAGER] Initialized with Wheel position protection")
+        logging.info("[POSITION MANAGER] Initialized with Wheel position protection")
 
         # Initialize Grok logger for detailed AI analysis logging
         self.grok_logger = logging.getLogger('grok')
@@ -317,8 +793,25 @@ class OptionsBot:
         os.makedirs(os.path.dirname(grok_log_path), exist_ok=True)
         grok_handler = logging.FileHandler(grok_log_path)
         grok_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        self.grok_logger.addHandler(grok_handler)
+        # Records are formatted and written by a listener thread, not the trading loop
+        # (f-string messages are still built by the caller; only the Formatter and file write move)
+        grok_queue = queue.SimpleQueue()
+        self.grok_logger.addHandler(_PassThroughQueueHandler(grok_queue))
+        self._grok_log_listener = logging.handlers.QueueListener(grok_queue, grok_handler)
+        self._grok_log_listener.start()
+        atexit.register(self._grok_log_listener.stop)  # Flush queued records on exit
         self.grok_logger.propagate = False  # Don't propagate to root logger
+        self.verbose = config.VERBOSE_OUTPUT
+        # Grok batch replies keyed by prompt hash - identical prompts within 10 min skip the API
+        self.grok_response_cache = APICache(max_age_seconds=600)
+        self._grok_limiter = TokenBucket(rate=2, capacity=4)  # Grok batch POST pacing
+        self._prompt_prefix_cache = None  # (monotonic time, exposure version, prefix, exposure) - see _build_prompt_prefix
+        self._scan_cache = {}  # key -> (monotonic time, value) - see _memo
+        self._exposure_cache = None  # Exposure snapshot shared by trade validations - see _get_exposure_snapshot
+        self._exposure_cache_version = -1
+        self._occ_symbols_cache = {}  # (strategy, symbol, strikes, expiry, multi-leg, YYYY-MM-DD) -> expected OCC symbols
+        self._hv_cache = {}  # (symbol, days, YYYY-MM-DD) -> annualized HV (backed by the journal's historical_volatility table)
+        self._hv_cache_date = None  # Trading day the HV cache holds - see _hv_trade_date
 
         self.pre_market_opportunities = deque(maxlen=100)  # Prevent memory leak
 
@@ -332,31 +825,92 @@ class OptionsBot:
         self.last_openbb_scan_time = None
         self.last_grok_analysis_time = None
         self.last_position_grok_check = None  # Track last Grok position review
-
-        print(f"\n{Colors.INFO}[i] Configuration:{Colors.RESET}")
-        print(f"{Colors.DIM}  XAI API:{Colors.RESET} {Colors.SUCCESS if config.XAI_API_KEY else Colors.ERROR}{'Connected' if config.XAI_API_KEY else 'Missing'}{Colors.RESET}")
-        print(f"{Colors.DIM}  Alpaca:{Colors.RESET} {Colors.SUCCESS if config.ALPACA_API_KEY else Colors.ERROR}{'Connected' if config.ALPACA_API_KEY else 'Missing'}{Colors.RESET}")
-        print(f"{Colors.DIM}  Mode:{Colors.RESET} {Colors.WARNING if config.ALPACA_MODE == 'paper' else Colors.ERROR}{config.ALPACA_MODE.upper()}{Colors.RESET}")
-        logging.info(f"ALPACA_MODE = '{config.ALPACA_MODE}' (type: {type(config.ALPACA_MODE)})")
-        print(f"{Colors.DIM}  Database:{Colors.RESET} {Colors.SUCCESS}trades.db{Colors.RESET}")
-        print(f"{Colors.DIM}  Expert Scanner:{Colors.RESET} {Colors.SUCCESS}Multi-factor analysis (Greeks + IV + Unusual Activity){Colors.RESET}")
-        print(f"{Colors.DIM}  Position Management:{Colors.RESET} {Colors.SUCCESS}Active (Stop Loss / Profit Targets / Trailing){Colors.RESET}")
-        print(f"{Colors.DIM}  Risk Management:{Colors.RESET} {Colors.SUCCESS}Full (Portfolio limits + Greeks + IV Rank){Colors.RESET}\n")
+        # Adaptive position-review schedule: seconds between meaningful P&L moves drive the next check
+        self._pnl_move_gaps = deque(maxlen=50)
+        self._last_pnl_snapshot = {}
+        self._last_pnl_move_time = None
+        self._position_check_interval = 300
+        self._position_checks_today = (None, 0)  # (date, Grok reviews issued)
+
+        logging.info("ALPACA_MODE = '%s' (type: %s)", config.ALPACA_MODE, type(config.ALPACA_MODE))
+        sys.stdout.write("".join([
+            f"\n{Colors.INFO}[i] Configuration:{Colors.RESET}\n",
+            f"{Colors.DIM}  XAI API:{Colors.RESET} {Colors.SUCCESS if config.XAI_API_KEY else Colors.ERROR}{'Connected' if config.XAI_API_KEY else 'Missing'}{Colors.RESET}\n",
+            f"{Colors.DIM}  Alpaca:{Colors.RESET} {Colors.SUCCESS if config.ALPACA_API_KEY else Colors.ERROR}{'Connected' if config.ALPACA_API_KEY else 'Missing'}{Colors.RESET}\n",
+            f"{Colors.DIM}  Mode:{Colors.RESET} {Colors.WARNING if config.ALPACA_MODE == 'paper' else Colors.ERROR}{config.ALPACA_MODE.upper()}{Colors.RESET}\n",
+            f"{Colors.DIM}  Database:{Colors.RESET} {Colors.SUCCESS}trades.db{Colors.RESET}\n",
+            f"{Colors.DIM}  Expert Scanner:{Colors.RESET} {Colors.SUCCESS}Multi-factor analysis (Greeks + IV + Unusual Activity){Colors.RESET}\n",
+            f"{Colors.DIM}  Position Management:{Colors.RESET} {Colors.SUCCESS}Active (Stop Loss / Profit Targets / Trailing){Colors.RESET}\n",
+            f"{Colors.DIM}  Risk Management:{Colors.RESET} {Colors.SUCCESS}Full (Portfolio limits + Greeks + IV Rank){Colors.RESET}\n\n",
+        ]))
+        sys.stdout.flush()
+
+        # Fetch main + spread account positions once (concurrently) and share them across the startup flow
+        self._startup_positions, self._startup_spread_positions = self._fetch_startup_positions()
 
         # Display portfolio and stats at startup
-        self.display_portfolio_summary()
+        self.display_portfolio_summary(
+            positions=self._startup_positions,
+            spread_positions=self._startup_spread_positions
+        )
 
         # Reconcile existing positions with strategy database
-        self.reconcile_positions_on_startup()
+        self.reconcile_positions_on_startup(positions=self._startup_positions)
 
         # Reconcile wheel positions with broker (remove stale positions)
         try:
-            positions = self.trading_client.get_all_positions()
+            positions = self._startup_positions
+            if positions is None:
+                positions = self.trading_client.get_all_positions()
             reconcile_result = self.wheel_manager.reconcile_with_broker(positions)
             if reconcile_result['removed'] > 0:
                 print(f"{Colors.SUCCESS}[WHEEL RECONCILE] Removed {reconcile_result['removed']} stale position(s) from database{Colors.RESET}")
         except Exception as e:
-            logging.error(f"[WHEEL RECONCILE] Error reconciling positions: {e}")
+            logging.error("[WHEEL RECONCILE] Error reconciling positions: %s", e)
+
+        self.openbb.log_quote_cache_info()
+
+    def _fetch_startup_positions(self) -> Tuple[Optional[List], Optional[List]]:
+        """Fetch main and spread account positions concurrently (None = fetch failed, caller refetches)"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            main_future = executor.submit(self.trading_client.get_all_positions)
+            spread_future = (executor.submit(self.spread_trading_client.get_all_positions)
+                             if self.spread_trading_client else None)
+
+            try:
+                positions = main_future.result()
+            except Exception as e:
+                logging.error("Error fetching startup positions: %s", e)
+                positions = None
+
+            spread_positions = None
+            if spread_future is not None:
+                try:
+                    spread_positions = spread_future.result()
+                except Exception as e:
+                    logging.error("[SPREAD] Error fetching startup spread positions: %s", e)
+
+        return positions, spread_positions
+
+    def _attach_http_session(self, client):
+        """Point an Alpaca client at the shared pooled session (auth headers are sent per request)"""
+        if hasattr(client, '_session'):
+            client._session = self.http_session
+        else:
+            logging.debug("%s has no _session attribute - keeping its own connection pool", type(client).__name__)
+
+    def _fetch_spread_live(self, symbol: str) -> Tuple[float, float, str]:
+        """Fetch underlying quote for spread rows (thread-pool worker - no DB access, display-only so TTL-cached)"""
+        try:
+            stock_data = self.openbb.get_quote(symbol, cached=True)
+            if stock_data and isinstance(stock_data, dict) and 'results' in stock_data:
+                stock_quote = stock_data['results'][0] if isinstance(stock_data['results'], list) else stock_data['results']
+                stock_price = stock_quote.get('price', stock_quote.get('last_price', 0))
+                stock_pct_change = stock_quote.get('percent_change', 0) * 100
+                return stock_price, stock_pct_change, Colors.SUCCESS if stock_pct_change >= 0 else Colors.ERROR
+        except Exception as e:
+            logging.debug("Could not fetch quote for %s spread: %s", symbol, e)
+        return 0, 0, Colors.DIM
 
     def setup_alpaca(self):
         """Initialize Alpaca trading client with account eligibility checking"""
@@ -367,14 +921,16 @@ class OptionsBot:
             sys.exit(1)
 
         paper = config.ALPACA_MODE.lower() == 'paper'
+        self.http_session = create_pooled_http_session()
         self.trading_client = TradingClient(config.ALPACA_API_KEY, config.ALPACA_SECRET_KEY, paper=paper)
+        self._attach_http_session(self.trading_client)
 
         # CRITICAL FIX #1: Account eligibility checking
         account = self.trading_client.get_account()
         self.balance = float(account.equity) if account.equity is not None else 0.0
         self.buying_power = float(account.buying_power) if account.buying_power is not None else 0.0
 
-        logging.info(f"Alpaca connected - Balance: ${self.balance:,.2f}")
+        logging.info("Alpaca connected - Balance: $%.2f", self.balance)
 
         # Check account eligibility for options trading in LIVE mode
         if not paper:
@@ -385,9 +941,9 @@ class OptionsBot:
                 options_approved = getattr(account, 'options_approved_level', None)
                 options_trading_level = getattr(account, 'options_buying_power', 0)
 
-                logging.info(f"Live trading account status: {status}")
-                logging.info(f"Options approved level: {options_approved}")
-                logging.info(f"Options buying power: ${options_trading_level:,.2f}")
+                logging.info("Live trading account status: %s", status)
+                logging.info("Options approved level: %s", options_approved)
+                logging.info("Options buying power: $%s", options_trading_level)
 
                 if options_trading_level <= 0:
                     critical_msg = "ACCOUNT NOT ELIGIBLE FOR OPTIONS TRADING - NO OPTIONS BUYING POWER"
@@ -408,13 +964,28 @@ class OptionsBot:
                 self.alert_manager.send_alert('WARNING', warning_msg)
                 print(f"{Colors.WARNING}[WARNING] {warning_msg}{Colors.RESET}")
 
-    def display_portfolio_summary(self):
-        """Display current portfolio and performance stats at startup"""
-        print(f"\n{Colors.HEADER}{'='*80}{Colors.RESET}")
-        print(f"{Colors.HEADER}                          CURRENT PORTFOLIO STATUS{Colors.RESET}")
-        print(f"{Colors.HEADER}{'='*80}{Colors.RESET}\n")
+    def display_portfolio_summary(self, positions: Optional[List] = None, spread_positions: Optional[List] = None):
+        """
+        Display current portfolio and performance stats at startup
+
+        Args:
+            positions: Pre-fetched main account positions (fetched live if None)
+            spread_positions: Pre-fetched spread account positions (fetched live if None)
+        """
+        out = []  # Buffered output - written to stdout in a single call at the end
+
+        # Start spread account I/O in the background so it overlaps the main account fetch/render
+        prefetch_executor = ThreadPoolExecutor(max_workers=2)
+        spread_account_future = None
+        spread_positions_future = None
 
         try:
+            if self.spread_trading_client:
+                spread_account_future = prefetch_executor.submit(self.spread_trading_client.get_account)
+                if spread_positions is None:
+                    spread_positions_future = prefetch_executor.submit(self.spread_trading_client.get_all_positions)
+            out.append(_PORTFOLIO_HEADER)
+
             # WHEEL ACCOUNT (Main)
             account = self.trading_client.get_account()
             equity = float(account.equity) if account.equity is not None else 0.0
@@ -422,42 +993,48 @@ class OptionsBot:
             cash = float(account.cash) if account.cash is not None else 0.0
 
             # Get positions
-            positions = self.trading_client.get_all_positions()
+            if positions is None:
+                positions = self.trading_client.get_all_positions()
 
             # Account overview
-            print(f"{Colors.INFO}WHEEL ACCOUNT (Main):{Colors.RESET}")
-            print(f"{Colors.DIM}  Portfolio Value:    ${equity:>15,.2f}{Colors.RESET}")
-            print(f"{Colors.DIM}  Cash:               ${cash:>15,.2f}{Colors.RESET}")
-            print(f"{Colors.DIM}  Buying Power:       ${buying_power:>15,.2f}{Colors.RESET}")
-            print(f"{Colors.DIM}  Open Positions:     {len(positions):>15}{Colors.RESET}\n")
+            out.append(f"{Colors.INFO}WHEEL ACCOUNT (Main):{Colors.RESET}\n")
+            out.append(f"{Colors.DIM}  Portfolio Value:    ${equity:>15,.2f}{Colors.RESET}\n")
+            out.append(f"{Colors.DIM}  Cash:               ${cash:>15,.2f}{Colors.RESET}\n")
+            out.append(f"{Colors.DIM}  Buying Power:       ${buying_power:>15,.2f}{Colors.RESET}\n")
+            out.append(f"{Colors.DIM}  Open Positions:     {len(positions):>15}{Colors.RESET}\n\n")
 
             # SPREAD ACCOUNT (Secondary) - if configured
             if self.spread_trading_client:
                 try:
-                    spread_account = self.spread_trading_client.get_account()
+                    spread_account = spread_account_future.result()
                     spread_equity = float(spread_account.equity) if spread_account.equity is not None else 0.0
                     spread_cash = float(spread_account.cash) if spread_account.cash is not None else 0.0
                     spread_buying_power = float(spread_account.buying_power) if spread_account.buying_power is not None else 0.0
-                    spread_positions = self.spread_trading_client.get_all_positions()
+                    if spread_positions is None:
+                        spread_positions = spread_positions_future.result()
 
-                    print(f"{Colors.INFO}SPREAD ACCOUNT (Bull Put Spreads):{Colors.RESET}")
-                    print(f"{Colors.DIM}  Portfolio Value:    ${spread_equity:>15,.2f}{Colors.RESET}")
-                    print(f"{Colors.DIM}  Cash:               ${spread_cash:>15,.2f}{Colors.RESET}")
-                    print(f"{Colors.DIM}  Buying Power:       ${spread_buying_power:>15,.2f}{Colors.RESET}")
-                    print(f"{Colors.DIM}  Open Positions:     {len(spread_positions):>15}{Colors.RESET}\n")
+                    out.append(f"{Colors.INFO}SPREAD ACCOUNT (Bull Put Spreads):{Colors.RESET}\n")
+                    out.append(f"{Colors.DIM}  Portfolio Value:    ${spread_equity:>15,.2f}{Colors.RESET}\n")
+                    out.append(f"{Colors.DIM}  Cash:               ${spread_cash:>15,.2f}{Colors.RESET}\n")
+                    out.append(f"{Colors.DIM}  Buying Power:       ${spread_buying_power:>15,.2f}{Colors.RESET}\n")
+                    out.append(f"{Colors.DIM}  Open Positions:     {len(spread_positions):>15}{Colors.RESET}\n\n")
 
                     # Combined totals
                     combined_equity = equity + spread_equity
-                    print(f"{Colors.SUCCESS}COMBINED TOTAL:{Colors.RESET}")
-                    print(f"{Colors.SUCCESS}  Total Portfolio:    ${combined_equity:>15,.2f}{Colors.RESET}\n")
+                    out.append(f"{Colors.SUCCESS}COMBINED TOTAL:{Colors.RESET}\n")
+                    out.append(f"{Colors.SUCCESS}  Total Portfolio:    ${combined_equity:>15,.2f}{Colors.RESET}\n\n")
                 except Exception as e:
                     logging.debug(f"[SPREAD] Could not display spread account: {e}")
 
             # Current positions - WHEEL STRATEGY
             if positions:
-                print(f"{Colors.INFO}OPEN POSITIONS - WHEEL STRATEGY:{Colors.RESET}")
+                # Prefetch all underlying quotes concurrently instead of one round-trip per row
+                stock_quotes = self._fetch_quotes((extract_underlying_symbol(p.symbol) for p in positions), cached=True)
+
+                out.append(f"{Colors.INFO}OPEN POSITIONS - WHEEL STRATEGY:{Colors.RESET}\n")
                 total_value = 0
                 total_pl = 0
+                exp_display_cache = {}  # YYMMDD -> MM/DD/YY
 
                 for i, pos in enumerate(positions, 1):
                     full_symbol = pos.symbol
@@ -475,17 +1052,21 @@ class OptionsBot:
                     # Format: SYMBOL[6]YYMMDD[C|P]STRIKE[8]
                     # Example: SPY251219C00450000 -> SPY, 2025-12-19, Call
                     if len(full_symbol) > 6:
-                        underlying = full_symbol[:full_symbol.index(next(c for c in full_symbol if c.isdigit()))]
+                        # OCC tail is fixed-width (15 chars), so the ticker is everything before it
+                        underlying = extract_underlying_symbol(full_symbol)
                         try:
                             # Extract YYMMDD (6 digits starting after symbol)
                             date_start = len(underlying)
                             exp_str = full_symbol[date_start:date_start+6]
                             option_type = full_symbol[date_start+6]  # C or P
 
-                            exp_date = datetime.strptime(exp_str, '%y%m%d').strftime('%m/%d/%y')
+                            # Many positions share an expiry - format each distinct one once
+                            exp_date = exp_display_cache.get(exp_str)
+                            if exp_date is None:
+                                exp_date = datetime(2000 + int(exp_str[:2]), int(exp_str[2:4]), int(exp_str[4:6])).strftime('%m/%d/%y')
+                                exp_display_cache[exp_str] = exp_date
                             display_symbol = f"{underlying} {exp_date} {option_type}"
                         except:
-                            underlying = extract_underlying_symbol(full_symbol)
                             display_symbol = full_symbol
                             exp_date = "N/A"
                     else:
@@ -496,7 +1077,7 @@ class OptionsBot:
 
                     # Get underlying stock's current price and daily percentage change
                     try:
-                        stock_data = self.openbb.get_quote(underlying)
+                        stock_data = stock_quotes.get(underlying)
                         if stock_data and isinstance(stock_data, dict) and 'results' in stock_data:
                             stock_quote = stock_data['results'][0] if isinstance(stock_data['results'], list) else stock_data['results']
                             stock_price = stock_quote.get('price', stock_quote.get('last_price', 0))
@@ -514,27 +1095,49 @@ class OptionsBot:
                     # Color code P&L
                     pl_color = Colors.SUCCESS if unrealized_pl >= 0 else Colors.ERROR
 
-                    print(f"{Colors.DIM}  {i:2d}. {display_symbol:25s} Qty: {qty:3d}  Entry: ${entry:7.2f}  Current: ${current:7.2f}")
-                    print(f"      Stock: ${stock_price:>7.2f} {stock_change_color}({stock_pct_change:>+6.2f}%){Colors.RESET}  Value: ${market_val:>10,.2f}  {pl_color}P&L: ${unrealized_pl:>+10,.2f} ({unrealized_pct:>+6.1%}){Colors.RESET}\n")
+                    out.append(_POSITION_ROW_TMPL.format(
+                        idx=i, sym=display_symbol, qty=qty, entry=entry, current=current,
+                        stock_price=stock_price, stock_color=stock_change_color, stock_pct=stock_pct_change,
+                        market_val=market_val, pl_color=pl_color, pl=unrealized_pl, pl_pct=unrealized_pct
+                    ))
 
-                print(f"{Colors.DIM}  Total Market Value: ${total_value:,.2f}{Colors.RESET}")
+                out.append(f"{Colors.DIM}  Total Market Value: ${total_value:,.2f}{Colors.RESET}\n")
                 pl_color = Colors.SUCCESS if total_pl >= 0 else Colors.ERROR
-                print(f"  {pl_color}Total Unrealized P&L: ${total_pl:>+,.2f}{Colors.RESET}\n")
+                out.append(f"  {pl_color}Total Unrealized P&L: ${total_pl:>+,.2f}{Colors.RESET}\n\n")
             else:
-                print(f"{Colors.DIM}  No open positions{Colors.RESET}\n")
+                out.append(f"{Colors.DIM}  No open positions{Colors.RESET}\n\n")
 
             # SPREAD POSITIONS - BULL PUT SPREAD STRATEGY
             if self.spread_manager:
                 try:
-                    spread_positions = self.spread_manager.get_all_positions()
+                    open_spreads = self.spread_manager.get_all_positions()
 
-                    if spread_positions:
-                        print(f"{Colors.INFO}OPEN POSITIONS - BULL PUT SPREAD STRATEGY:{Colors.RESET}")
+                    if open_spreads:
+                        # Fetch spread account legs ONCE and index by symbol (not one API call per spread)
+                        try:
+                            if spread_positions is None:
+                                spread_positions = self.spread_trading_client.get_all_positions()
+                            pos_by_sym = {p.symbol: p for p in spread_positions}
+                        except Exception as e:
+                            logging.warning(f"Could not fetch spread account positions: {e}")
+                            pos_by_sym = None
+
+                        # Fetch each distinct underlying quote once, concurrently, then render from the results
+                        spread_symbols = {s['symbol'] for s in open_spreads}
+                        spread_live = {}
+                        with ThreadPoolExecutor(max_workers=min(16, len(spread_symbols))) as executor:
+                            futures = {executor.submit(self._fetch_spread_live, sym): sym for sym in spread_symbols}
+                            for future in as_completed(futures):
+                                spread_live[futures[future]] = future.result()
+
+                        out.append(f"{Colors.INFO}OPEN POSITIONS - BULL PUT SPREAD STRATEGY:{Colors.RESET}\n")
                         spread_total_value = 0
+                        pending_value_updates = []
                         spread_total_pl = 0
+                        now = datetime.now()  # One clock read for every row's DTE
                         display_index = 0  # Track display index separately since we may skip spreads
 
-                        for spread in spread_positions:
+                        for spread in open_spreads:
                             symbol = spread['symbol']
                             short_strike = spread['short_strike']
                             long_strike = spread['long_strike']
@@ -548,26 +1151,18 @@ class OptionsBot:
 
                             # Fetch LIVE P&L from Alpaca positions (more accurate than calculating)
                             try:
-                                # Get current positions from Alpaca
-                                alpaca_positions = self.spread_trading_client.get_all_positions()
-
-                                short_leg_found = False
-                                long_leg_found = False
-                                short_leg_pnl = 0
-                                long_leg_pnl = 0
-                                short_current_price = 0
-                                long_current_price = 0
+                                if pos_by_sym is None:
+                                    raise RuntimeError("spread account positions unavailable")
 
                                 # Find matching positions and get their P&L directly from Alpaca
-                                for pos in alpaca_positions:
-                                    if pos.symbol == short_put_symbol:
-                                        short_leg_found = True
-                                        short_leg_pnl = float(pos.unrealized_pl) if pos.unrealized_pl else 0
-                                        short_current_price = float(pos.current_price) if pos.current_price else 0
-                                    elif pos.symbol == long_put_symbol:
-                                        long_leg_found = True
-                                        long_leg_pnl = float(pos.unrealized_pl) if pos.unrealized_pl else 0
-                                        long_current_price = float(pos.current_price) if pos.current_price else 0
+                                short_pos = pos_by_sym.get(short_put_symbol)
+                                long_pos = pos_by_sym.get(long_put_symbol)
+                                short_leg_found = short_pos is not None
+                                long_leg_found = long_pos is not None
+                                short_leg_pnl = float(short_pos.unrealized_pl) if short_leg_found and short_pos.unrealized_pl else 0
+                                short_current_price = float(short_pos.current_price) if short_leg_found and short_pos.current_price else 0
+                                long_leg_pnl = float(long_pos.unrealized_pl) if long_leg_found and long_pos.unrealized_pl else 0
+                                long_current_price = float(long_pos.current_price) if long_leg_found and long_pos.current_price else 0
 
                                 # CRITICAL: If neither leg exists in Alpaca, spread was closed - skip display and close in DB
                                 if not short_leg_found and not long_leg_found:
@@ -605,8 +1200,8 @@ class OptionsBot:
                                 credit_per_spread = total_credit / num_contracts if num_contracts > 0 else total_credit
                                 unrealized_pnl_pct = (unrealized_pnl / (credit_per_spread * 100) * 100) if credit_per_spread > 0 else 0
 
-                                # Update database with live values
-                                self.spread_manager.update_spread_value(spread['id'], current_value)
+                                # Queue live value for the single database write after the loop
+                                pending_value_updates.append((spread['id'], current_value))
 
                             except Exception as e:
                                 logging.warning(f"Could not fetch live prices for {symbol} spread: {e}")
@@ -617,8 +1212,8 @@ class OptionsBot:
 
                             # Calculate DTE
                             try:
-                                exp_date = datetime.strptime(expiration, '%Y-%m-%d')
-                                dte = (exp_date - datetime.now()).days
+                                exp_date = _parse_expiration(expiration)
+                                dte = (exp_date - now).days
                                 exp_display = exp_date.strftime('%m/%d/%y')
                             except:
                                 dte = 0
@@ -627,22 +1222,8 @@ class OptionsBot:
                             spread_total_value += (current_value * 100 * num_contracts)
                             spread_total_pl += unrealized_pnl
 
-                            # Get underlying stock price and change
-                            try:
-                                stock_data = self.openbb.get_quote(symbol)
-                                if stock_data and isinstance(stock_data, dict) and 'results' in stock_data:
-                                    stock_quote = stock_data['results'][0] if isinstance(stock_data['results'], list) else stock_data['results']
-                                    stock_price = stock_quote.get('price', stock_quote.get('last_price', 0))
-                                    stock_pct_change = stock_quote.get('percent_change', 0) * 100
-                                    stock_change_color = Colors.SUCCESS if stock_pct_change >= 0 else Colors.ERROR
-                                else:
-                                    stock_price = 0
-                                    stock_pct_change = 0
-                                    stock_change_color = Colors.DIM
-                            except:
-                                stock_price = 0
-                                stock_pct_change = 0
-                                stock_change_color = Colors.DIM
+                            # Underlying stock price and change (pre-fetched above)
+                            stock_price, stock_pct_change, stock_change_color = spread_live[symbol]
 
                             # Increment display index for this spread
                             display_index += 1
@@ -653,41 +1234,53 @@ class OptionsBot:
                             # Display format: "Symbol ExpDate SPREAD Qty: X  Strikes: $XX/$XX"
                             display_symbol = f"{symbol} {exp_display} SPREAD"
 
-                            print(f"{Colors.DIM}  {display_index:2d}. {display_symbol:25s} Qty: {num_contracts:3d}  Strikes: ${short_strike:.2f}/${long_strike:.2f}")
-                            print(f"      Stock: ${stock_price:>7.2f} {stock_change_color}({stock_pct_change:>+6.2f}%){Colors.RESET}  DTE: {dte:3d}  {pl_color}P&L: ${unrealized_pnl:>+10,.2f} ({unrealized_pnl_pct/100:>+6.1%}){Colors.RESET}")
-                            print(f"      Credit: ${total_credit:.2f}  Current: ${current_value:.2f}  Max Profit: ${max_profit:.0f}  Max Risk: ${max_risk:.0f}\n")
+                            out.append(_SPREAD_ROW_TMPL.format(
+                                idx=display_index, sym=display_symbol, qty=num_contracts,
+                                short_strike=short_strike, long_strike=long_strike,
+                                stock_price=stock_price, stock_color=stock_change_color, stock_pct=stock_pct_change,
+                                dte=dte, pl_color=pl_color, pl=unrealized_pnl, pl_pct=unrealized_pnl_pct / 100,
+                                credit=total_credit, current=current_value, max_profit=max_profit, max_risk=max_risk
+                            ))
+
+                        # Update database with live values (one transaction for all spreads)
+                        self.spread_manager.update_spread_values(pending_value_updates)
 
-                        print(f"{Colors.DIM}  Total Market Value: ${spread_total_value:,.2f}{Colors.RESET}")
+                        out.append(f"{Colors.DIM}  Total Market Value: ${spread_total_value:,.2f}{Colors.RESET}\n")
                         pl_color = Colors.SUCCESS if spread_total_pl >= 0 else Colors.ERROR
-                        print(f"  {pl_color}Total Unrealized P&L: ${spread_total_pl:>+,.2f}{Colors.RESET}\n")
+                        out.append(f"  {pl_color}Total Unrealized P&L: ${spread_total_pl:>+,.2f}{Colors.RESET}\n\n")
                     else:
-                        print(f"{Colors.INFO}BULL PUT SPREAD POSITIONS:{Colors.RESET}")
-                        print(f"{Colors.DIM}  No open spread positions{Colors.RESET}\n")
+                        out.append(f"{Colors.INFO}BULL PUT SPREAD POSITIONS:{Colors.RESET}\n")
+                        out.append(f"{Colors.DIM}  No open spread positions{Colors.RESET}\n\n")
                 except Exception as e:
                     logging.error(f"Error displaying spread positions: {e}", exc_info=True)
 
             # 30-day performance stats
             stats = self.trade_journal.get_performance_stats(days=30)
             if stats['total_trades'] > 0:
-                print(f"{Colors.INFO}30-DAY PERFORMANCE:{Colors.RESET}")
-                print(f"{Colors.DIM}  Total Trades:       {stats['total_trades']:>15}{Colors.RESET}")
+                out.append(f"{Colors.INFO}30-DAY PERFORMANCE:{Colors.RESET}\n")
+                out.append(f"{Colors.DIM}  Total Trades:       {stats['total_trades']:>15}{Colors.RESET}\n")
                 win_color = Colors.SUCCESS if stats['win_rate'] >= 0.5 else Colors.WARNING
-                print(f"  {win_color}Win Rate:           {stats['win_rate']:>14.1%}{Colors.RESET}")
+                out.append(f"  {win_color}Win Rate:           {stats['win_rate']:>14.1%}{Colors.RESET}\n")
                 pnl_color = Colors.SUCCESS if stats['total_pnl'] >= 0 else Colors.ERROR
-                print(f"  {pnl_color}Total P&L:          ${stats['total_pnl']:>14,.2f}{Colors.RESET}")
+                out.append(f"  {pnl_color}Total P&L:          ${stats['total_pnl']:>14,.2f}{Colors.RESET}\n")
                 return_color = Colors.SUCCESS if stats['avg_return'] >= 0 else Colors.ERROR
-                print(f"  {return_color}Avg Return:         {stats['avg_return']:>14.1%}{Colors.RESET}")
-                print(f"{Colors.DIM}  Wins:               {stats['wins']:>15}{Colors.RESET}")
-                print(f"{Colors.DIM}  Losses:             {stats['losses']:>15}{Colors.RESET}\n")
+                out.append(f"  {return_color}Avg Return:         {stats['avg_return']:>14.1%}{Colors.RESET}\n")
+                out.append(f"{Colors.DIM}  Wins:               {stats['wins']:>15}{Colors.RESET}\n")
+                out.append(f"{Colors.DIM}  Losses:             {stats['losses']:>15}{Colors.RESET}\n\n")
             else:
-                print(f"{Colors.INFO}30-DAY PERFORMANCE:{Colors.RESET}")
-                print(f"{Colors.DIM}  No closed trades in the last 30 days{Colors.RESET}\n")
+                out.append(f"{Colors.INFO}30-DAY PERFORMANCE:{Colors.RESET}\n")
+                out.append(f"{Colors.DIM}  No closed trades in the last 30 days{Colors.RESET}\n\n")
 
         except Exception as e:
             logging.error(f"Error displaying portfolio summary: {e}")
-            print(f"{Colors.ERROR}[!] Could not retrieve portfolio information{Colors.RESET}\n")
+            out.append(f"{Colors.ERROR}[!] Could not retrieve portfolio information{Colors.RESET}\n\n")
+        finally:
+            # Release the prefetch workers even if rendering raised (don't block on an unused future)
+            prefetch_executor.shutdown(wait=False)
 
-        print(f"{Colors.HEADER}{'='*80}{Colors.RESET}\n")
+        out.append(_RULE_LINE + "\n")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
 
     def display_portfolio_strategy_summary(self):
         """Display strategic rationale for holding current positions"""
@@ -698,11 +1291,18 @@ class OptionsBot:
                 print(f"{Colors.INFO}[STRATEGY SUMMARY] No open positions{Colors.RESET}\n")
                 return
 
-            print(f"\n{Colors.HEADER}{'='*80}{Colors.RESET}")
-            print(f"{Colors.HEADER}                      STRATEGY SUMMARY{Colors.RESET}")
-            print(f"{Colors.HEADER}{'='*80}{Colors.RESET}\n")
+            # Buffer the per-position block and emit it with one write
+            lines = []
+            lines.append(f"\n{Colors.HEADER}{'='*80}{Colors.RESET}")
+            lines.append(f"{Colors.HEADER}                      STRATEGY SUMMARY{Colors.RESET}")
+            lines.append(f"{Colors.HEADER}{'='*80}{Colors.RESET}\n")
 
-            print(f"{Colors.INFO}HOLDING STRATEGY ANALYSIS:{Colors.RESET}\n")
+            lines.append(f"{Colors.INFO}HOLDING STRATEGY ANALYSIS:{Colors.RESET}\n")
+
+            # One journal query for every position instead of one per row
+            strategy_map = self.trade_journal.get_position_strategies(
+                [self._extract_underlying(p.symbol) for p in positions]
+            )
 
             for i, pos in enumerate(positions, 1):
                 symbol = pos.symbol
@@ -715,7 +1315,7 @@ class OptionsBot:
                 underlying = self._extract_underlying(symbol)
 
                 # Get strategy info from database (check trade journal first, then wheel positions)
-                strategy_info = self.trade_journal.get_position_strategy(underlying)
+                strategy_info = strategy_map.get(underlying)
 
                 # If not found in trade journal, check if it's a Wheel position
                 if not strategy_info:
@@ -741,20 +1341,22 @@ class OptionsBot:
                         underlying, strategy, current_price, avg_entry, unrealized_plpct, grok_notes
                     )
 
-                    print(f"{Colors.DIM}{i:2d}. {underlying:6s} | {strategy:18s} | P&L: {unrealized_plpct:+6.2%}{Colors.RESET}")
-                    print(f"      Strategy Context: {entry_reason}")
+                    lines.append(f"{Colors.DIM}{i:2d}. {underlying:6s} | {strategy:18s} | P&L: {unrealized_plpct:+6.2%}{Colors.RESET}")
+                    lines.append(f"      Strategy Context: {entry_reason}")
                     if grok_notes:
-                        print(f"      Recent Grok Analysis: {grok_notes}")
-                    print(f"      {hold_rationale}")
-                    print()
+                        lines.append(f"      Recent Grok Analysis: {grok_notes}")
+                    lines.append(f"      {hold_rationale}")
+                    lines.append("")
 
                 else:
-                    print(f"{Colors.WARNING}{i:2d}. {underlying:6s} | NO STRATEGY INFO | P&L: {unrealized_plpct:+.1%}{Colors.RESET}")
-                    print(f"      WARNING: No strategy information found for this position{Colors.RESET}")
-                    print(f"      RECOMMENDATION: Manual review required{Colors.RESET}\n")
+                    lines.append(f"{Colors.WARNING}{i:2d}. {underlying:6s} | NO STRATEGY INFO | P&L: {unrealized_plpct:+.1%}{Colors.RESET}")
+                    lines.append(f"      WARNING: No strategy information found for this position{Colors.RESET}")
+                    lines.append(f"      RECOMMENDATION: Manual review required{Colors.RESET}\n")
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
             # Overall portfolio strategy assessment
-            self._display_overall_strategy_assessment(positions)
+            self._display_overall_strategy_assessment(positions, strategy_map)
 
             print(f"{Colors.HEADER}{'='*80}{Colors.RESET}\n")
 
@@ -779,32 +1381,28 @@ class OptionsBot:
             rationale_parts.append("Significant loss - should have been stopped out")
 
         # Check if recent Grok assessment supports holding
-        grok_hold_signals = [
-            "hold", "monitor", "wait", "long-term", "positioning",
-            "potential", "set-up", "developing", "patience"
-        ]
-
         if grok_notes:
-            grok_lower = grok_notes.lower()
-            if any(signal in grok_lower for signal in grok_hold_signals):
+            if _HOLD_RE.search(grok_notes):
                 rationale_parts.append("AI analysis supports holding")
-            elif "exit" in grok_lower or "sell" in grok_lower:
+            elif _EXIT_RE.search(grok_notes):
                 rationale_parts.append("AI recently suggested potential exit")
 
         # Strategy-specific considerations
-        strategy_lower = strategy.lower()
-        if "long" in strategy_lower:
-            rationale_parts.append("Directional bet needs time to work")
-        elif "spread" in strategy_lower or "straddle" in strategy_lower:
-            rationale_parts.append("Complex strategy may benefit from time decay or volatility change")
-        elif "bull" in strategy_lower or "bear" in strategy_lower:
-            rationale_parts.append("Momentum strategy - market may turn favorable")
+        for pattern, note in _STRATEGY_RATIONALE:
+            if pattern.search(strategy):
+                rationale_parts.append(note)
+                break
 
         return " | ".join(rationale_parts)
 
-    def _display_overall_strategy_assessment(self, positions: List):
+    def _display_overall_strategy_assessment(self, positions: List, strategy_map: Optional[Dict[str, Dict]] = None):
         """Provide overall assessment of portfolio strategy"""
         try:
+            if strategy_map is None:
+                strategy_map = self.trade_journal.get_position_strategies(
+                    [self._extract_underlying(p.symbol) for p in positions]
+                )
+
             print(f"{Colors.INFO}PORTFOLIO STRATEGY ASSESSMENT:{Colors.RESET}")
 
             total_value = sum(float(pos.market_value) if pos.market_value else 0 for pos in positions)
@@ -813,8 +1411,7 @@ class OptionsBot:
             # Count strategies
             strategy_counts = {}
             for pos in positions:
-                underlying = self._extract_underlying(pos.symbol)
-                strategy_info = self.trade_journal.get_position_strategy(underlying)
+                strategy_info = strategy_map.get(self._extract_underlying(pos.symbol))
                 if strategy_info:
                     strategy = strategy_info.get('strategy', 'UNKNOWN')
                     strategy_counts[strategy] = strategy_counts.get(strategy, 0) + 1
@@ -833,16 +1430,21 @@ class OptionsBot:
         except Exception as e:
             logging.error(f"Error in overall strategy assessment: {e}")
 
-    def refresh_candidate_data(self, candidate: Dict) -> Optional[Dict]:
+    def refresh_candidate_data(self, candidate: Dict, stock_data: Optional[Dict] = None) -> Optional[Dict]:
         """
         Refresh real-time data for a candidate immediately before Grok analysis.
         CRITICAL: Stock prices change rapidly - always get fresh data for Grok.
+
+        Args:
+            candidate: Candidate dict to refresh in place
+            stock_data: Quote already fetched for this symbol in a batch prefetch (fetched here if None)
         """
         symbol = candidate['symbol']
 
         try:
             # Get fresh stock quote
-            stock_data = self.openbb.get_quote(symbol)
+            if stock_data is None:
+                stock_data = self.openbb.get_quote(symbol)
 
             # Debug: Log what we received
             if stock_data is None:
@@ -912,7 +1514,7 @@ class OptionsBot:
                 final_score *= 1.5
 
             # Boost for high IV rank (selling premium opportunity)
-            iv_rank = analysis.get('iv_metrics', {}).get('iv_rank', 50)
+            iv_rank = analysis.get('iv_metrics', _EMPTY).get('iv_rank', 50)
             if iv_rank > 80:
                 final_score *= 1.3
 
@@ -932,8 +1534,8 @@ class OptionsBot:
             return None
         except Exception as e:
             logging.error(f"Error refreshing data for {symbol}: {type(e).__name__}: {e}")
-            import traceback
-            logging.debug(f"Traceback for {symbol}: {traceback.format_exc()}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Traceback for %s: %s", symbol, traceback.format_exc())
             return None
 
     def update_rolling_top_50(self, new_candidates: List[Dict]):
@@ -941,15 +1543,11 @@ class OptionsBot:
         Update rolling top-50 list with new candidates from continuous OpenBB scanning.
         Maintains the 50 highest-scoring candidates.
         """
-        # Combine existing and new candidates
-        all_candidates = self.rolling_top_50 + new_candidates
-
-        # Sort by final_score descending
-        all_candidates.sort(key=lambda x: x.get('final_score', 0), reverse=True)
-
-        # Keep top 50
+        # Keep top 50 by final_score from existing + new candidates (heap select, no full sort)
         old_top_50 = set(c['symbol'] for c in self.rolling_top_50)
-        self.rolling_top_50 = all_candidates[:50]
+        self.rolling_top_50 = heapq.nlargest(
+            50, self.rolling_top_50 + new_candidates, key=lambda x: x.get('final_score', 0)
+        )
         new_top_50 = set(c['symbol'] for c in self.rolling_top_50)
 
         # Find new symbols that made it to top 50
@@ -966,15 +1564,11 @@ class OptionsBot:
         Update rolling top-25 list with new Grok-analyzed candidates.
         Maintains the 25 highest Grok-confidence candidates.
         """
-        # Combine existing and new candidates
-        all_candidates = self.rolling_top_25 + grok_analyzed
-
-        # Sort by grok_confidence descending
-        all_candidates.sort(key=lambda x: x.get('grok_confidence', 0), reverse=True)
-
-        # Keep top 25
+        # Keep top 25 by grok_confidence from existing + new candidates (heap select, no full sort)
         old_top_25_symbols = set(c['symbol'] for c in self.rolling_top_25)
-        self.rolling_top_25 = all_candidates[:25]
+        self.rolling_top_25 = heapq.nlargest(
+            25, self.rolling_top_25 + grok_analyzed, key=lambda x: x.get('grok_confidence', 0)
+        )
         new_top_25_symbols = set(c['symbol'] for c in self.rolling_top_25)
 
         # Log changes
@@ -995,77 +1589,62 @@ class OptionsBot:
         if len(candidates) <= target_count:
             return candidates
 
+        # Fast path: only a few over target - trim by existing final_score, skip multi-factor scoring
+        if len(candidates) - target_count <= max(3, target_count // 10):
+            logging.debug("TIER 3.1: Quality gate fast path - trimming %d → %d by final_score",
+                          len(candidates), target_count)
+            # Same source-diversity cap as the full path, so output does not depend on slate size
+            return self._apply_correlation_filter(
+                heapq.nlargest(target_count, candidates, key=lambda c: c.get('final_score', 0)))
+
         print(f"{Colors.INFO}[QUALITY GATE] Filtering {len(candidates)} → {target_count} candidates for Grok...{Colors.RESET}")
 
-        # Quality score each candidate
-        for candidate in candidates:
-            quality_score = 0
-            analysis = candidate.get('analysis', {})
-            stock_data = candidate.get('stock_data', {})
-
-            # Factor 1: Spread quality (weight: 30 points)
-            spread_pct = analysis.get('avg_spread_pct', 1.0)
-            if spread_pct < 0.05:
-                quality_score += 30  # Excellent spread
-            elif spread_pct < 0.10:
-                quality_score += 20  # Good spread
-            elif spread_pct < 0.15:
-                quality_score += 10  # Acceptable spread
-            # >15% spread gets 0 points
-
-            # Factor 2: Liquidity (weight: 25 points)
-            total_volume = analysis.get('total_volume', 0)
-            total_oi = analysis.get('total_oi', 0)
-            if total_volume > 50000 and total_oi > 100000:
-                quality_score += 25  # Excellent liquidity
-            elif total_volume > 20000 and total_oi > 50000:
-                quality_score += 18  # Good liquidity
-            elif total_volume > 10000 and total_oi > 25000:
-                quality_score += 10  # Acceptable liquidity
-
-            # Factor 3: Signal strength (weight: 20 points)
-            signals = analysis.get('signals', [])
-            num_signals = len(signals)
-            if num_signals >= 4:
-                quality_score += 20
-            elif num_signals >= 3:
-                quality_score += 15
-            elif num_signals >= 2:
-                quality_score += 10
-
-            # Factor 4: IV rank extremes (weight: 15 points)
-            iv_rank = analysis.get('iv_metrics', {}).get('iv_rank', 50)
-            if iv_rank > 80 or iv_rank < 20:
-                quality_score += 15  # Extreme IV = good for options
-            elif iv_rank > 70 or iv_rank < 30:
-                quality_score += 10  # Moderate extreme
-
-            # Factor 5: Data freshness (weight: 10 points)
-            import time
-            data_timestamp = candidate.get('data_timestamp', 0)
-            if data_timestamp > 0:
-                age_minutes = (time.time() - data_timestamp) / 60
-                if age_minutes < 5:
-                    quality_score += 10
-                elif age_minutes < 10:
-                    quality_score += 7
-                elif age_minutes < 15:
-                    quality_score += 4
-
-            # PENALTY: Red flags
-            # Wide spread penalty
-            if spread_pct > 0.20:
-                quality_score -= 20
-
-            # Stale data penalty
-            if data_timestamp > 0 and (time.time() - data_timestamp) / 60 > 20:
-                quality_score -= 15
-
-            # Store quality score
+        # Quality score all candidates at once (one row of raw factors per candidate)
+        now = time.time()
+        factors = np.array([
+            (
+                analysis.get('avg_spread_pct', 1.0),
+                analysis.get('total_volume', 0),
+                analysis.get('total_oi', 0),
+                len(analysis.get('signals', ())),
+                analysis.get('iv_metrics', _EMPTY).get('iv_rank', 50),
+                c.get('data_timestamp', 0),
+            )
+            for c in candidates
+            for analysis in (c.get('analysis', _EMPTY),)
+        ], dtype=float)
+        spread_pct, total_volume, total_oi, num_signals, iv_rank, data_timestamp = factors.T
+
+        # Each factor is one bucket lookup: searchsorted into its threshold table, then index its score table
+        # Factor 1: Spread quality (weight: 30 points, >15% spread gets 0 points)
+        quality_scores = _SPREAD_SCORE[np.searchsorted(_SPREAD_THRESH, spread_pct, side='right')]
+
+        # Factor 2: Liquidity (weight: 25 points) - tier is the lower of the volume and OI tiers
+        liquidity_tier = np.minimum(np.searchsorted(_VOLUME_THRESH, total_volume, side='left'),
+                                    np.searchsorted(_OI_THRESH, total_oi, side='left'))
+        quality_scores += _LIQUIDITY_SCORE[liquidity_tier]
+
+        # Factor 3: Signal strength (weight: 20 points)
+        quality_scores += _SIGNAL_SCORE[np.searchsorted(_SIGNAL_THRESH, num_signals, side='right')]
+
+        # Factor 4: IV rank extremes (weight: 15 points) - distance from 50 (>30 = extreme, >20 = moderate)
+        quality_scores += _IV_EXTREME_SCORE[np.searchsorted(_IV_EXTREME_THRESH, np.abs(iv_rank - 50), side='left')]
+
+        # Factor 5: Data freshness (weight: 10 points)
+        has_timestamp = data_timestamp > 0
+        age_minutes = (now - data_timestamp) / 60
+        quality_scores += np.where(has_timestamp,
+                                   _FRESHNESS_SCORE[np.searchsorted(_FRESHNESS_THRESH, age_minutes, side='right')], 0)
+
+        # PENALTY: Red flags (wide spread, stale data)
+        quality_scores -= np.where(spread_pct > 0.20, 20, 0)
+        quality_scores -= np.where(has_timestamp & (age_minutes > 20), 15, 0)
+
+        # Store quality score and rank (stable, so ties keep scan order)
+        for candidate, quality_score in zip(candidates, quality_scores.tolist()):
             candidate['quality_score'] = quality_score
-
-        # Sort by quality score
-        candidates.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
+        order = np.argsort(-quality_scores, kind='stable')
+        candidates = [candidates[i] for i in order]
 
         # Take top N by quality
         filtered = candidates[:target_count]
@@ -1103,31 +1682,19 @@ class OptionsBot:
         # Limit same source to avoid over-concentration from single discovery method
 
         filtered = []
-        source_counts = {}
+        source_counts = Counter()
 
         for candidate in candidates:
-            symbol = candidate['symbol']
-            stock_data = candidate.get('stock_data', {})
-            source = stock_data.get('source', '')
-
-            # Track source diversity
-            should_include = True
-
-            # Rule: Limit same source (max 5 from same single source)
-            if source:
-                # Get primary source (first in comma-separated list)
-                primary_source = source.split(',')[0]
-                source_count = source_counts.get(primary_source, 0)
-                if source_count >= 5:
-                    logging.debug(f"TIER 3.3: Skipping {symbol} - source {primary_source} already has {source_count} stocks")
-                    should_include = False
-
-            if should_include:
-                filtered.append(candidate)
-                # Update counts
-                if source:
-                    primary_source = source.split(',')[0]
-                    source_counts[primary_source] = source_counts.get(primary_source, 0) + 1
+            # Rule: Limit same source (max 5 from same single primary source)
+            primary_source = _primary_source(candidate.get('stock_data', _EMPTY).get('source', ''))
+            if primary_source:
+                if source_counts[primary_source] >= 5:
+                    logging.debug("TIER 3.3: Skipping %s - source %s already has %d stocks",
+                                  candidate['symbol'], primary_source, source_counts[primary_source])
+                    continue
+                source_counts[primary_source] += 1
+
+            filtered.append(candidate)
 
         removed_count = len(candidates) - len(filtered)
         if removed_count > 0:
@@ -1163,6 +1730,27 @@ class OptionsBot:
 
         return None
 
+    def _refresh_candidates(self, candidates: List[Dict], quotes: Dict[str, Optional[Dict]],
+                            max_workers: int = 10) -> List[Dict]:
+        """Refresh candidates concurrently (at most max_workers in flight), keeping input order"""
+        if not candidates:
+            return []
+
+        refreshed_candidates = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(candidates))) as executor:
+            futures = [
+                executor.submit(self.refresh_candidate_data, c, quotes.get(c['symbol']))
+                for c in candidates
+            ]
+            for candidate, future in zip(candidates, futures):
+                refreshed = future.result()
+                if refreshed:
+                    refreshed_candidates.append(refreshed)
+                else:
+                    logging.warning(f"Could not refresh data for {candidate['symbol']}, excluding from Grok analysis")
+
+        return refreshed_candidates
+
     def analyze_batch_with_grok(self, candidates: List[Dict], refresh_data: bool = True) -> List[Dict]:
         """
         Optimized Grok analysis - batch candidates into single request
@@ -1175,16 +1763,9 @@ class OptionsBot:
         # CRITICAL: Refresh real-time data for all candidates before Grok analysis
         if refresh_data:
             print(f"{Colors.INFO}[DATA REFRESH] Updating real-time data for {len(candidates)} candidates...{Colors.RESET}")
-            refreshed_candidates = []
-            for candidate in candidates:
-                refreshed = self.refresh_candidate_data(candidate)
-                if refreshed:
-                    refreshed_candidates.append(refreshed)
-                else:
-                    logging.warning(f"Could not refresh data for {candidate['symbol']}, excluding from Grok analysis")
-                time.sleep(0.1)  # Rate limit
-
-            candidates = refreshed_candidates
+            # Fetch all quotes in one concurrent batch before the per-candidate refresh
+            quotes = self._fetch_quotes(c['symbol'] for c in candidates)
+            candidates = self._refresh_candidates(candidates, quotes)
 
         if not candidates:
             print(f"{Colors.WARNING}No candidates with valid real-time data for Grok analysis{Colors.RESET}")
@@ -1195,118 +1776,52 @@ class OptionsBot:
         # Batch candidates (10 per request to avoid token limits)
         batch_size = 10
         rated_candidates = []
+        batches = [candidates[i:i+batch_size] for i in range(0, len(candidates), batch_size)]
 
-        for i in range(0, len(candidates), batch_size):
-            batch = candidates[i:i+batch_size]
-
-            print(f"{Colors.DIM}  Batch {i//batch_size + 1}/{(len(candidates)-1)//batch_size + 1}: Analyzing {len(batch)} symbols...{Colors.RESET}", end='', flush=True)
+        # Build every prompt up front, then send all batches concurrently (aiohttp + asyncio.gather)
+        batches, prompts = self._build_batch_prompts(batches)
+        loop = asyncio.new_event_loop()
+        try:
+            replies = loop.run_until_complete(self._rate_batches_async(batches, prompts))
+        finally:
+            loop.close()
 
-            # Build batch prompt
-            prompt = self._build_batch_prompt(batch)
+        # Handle results in batch order
+        for n, (batch, reply) in enumerate(zip(batches, replies), 1):
+            print(f"{Colors.DIM}  Batch {n}/{len(batches)}: Analyzing {len(batch)} symbols...{Colors.RESET}", end='', flush=True)
 
             try:
-                headers = {'Authorization': f'Bearer {config.XAI_API_KEY}', 'Content-Type': 'application/json'}
-                payload = {
-                    'model': 'grok-4-fast',
-                    'messages': [{'role': 'user', 'content': prompt}],
-                    'max_tokens': 2000,
-                    'temperature': 0.7
-                }
-
-                # Log the prompt
-                self.grok_logger.info(f"=== BATCH GROK PROMPT ===")
-                self.grok_logger.info(f"Candidates: {[c['symbol'] for c in batch]}")
-                self.grok_logger.info(f"Prompt:\n{prompt}")
-                self.grok_logger.info(f"Model: grok-4-fast | Max Tokens: 1000 | Temperature: 0.7")
-
-                # Enhanced retry logic for Grok API calls
-                max_attempts = 3
-                base_delay = 1.0
-
-                for attempt in range(max_attempts):
-                    try:
-                        # Increased timeout for grok-4-fast model which may take longer
-                        response = requests.post(config.XAI_BASE_URL, json=payload, headers=headers, timeout=180)
-
-                        # Log the full response regardless of success
-                        self.grok_logger.info(f"=== BATCH GROK RESPONSE (Attempt {attempt+1}/{max_attempts}) ===")
-                        self.grok_logger.info(f"Status Code: {response.status_code}")
-
-                        if response.status_code == 200:
-                            full_response = response.json()
-                            self.grok_logger.info(f"Full Response: {json.dumps(full_response, indent=2)}")
-                            break  # Success, exit retry loop
-                        else:
-                            self.grok_logger.info(f"Error Response: {response.text}")
-
-                            # Check for rate limiting or temporary errors that might respond to retries
-                            if response.status_code in [429, 502, 503, 504] and attempt < max_attempts - 1:
-                                delay = base_delay * (2 ** attempt)
-                                self.grok_logger.info(f"Retrying in {delay}s due to status {response.status_code}...")
-                                time.sleep(delay)
-                                continue
-                            else:
-                                # Non-retryable error or last attempt
-                                break
-
-                    except requests.exceptions.Timeout as e:
-                        self.grok_logger.warning(f"Grok API timeout (attempt {attempt+1}/{max_attempts}): {e}")
-                        if attempt < max_attempts - 1:
-                            delay = base_delay * (2 ** attempt)
-                            self.grok_logger.info(f"Retrying timeout in {delay}s...")
-                            time.sleep(delay)
-                            continue
-                        else:
-                            response = None
-
-                    except requests.exceptions.ConnectionError as e:
-                        self.grok_logger.warning(f"Grok API connection error (attempt {attempt+1}/{max_attempts}): {e}")
-                        if attempt < max_attempts - 1:
-                            delay = base_delay * (2 ** attempt)
-                            self.grok_logger.info(f"Retrying connection error in {delay}s...")
-                            time.sleep(delay)
-                            continue
-                        else:
-                            response = None
-
-                    except Exception as e:
-                        self.grok_logger.error(f"Unexpected error in Grok API call (attempt {attempt+1}/{max_attempts}): {e}")
-                        if attempt < max_attempts - 1:
-                            delay = base_delay * (2 ** attempt)
-                            time.sleep(delay)
-                            continue
-                        else:
-                            response = None
-                            break
+                if isinstance(reply, Exception):
+                    raise reply
+                status, body, parsed = reply
 
                 # Check if we got a successful response
-                if response and response.status_code == 200:
-                    content = response.json()['choices'][0]['message']['content']
-
-                    # Parse batch response
-                    parsed = self._parse_batch_response(content, batch)
+                if status == 200:
+                    # Streamed replies were parsed line by line as they arrived; cached ones are parsed here
+                    if parsed is None:
+                        parsed = self._parse_batch_response(body, batch)
                     rated_candidates.extend(parsed)
                     print(f" ✓")
                 else:
                     # IMPROVED ERROR REPORTING
-                    error_code = response.status_code if response else "No Response"
-                    error_msg = response.text[:200] if response else "Connection failed"
+                    error_code = status if status is not None else "No Response"
+                    error_msg = body[:200] if status is not None else "Connection failed"
                     print(f" ✗ (HTTP {error_code})")
                     print(f"{Colors.ERROR}[GROK ERROR] Failed to analyze batch: {error_msg[:100]}{Colors.RESET}")
                     logging.error(f"Grok API failed: Status={error_code}, Response={error_msg}")
                     self.grok_logger.error(f"Grok API call failed: Status={error_code}, Response={error_msg}")
 
                     # Check for common issues
-                    if response:
-                        if response.status_code == 401:
+                    if status is not None:
+                        if status == 401:
                             print(f"{Colors.ERROR}[!] config.XAI_API_KEY is invalid or expired{Colors.RESET}")
                             self.grok_logger.error("config.XAI_API_KEY authentication failed - check API key")
-                        elif response.status_code == 429:
+                        elif status == 429:
                             print(f"{Colors.WARNING}[!] Grok API rate limit exceeded{Colors.RESET}")
                             self.grok_logger.warning("Grok API rate limit hit")
-                        elif response.status_code >= 500:
+                        elif status >= 500:
                             print(f"{Colors.WARNING}[!] Grok API server error (temporary){Colors.RESET}")
-                            self.grok_logger.warning(f"Grok API server error: {response.status_code}")
+                            self.grok_logger.warning(f"Grok API server error: {status}")
                     else:
                         print(f"{Colors.ERROR}[!] No response from Grok API - check network/firewall{Colors.RESET}")
                         self.grok_logger.error("No response from Grok API - connection failed")
@@ -1315,6 +1830,7 @@ class OptionsBot:
                     for candidate in batch:
                         candidate['grok_confidence'] = 0
                         candidate['strategy'] = 'UNKNOWN'
+                        candidate.pop('strategy_class', None)  # Drop any classification from an earlier rating
                         rated_candidates.append(candidate)
 
             except Exception as e:
@@ -1326,115 +1842,384 @@ class OptionsBot:
                 for candidate in batch:
                     candidate['grok_confidence'] = 0
                     candidate['strategy'] = 'UNKNOWN'
+                    candidate.pop('strategy_class', None)  # Drop any classification from an earlier rating
                     rated_candidates.append(candidate)
 
-            time.sleep(0.5)  # Rate limiting between batches
-
         print(f"{Colors.SUCCESS}Grok analysis complete{Colors.RESET}\n")
         return rated_candidates
 
-    def _create_concise_reason(self, reason: str, max_length: int = 35) -> str:
-        """Create concise, meaningful summary from Grok reason - UI IMPROVEMENT"""
-        if not reason:
-            return "No analysis"
+    async def _rate_batches_async(self, batches: List[List[Dict]], prompts: List[str],
+                                  concurrency: int = 4) -> List:
+        """
+        Send every batch prompt to Grok over one aiohttp session, at most `concurrency` in flight.
 
-        # Remove common filler words for conciseness
-        filler_words = {'the', 'a', 'an', 'is', 'are', 'and', 'or', 'with', 'for', 'to', 'of', 'in',
-                       'that', 'this', 'be', 'has', 'have', 'from', 'at', 'by', 'on', 'as'}
+        Returns one (status, body, parsed) per batch in batch order - see _post_grok_batch_async.
+        An unexpected exception is returned in that batch's slot instead.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        timeout = aiohttp.ClientTimeout(total=180)  # grok-4-fast may take a while
+        # Keep-alive pool sized to the concurrency so batches reuse the same TLS connections
+        connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60)
+
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            async def one(batch: List[Dict], prompt: str):
+                async with semaphore:
+                    return await self._post_grok_batch_async(session, batch, prompt)
+
+            return await asyncio.gather(
+                *[one(batch, prompt) for batch, prompt in zip(batches, prompts)],
+                return_exceptions=True
+            )
 
-        # Extract key phrases and signals
-        keywords = []
-        words = reason.split()
+    async def _sleep_backoff(self, prev: float, reason: str, base: float = 1.0, cap: float = 30.0) -> float:
+        """Sleep a decorrelated-jitter backoff (uniform in [base, 3*prev], capped) and return it for the next retry"""
+        delay = min(cap, random.uniform(base, prev * 3))
+        self.grok_logger.info(f"Retrying {reason} in {delay:.1f}s...")
+        await asyncio.sleep(delay)
+        return delay
 
-        for word in words:
-            cleaned = word.strip('.,;:').lower()
-            # Keep important words (not filler) and percentage numbers
-            if cleaned not in filler_words or '%' in word or word.isupper():
-                keywords.append(word)
+    async def _post_grok_batch_async(self, session: aiohttp.ClientSession, batch: List[Dict],
+                                     prompt: str) -> Tuple[Optional[int], str, Optional[List[Dict]]]:
+        """
+        POST one batch prompt to Grok with retries; returns (status, body, parsed), status None if no response.
 
-            # Stop when we have enough content
-            if len(' '.join(keywords)) >= max_length - 3:
+        The completion is streamed (SSE), so on success body is the assembled message content
+        rather than the raw JSON response, and parsed holds the batch already rated from the
+        reply lines as they arrived (None for a cache hit or a failed call).
+        """
+        cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cached_body = self.grok_response_cache.get(cache_key)
+        if cached_body is not None:
+            self.grok_logger.info(f"=== BATCH GROK CACHE HIT === Candidates: {[c['symbol'] for c in batch]}")
+            return 200, cached_body, None
+
+        headers = {'Authorization': f'Bearer {config.XAI_API_KEY}', 'Content-Type': 'application/json'}
+        payload = {
+            'model': 'grok-4-fast',
+            'messages': [{'role': 'user', 'content': prompt}],
+            'max_tokens': _GROK_MAX_COMPLETION_TOKENS,
+            'temperature': 0.7,
+            'stream': True
+        }
+        # Encode once (compact) - every retry attempt re-sends the same bytes
+        request_body = json.dumps(payload, separators=(',', ':')).encode()
+
+        # Log the prompt (skip building the multi-KB records when INFO is filtered out)
+        log = self.grok_logger
+        if log.isEnabledFor(logging.INFO):
+            log.info("=== BATCH GROK PROMPT ===")
+            log.info("Candidates: %s", [c['symbol'] for c in batch])
+            log.info("Prompt:\n%s", prompt)
+            log.info("Model: grok-4-fast | Max Tokens: %d | Temperature: 0.7", _GROK_MAX_COMPLETION_TOKENS)
+
+        # Enhanced retry logic for Grok API calls
+        max_attempts = 3
+        backoff = 1.0  # Previous retry delay - seeds the decorrelated jitter
+        status, body = None, ""
+        batch_lookup = {c['symbol']: c for c in batch}
+
+        for attempt in range(max_attempts):
+            try:
+                await self._grok_limiter.acquire()  # Rate limiting - only waits when bursting past 2 req/s
+                async with session.post(config.XAI_BASE_URL, data=request_body, headers=headers) as response:
+                    status = response.status
+                    if status == 200:
+                        rated = {}  # A retried stream starts over
+                        body = await self._read_grok_stream(
+                            response, lambda line: self._rate_batch_line(line, batch_lookup, rated)
+                        )
+                    else:
+                        body = await response.text()
+
+                # Log the full response regardless of success
+                log.info("=== BATCH GROK RESPONSE (Attempt %d/%d) ===", attempt + 1, max_attempts)
+                log.info("Status Code: %s", status)
+
+                if status == 200:
+                    log.info("Full Response:\n%s", body)
+                    break  # Success, exit retry loop
+                else:
+                    log.info("Error Response: %s", body)
+
+                    # Check for rate limiting or temporary errors that might respond to retries
+                    if status in _RETRY_STATUSES and attempt < max_attempts - 1:
+                        backoff = await self._sleep_backoff(backoff, f"due to status {status}")
+                        continue
+                    else:
+                        # Non-retryable error or last attempt
+                        break
+
+            except Exception as e:
+                # Transient network errors log as warnings; anything else is unexpected but still retried
+                kind = next((label for exc_type, label in _GROK_TRANSIENT_ERRORS if isinstance(e, exc_type)), None)
+                if kind:
+                    self.grok_logger.warning(f"Grok API {kind} (attempt {attempt+1}/{max_attempts}): {e}")
+                else:
+                    kind = "unexpected error"
+                    self.grok_logger.error(f"Unexpected error in Grok API call (attempt {attempt+1}/{max_attempts}): {e}")
+
+                status, body = None, ""
+                if attempt < max_attempts - 1:
+                    backoff = await self._sleep_backoff(backoff, kind)
+
+        if status != 200:
+            return status, body, None
+        self.grok_response_cache.set(cache_key, body)
+        return status, body, self._finish_batch_ratings(rated, batch_lookup)
+
+    async def _read_grok_stream(self, response: aiohttp.ClientResponse,
+                                on_line: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Assemble the message content from a streamed (SSE) Grok completion as chunks arrive.
+
+        If on_line is given it is called with each complete line of the content as soon as
+        its newline arrives, so the reply is parsed while the rest is still downloading.
+        """
+        chunks = []
+        pending = ''
+        async for raw_line in response.content:
+            line = raw_line.strip()
+            if not line.startswith(b'data:'):
+                continue  # Blank separators and SSE comments/keep-alives
+            data = line[5:].strip()
+            if data == b'[DONE]':
                 break
+            choices = json.loads(data).get('choices') or [{}]
+            delta = choices[0].get('delta', _EMPTY).get('content')
+            if delta:
+                chunks.append(delta)
+                if on_line is not None:
+                    pending += delta
+                    if '\n' in pending:
+                        *complete, pending = pending.split('\n')
+                        for content_line in complete:
+                            on_line(content_line)
+        if on_line is not None and pending:
+            on_line(pending)
+        return ''.join(chunks)
 
-        # Join keywords
-        concise = ' '.join(keywords)
+    def _create_concise_reason(self, reason: str, max_length: int = 35) -> str:
+        """Create concise, meaningful summary from Grok reason - UI IMPROVEMENT"""
+        if not reason:
+            return "No analysis"
 
-        # Intelligently truncate at word boundary if still too long
-        if len(concise) > max_length:
-            concise = concise[:max_length].rsplit(' ', 1)[0]
-            if len(concise) < max_length - 3:  # If truncation removed too much, add ellipsis
-                concise += '...'
+        return _shorten_reason(reason, max_length)
 
-        return concise if concise else "Analysis unavailable"
+    def _hv_trade_date(self) -> str:
+        """Today's date key for the HV cache, dropping previous days' entries when the day rolls over"""
+        trade_date = datetime.now().date().isoformat()
+        if trade_date != self._hv_cache_date:
+            self._hv_cache.clear()
+            self._hv_cache_date = trade_date
+        return trade_date
 
     def _calculate_historical_volatility(self, symbol: str, days: int = 30) -> float:
         """Calculate realized historical volatility - PROMPT IMPROVEMENT 2.2"""
+        # Daily closes only change once per day - reuse today's value across batches, scans and restarts
+        trade_date = self._hv_trade_date()
+        cache_key = (symbol, days, trade_date)
+        if cache_key in self._hv_cache:
+            return self._hv_cache[cache_key]
+
+        stored_hv = self.trade_journal.get_cached_volatility(symbol, days, trade_date)
+        if stored_hv is not None:
+            self._hv_cache[cache_key] = stored_hv
+            return stored_hv
+
+        hv = self._fetch_historical_volatility(symbol, days)
+        if hv is None:
+            return 0
+        self._hv_cache[cache_key] = hv
+        self.trade_journal.save_volatility(symbol, days, trade_date, hv)
+        return hv
+
+    def _prefetch_hv(self, symbols: List[str], days: int = 30) -> Dict[str, float]:
+        """
+        Historical volatility for many symbols, fetching the uncached ones concurrently.
+
+        Price history downloads run in a thread pool (I/O bound); cache and journal
+        reads/writes stay on the calling thread. Returns symbol -> HV (0 if unavailable).
+        """
+        trade_date = self._hv_trade_date()
+        hv_map, missing = {}, []
+        for symbol in dict.fromkeys(symbols):
+            cache_key = (symbol, days, trade_date)
+            if cache_key not in self._hv_cache:
+                stored_hv = self.trade_journal.get_cached_volatility(symbol, days, trade_date)
+                if stored_hv is None:
+                    missing.append(symbol)
+                    continue
+                self._hv_cache[cache_key] = stored_hv
+            hv_map[symbol] = self._hv_cache[cache_key]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                fetched = list(executor.map(lambda s: self._fetch_historical_volatility(s, days), missing))
+            for symbol, hv in zip(missing, fetched):
+                if hv is None:
+                    hv_map[symbol] = 0
+                    continue
+                self._hv_cache[(symbol, days, trade_date)] = hv
+                self.trade_journal.save_volatility(symbol, days, trade_date, hv)
+                hv_map[symbol] = hv
+        return hv_map
+
+    def _fetch_historical_volatility(self, symbol: str, days: int) -> Optional[float]:
+        """Download daily closes and compute annualized realized volatility; None if unavailable"""
         try:
             hist_data = self.openbb.get_historical_price(symbol, days=days)
             if not hist_data or 'results' not in hist_data:
-                return 0
+                return None
 
-            prices = [p.get('close', 0) for p in hist_data['results'] if p.get('close')]
+            prices = np.asarray([p.get('close', 0) for p in hist_data['results'] if p.get('close')], dtype=np.float64)
             if len(prices) < 20:
-                return 0
+                return None
 
-            # Calculate daily returns
-            returns = [(prices[i] - prices[i-1]) / prices[i-1] for i in range(1, len(prices)) if prices[i-1] > 0]
+            # Calculate daily returns (skip any non-positive previous close)
+            prev = prices[:-1]
+            valid = prev > 0
+            returns = np.diff(prices)[valid] / prev[valid]
 
             if len(returns) < 15:
-                return 0
+                return None
 
             # Annualized volatility
-            import math
-            import statistics
-            hv = statistics.stdev(returns) * math.sqrt(252)
-            return hv
+            return float(returns.std(ddof=1) * math.sqrt(252))
         except Exception as e:
             logging.debug(f"Error calculating HV for {symbol}: {e}")
-            return 0
+            return None
+
+    def _build_batch_prompts(self, batches: List[List[Dict]]) -> Tuple[List[List[Dict]], List[str]]:
+        """
+        Build prompts for batch Grok analysis with FULL portfolio context.
+
+        A batch whose estimated prompt (~4 chars/token) would not leave room for the
+        completion within config.GROK_PROMPT_TOKEN_BUDGET is split into smaller
+        sub-batches instead of being silently truncated by the model.
+
+        Returns (batches, prompts) - the possibly split batches and one prompt per batch.
+        """
+        prefix, exposure = self._build_prompt_prefix()
+        base_tokens = (len(prefix) + len(_BATCH_PROMPT_SUFFIX)) // 4
+        token_limit = config.GROK_PROMPT_TOKEN_BUDGET - _GROK_MAX_COMPLETION_TOKENS
+
+        out_batches, prompts = [], []
+        for batch in batches:
+            sub_batch, sub_blocks, tokens = [], [], base_tokens
+            for candidate, block in zip(batch, self._build_candidate_blocks(batch, exposure)):
+                cost = len(block) // 4
+                if sub_batch and tokens + cost > token_limit:
+                    out_batches.append(sub_batch)
+                    prompts.append(prefix + "".join(sub_blocks) + _BATCH_PROMPT_SUFFIX)
+                    sub_batch, sub_blocks, tokens = [], [], base_tokens
+                sub_batch.append(candidate)
+                sub_blocks.append(block)
+                tokens += cost
+            if sub_batch:
+                out_batches.append(sub_batch)
+                prompts.append(prefix + "".join(sub_blocks) + _BATCH_PROMPT_SUFFIX)
+
+        if len(out_batches) > len(batches):
+            logging.info(f"Split {len(batches)} Grok batches into {len(out_batches)} to fit the prompt token budget")
+        return out_batches, prompts
+
+    def _memo(self, key: str, fn, ttl: float = 60):
+        """Return fn() memoized under key for ttl seconds - for lookups that are constant within a scan cycle"""
+        cached = self._scan_cache.get(key)
+        now = time.monotonic()
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        value = fn()
+        self._scan_cache[key] = (now, value)
+        return value
+
+    def _get_positions_cached(self, ttl: float = 3.0):
+        """Alpaca positions, shared by the back-to-back candidate evaluations of one scan tick"""
+        return self._get_positions_indexed(ttl)[0]
+
+    def _get_positions_indexed(self, ttl: float = 3.0) -> Tuple[List, Dict[str, List]]:
+        """(positions, positions by underlying symbol), fetched and indexed once per scan tick"""
+        def fetch():
+            positions = self.trading_client.get_all_positions() or []
+            return positions, _index_by_underlying(positions)
+        return self._memo('broker_positions', fetch, ttl=ttl)
+
+    def _get_open_orders_indexed(self, ttl: float = 3.0) -> Tuple[List, Dict[str, List]]:
+        """(open Alpaca orders, open orders by underlying symbol), fetched and indexed once per scan tick"""
+        def fetch():
+            orders = self.trading_client.get_orders(filter=GetOrdersRequest(status=QueryOrderStatus.OPEN)) or []
+            return orders, _index_by_underlying(orders)
+        return self._memo('broker_open_orders', fetch, ttl=ttl)
+
+    def _get_account_cached(self, ttl: float = 5.0):
+        """Alpaca account, shared by the back-to-back candidate evaluations of one scan tick"""
+        return self._memo('broker_account', self.trading_client.get_account, ttl=ttl)
+
+    def _invalidate_broker_state(self):
+        """Drop the cached account/positions/orders after submitting or canceling orders"""
+        self._scan_cache.pop('broker_account', None)
+        self._scan_cache.pop('broker_positions', None)
+        self._scan_cache.pop('broker_open_orders', None)
+
+    def _build_prompt_prefix(self) -> Tuple[str, Dict]:
+        """
+        Build the portfolio/regime/rules header shared by every batch prompt.
+
+        Cached for 60s so the batches of one scan reuse a single set of account,
+        position, exposure and regime lookups, and rebuilt as soon as the portfolio
+        manager's exposure version changes. Returns (prefix, exposure).
+        """
+        version = self.portfolio_manager.exposure_version
+        cached = self._prompt_prefix_cache
+        if cached and time.monotonic() - cached[0] < 60 and cached[1] == version:
+            return cached[2], cached[3]
 
-    def _build_batch_prompt(self, batch: List[Dict]) -> str:
-        """Build prompt for batch Grok analysis with FULL portfolio context"""
-        prompt = """As an expert options trader, analyze these stocks for potential options trades.
+        exposure = {}
+        parts = ["""As an expert options trader, analyze these stocks for potential options trades.
 You have full visibility into our current portfolio to make sophisticated, risk-managed decisions.
 
 CURRENT PORTFOLIO OVERVIEW:
-"""
+"""]
 
         # Get market regime for enhanced prompt instructions
         try:
-            regime = self.regime_analyzer.analyze_market_regime()
+            regime = self._memo('regime', self.regime_analyzer.analyze_market_regime)
             regime_type = regime.get('regime', 'UNKNOWN')
             regime_implications = regime.get('implications', {})
             volatility_action = regime_implications.get('vol_play', 'neutral')
         except:
+            regime = {}
             regime_type = 'UNKNOWN'
             volatility_action = 'neutral'
 
         # Add comprehensive portfolio analysis
         try:
-            account = self.trading_client.get_account()
-            positions = self.trading_client.get_all_positions()
-            exposure = self.portfolio_manager.get_current_exposure()
+            account = self._get_account_cached()
+            positions, _ = self._get_positions_indexed()
+            exposure = self._get_exposure_snapshot()  # Same snapshot the trade validator reads
 
             # Account summary
             equity = float(account.equity) if account.equity is not None else 0.0
             cash = float(account.cash) if account.cash is not None else 0.0
             buying_power = float(account.buying_power) if account.buying_power is not None else 0.0
 
-            prompt += f"Portfolio Value: ${equity:,.0f} | Cash: ${cash:,.0f} | Buying Power: ${buying_power:,.0f}\n"
-            prompt += f"Positions: {len(positions)} | Portfolio Allocated: {exposure['total_allocated']:.1%}\n\n"
+            parts.append(f"Portfolio Value: ${equity:,.0f} | Cash: ${cash:,.0f} | Buying Power: ${buying_power:,.0f}\n")
+            parts.append(f"Positions: {len(positions)} | Portfolio Allocated: {exposure['total_allocated']:.1%}\n\n")
 
             # Risk metrics
             portfolio_greeks = exposure.get('portfolio_greeks', {})
-            prompt += f"PORTFOLIO GREEKS: Delta {portfolio_greeks.get('delta', 0):+.0f} | "
-            prompt += f"Gamma {portfolio_greeks.get('gamma', 0):+.2f} | "
-            prompt += f"Theta ${portfolio_greeks.get('theta', 0):+.0f}/day | "
-            prompt += f"Vega ${portfolio_greeks.get('vega', 0):+.0f}\n\n"
+            parts.append(f"PORTFOLIO GREEKS: Delta {portfolio_greeks.get('delta', 0):+.0f} | ")
+            parts.append(f"Gamma {portfolio_greeks.get('gamma', 0):+.2f} | ")
+            parts.append(f"Theta ${portfolio_greeks.get('theta', 0):+.0f}/day | ")
+            parts.append(f"Vega ${portfolio_greeks.get('vega', 0):+.0f}\n\n")
 
             # Current positions with P&L
             if positions:
-                prompt += "CURRENT POSITIONS:\n"
+                parts.append("CURRENT POSITIONS:\n")
+                # One journal query for every listed position's strategy
+                strategy_map = self.trade_journal.get_position_strategies(
+                    [extract_underlying_symbol(p.symbol) for p in positions[:8]]
+                )
                 for pos in positions[:8]:  # Limit to avoid token limits, show most recent
                     symbol = pos.symbol
                     qty = int(pos.qty) if pos.qty is not None else 0
@@ -1443,46 +2228,45 @@ CURRENT PORTFOLIO OVERVIEW:
                     pnl_pct = float(pos.unrealized_plpc) if pos.unrealized_plpc is not None else 0.0
 
                     # Get strategy info
-                    underlying = extract_underlying_symbol(symbol)
-                    strategy_info = self.trade_journal.get_position_strategy(underlying)
+                    strategy_info = strategy_map.get(extract_underlying_symbol(symbol))
 
                     strategy = strategy_info.get('strategy', 'UNKNOWN') if strategy_info else 'UNKNOWN'
                     strikes = strategy_info.get('strikes', '') if strategy_info else ''
 
-                    prompt += f"  {symbol}: {qty:+d} @ ${entry:.2f} → ${current:.2f} | P&L: {pnl_pct:+.1%} | {strategy} {strikes}\n"
+                    parts.append(f"  {symbol}: {qty:+d} @ ${entry:.2f} → ${current:.2f} | P&L: {pnl_pct:+.1%} | {strategy} {strikes}\n")
 
                 if len(positions) > 8:
-                    prompt += f"  ... and {len(positions)-8} more positions\n"
-                prompt += "\n"
+                    parts.append(f"  ... and {len(positions)-8} more positions\n")
+                parts.append("\n")
 
             # Symbol concentration
             symbol_exposure = exposure.get('by_symbol', {})
             if symbol_exposure:
-                prompt += "TOP SYMBOL EXPOSURE:\n"
-                top_symbols = sorted(symbol_exposure.items(), key=lambda x: x[1], reverse=True)[:5]
+                parts.append("TOP SYMBOL EXPOSURE:\n")
+                top_symbols = heapq.nlargest(5, symbol_exposure.items(), key=itemgetter(1))
                 for symbol, pct in top_symbols:
-                    prompt += f"  {symbol}: {pct:.1%}\n"
-                prompt += "\n"
+                    parts.append(f"  {symbol}: {pct:.1%}\n")
+                parts.append("\n")
 
             # Recent performance
-            stats = self.trade_journal.get_performance_stats(days=30)
+            stats = self._memo('stats30d', lambda: self.trade_journal.get_performance_stats(days=30))
             if stats.get('total_trades', 0) > 0:
-                prompt += f"RECENT PERFORMANCE (30 days):\n"
-                prompt += f"  Win Rate: {stats['win_rate']:.1%} | "
-                prompt += f"Avg Return: {stats['avg_return']:.1%} | "
-                prompt += f"Total P&L: ${stats['total_pnl']:,.0f}\n\n"
+                parts.append(f"RECENT PERFORMANCE (30 days):\n")
+                parts.append(f"  Win Rate: {stats['win_rate']:.1%} | ")
+                parts.append(f"Avg Return: {stats['avg_return']:.1%} | ")
+                parts.append(f"Total P&L: ${stats['total_pnl']:,.0f}\n\n")
 
         except Exception as e:
             logging.warning(f"Could not get portfolio overview for Grok prompt: {e}")
-            prompt += "[Portfolio data unavailable]\n\n"
+            parts.append("[Portfolio data unavailable]\n\n")
 
         # Market regime context with strategy implications
-        prompt += f"CURRENT MARKET REGIME: {regime_type}\n"
-        prompt += f"Description: {regime.get('description', 'N/A')}\n"
-        prompt += f"Volatility Play Action: {volatility_action}\n\n"
+        parts.append(f"CURRENT MARKET REGIME: {regime_type}\n")
+        parts.append(f"Description: {regime.get('description', 'N/A')}\n")
+        parts.append(f"Volatility Play Action: {volatility_action}\n\n")
 
         # PHASE 2: ADD CRITICAL TRADING RULES
-        prompt += """═══════════════════════════════════════════════════════════════════════
+        parts.append("""═══════════════════════════════════════════════════════════════════════
 CRITICAL TRADING RULES - MUST FOLLOW STRICTLY
 ═══════════════════════════════════════════════════════════════════════
 
@@ -1509,16 +2293,16 @@ CRITICAL TRADING RULES - MUST FOLLOW STRICTLY
    ✓  Need wide trading range or upcoming catalyst
    ✓  Consider Iron Butterfly if paper account allows
 
-⛔ IRON CONDOR: """
+⛔ IRON CONDOR: """)
 
         # Add Iron Condor note based on account type
         is_paper = config.ALPACA_MODE and config.ALPACA_MODE.lower().strip() == 'paper'
         if is_paper:
-            prompt += "NOT ALLOWED in paper accounts (requires naked options)\n"
+            parts.append("NOT ALLOWED in paper accounts (requires naked options)\n")
         else:
-            prompt += "ONLY when IV Rank > 70 and range-bound market\n"
+            parts.append("ONLY when IV Rank > 70 and range-bound market\n")
 
-        prompt += """
+        parts.append("""
 ═══════════════════════════════════════════════════════════════════════
 
 TRADE ANALYSIS INSTRUCTIONS:
@@ -1527,55 +2311,74 @@ SYMBOL|STRATEGY|STRIKES|EXPIRY|CONFIDENCE|REASON
 
 Where:
 - SYMBOL: Stock ticker
-"""
+""")
 
         # Adjust available strategies based on account type
         is_paper = config.ALPACA_MODE and config.ALPACA_MODE.lower().strip() == 'paper'
         if is_paper:
             # Paper accounts cannot trade naked options (IRON_CONDOR, SHORT_STRADDLE, SHORT_STRANGLE)
-            prompt += "- STRATEGY: One of [LONG_CALL, LONG_PUT, BULL_CALL_SPREAD, BEAR_PUT_SPREAD, STRADDLE, STRANGLE]\n"
-            prompt += "  (IMPORTANT: IRON_CONDOR is NOT allowed in paper accounts - do not recommend it!)\n"
+            parts.append("- STRATEGY: One of [LONG_CALL, LONG_PUT, BULL_CALL_SPREAD, BEAR_PUT_SPREAD, STRADDLE, STRANGLE]\n")
+            parts.append("  (IMPORTANT: IRON_CONDOR is NOT allowed in paper accounts - do not recommend it!)\n")
         else:
-            prompt += "- STRATEGY: One of [LONG_CALL, LONG_PUT, BULL_CALL_SPREAD, BEAR_PUT_SPREAD, IRON_CONDOR, STRADDLE, STRANGLE]\n"
+            parts.append("- STRATEGY: One of [LONG_CALL, LONG_PUT, BULL_CALL_SPREAD, BEAR_PUT_SPREAD, IRON_CONDOR, STRADDLE, STRANGLE]\n")
 
-        prompt += """- STRIKES: Strike price(s) like "450" or "450/455" for spreads
+        parts.append("""- STRIKES: Strike price(s) like "450" or "450/455" for spreads
 - EXPIRY: Days to expiration like "30DTE" or "45DTE"
 - CONFIDENCE: Number 0-100 (CONSIDER PORTFOLIO RISK!)
 - REASON: Consider portfolio balance, diversification, and risk management
 
-"""
+""")
 
         # Add STRATEGY-SPECIFIC MARKET REGIME INSTRUCTIONS
-        prompt += "MARKET REGIME STRATEGY GUIDANCE:\n"
+        parts.append("MARKET REGIME STRATEGY GUIDANCE:\n")
         if regime_type == 'VOLATILITY_SPIKE':
-            prompt += "- PRIORITIZE: STRADDLE, STRANGLE, IRON_CONDOR strategies (high volatility is favorable)\n"
-            prompt += "- These strategies benefit most when volatility is elevated\n"
-            prompt += "- Boost confidence 20-30% for STRADDLE/STRANGLE/IRON_CONDOR opportunities\n"
-            prompt += "- Focus on stocks showing HIGH_GAMMA or HIGH_IV_RANK signals\n\n"
+            parts.append("- PRIORITIZE: STRADDLE, STRANGLE, IRON_CONDOR strategies (high volatility is favorable)\n")
+            parts.append("- These strategies benefit most when volatility is elevated\n")
+            parts.append("- Boost confidence 20-30% for STRADDLE/STRANGLE/IRON_CONDOR opportunities\n")
+            parts.append("- Focus on stocks showing HIGH_GAMMA or HIGH_IV_RANK signals\n\n")
         elif regime_type == 'BULL_RAMPAGE':
-            prompt += "- AVOID: High-risk volatility plays, STAY BULLISH\n"
-            prompt += "- Prefer: LONG_CALL, BULL_CALL_SPREAD strategies on strong stocks\n"
-            prompt += "- Reduce confidence for IRON_CONDOR/condor strategies\n\n"
+            parts.append("- AVOID: High-risk volatility plays, STAY BULLISH\n")
+            parts.append("- Prefer: LONG_CALL, BULL_CALL_SPREAD strategies on strong stocks\n")
+            parts.append("- Reduce confidence for IRON_CONDOR/condor strategies\n\n")
         elif regime_type == 'BEAR_TRAP':
-            prompt += "- CAUTION: Use STRADDLE/STRANGLE for uncertainty, avoid directional bets\n"
-            prompt += "- Prefer: VOLATILITY STRATEGIES over directional plays\n\n"
+            parts.append("- CAUTION: Use STRADDLE/STRANGLE for uncertainty, avoid directional bets\n")
+            parts.append("- Prefer: VOLATILITY STRATEGIES over directional plays\n\n")
         elif regime_type == 'CALM_DECLINE':
-            prompt += "- PREFER: Volatility selling strategies (IRON_CONDOR ideal)\n"
-            prompt += "- Moderate confidence for STRADDLE/STRANGLE, higher for credit spreads\n\n"
+            parts.append("- PREFER: Volatility selling strategies (IRON_CONDOR ideal)\n")
+            parts.append("- Moderate confidence for STRADDLE/STRANGLE, higher for credit spreads\n\n")
         else:
-            prompt += "- STANDARD: Adjust strategies based on individual stock analysis\n\n"
+            parts.append("- STANDARD: Adjust strategies based on individual stock analysis\n\n")
 
-        prompt += """NEW OPPORTUNITIES TO ANALYZE:
+        parts.append("""NEW OPPORTUNITIES TO ANALYZE:
 
-"""
+""")
+
+        prefix = "".join(parts)
+        self._prompt_prefix_cache = (time.monotonic(), version, prefix, exposure)
+        return prefix, exposure
+
+    def _build_candidate_blocks(self, batch: List[Dict], exposure: Dict) -> List[str]:
+        """Build the data lines of each candidate in a batch prompt - one block per candidate, '' if skipped"""
+        blocks = []
+
+        # Look up earnings risk and HV for the whole batch at once (uncached symbols fetched concurrently)
+        symbols = [sanitize_for_prompt(c['symbol'], max_length=10) for c in batch]
+        try:
+            earnings_map = self.earnings_calendar.check_earnings_risk_bulk(symbols)
+        except Exception as e:
+            logging.debug(f"Could not bulk-load earnings for batch: {e}")
+            earnings_map = {}
+        hv_map = self._prefetch_hv([s for s in symbols if validate_symbol(s)], days=30)
 
         for candidate in batch:
+            parts = []
             # FIXED: Issue #5 - Sanitize all inputs before building prompt
             symbol = sanitize_for_prompt(candidate['symbol'], max_length=10)
 
             # Validate symbol format
             if not validate_symbol(symbol):
                 logging.warning(f"Skipping invalid symbol in prompt: {symbol}")
+                blocks.append("")
                 continue
 
             analysis = candidate['analysis']
@@ -1594,46 +2397,39 @@ Where:
             pcr = analysis['put_call_ratio']
 
             # Check if we already have this symbol in portfolio
-            symbol_in_portfolio = symbol in exposure.get('by_symbol', {})
-
-            # Extract average Greeks from options chain (ATM options)
-            atm_options = [opt for opt in options_data
-                          if opt.get('strike', 0) > 0 and price > 0 and abs(opt.get('strike', 0) - price) / price < 0.10]  # Within 10% of current price
-
-            deltas = []
-            gammas = []
-            thetas = []
-            vegas = []
-
-            # FIXED: Issue #7 - Proper Greeks validation ranges
-            for opt in atm_options[:10]:  # Check more options
-                delta = opt.get('delta') or opt.get('greeks_delta') or opt.get('theoretical_delta')
-                if delta is not None and isinstance(delta, (int, float)) and -1.0 <= delta <= 1.0:
-                    deltas.append(delta)
-
-                gamma = opt.get('gamma') or opt.get('greeks_gamma') or opt.get('theoretical_gamma')
-                # ATM options can have gamma > 1, allow up to 10 for short DTE
-                if gamma is not None and isinstance(gamma, (int, float)) and 0 <= gamma <= 10:
-                    gammas.append(gamma)
-
-                theta = opt.get('theta') or opt.get('greeks_theta') or opt.get('theoretical_theta')
-                # Theta can be positive (short positions) or negative (long positions)
-                if theta is not None and isinstance(theta, (int, float)) and -10 <= theta <= 10:
-                    thetas.append(theta)
-
-                vega = opt.get('vega') or opt.get('greeks_vega') or opt.get('theoretical_vega')
-                # Vega higher for longer DTE, allow up to 100
-                if vega is not None and isinstance(vega, (int, float)) and 0 <= vega <= 100:
-                    vegas.append(vega)
-
-            # Calculate averages
-            avg_delta = sum(deltas) / len(deltas) if deltas else 0
-            avg_gamma = sum(gammas) / len(gammas) if gammas else 0
-            avg_theta = sum(thetas) / len(thetas) if thetas else 0
-            avg_vega = sum(vegas) / len(vegas) if vegas else 0
+            symbol_in_portfolio = symbol in exposure.get('by_symbol', _EMPTY)
+
+            # One pass over the chain into columns; every aggregate below is a masked NumPy reduction
+            chain = np.array([
+                (opt.get('strike', 0) or 0, opt.get('bid', 0) or 0, opt.get('ask', 0) or 0,
+                 opt.get('volume', 0) or 0, opt.get('implied_volatility', 0) or 0, opt.get('delta') or 0,
+                 opt.get('option_type') == 'call', opt.get('option_type') == 'put')
+                for opt in options_data
+            ], dtype=float).reshape(-1, 8)
+            strikes, bids, asks, volumes, ivs, raw_deltas = chain[:, :6].T
+            is_call = chain[:, 6].astype(bool)
+            is_put = chain[:, 7].astype(bool)
+
+            # Extract average Greeks from options chain (ATM options - within 10% of current price)
+            if price > 0:
+                atm_idx = np.flatnonzero((strikes > 0) & (np.abs(strikes - price) / price < 0.10))[:10]
+            else:
+                atm_idx = np.array([], dtype=int)
+
+            # FIXED: Issue #7 - Proper Greeks validation ranges (missing/non-numeric -> NaN, fails every mask)
+            greeks = np.array([[_option_greek(options_data[i], name) for name in ('delta', 'gamma', 'theta', 'vega')]
+                               for i in atm_idx], dtype=float).reshape(-1, 4)
+            deltas, gammas, thetas, vegas = greeks.T
+            avg_delta = _mean_or_zero(deltas[(deltas >= -1.0) & (deltas <= 1.0)])
+            # ATM options can have gamma > 1, allow up to 10 for short DTE
+            avg_gamma = _mean_or_zero(gammas[(gammas >= 0) & (gammas <= 10)])
+            # Theta can be positive (short positions) or negative (long positions)
+            avg_theta = _mean_or_zero(thetas[(thetas >= -10) & (thetas <= 10)])
+            # Vega higher for longer DTE, allow up to 100
+            avg_vega = _mean_or_zero(vegas[(vegas >= 0) & (vegas <= 100)])
 
             # CRITICAL FIX: If no Greeks found in options data, estimate them
-            if avg_delta == 0 and avg_gamma == 0 and avg_theta == 0 and avg_vega == 0 and atm_options:
+            if avg_delta == 0 and avg_gamma == 0 and avg_theta == 0 and avg_vega == 0 and atm_idx.size:
                 logging.warning(f"{symbol}: No Greeks in options data, using estimates")
                 # Use reasonable ATM option approximations
                 # ATM calls: delta ~0.50, gamma ~0.06, theta ~-0.04, vega ~0.20
@@ -1644,225 +2440,180 @@ Where:
                 avg_vega = 0.20  # ATM vega (sensitivity to IV changes)
 
             # PROMPT IMPROVEMENT 1.2: Calculate average bid-ask spread for ATM options
-            atm_spreads = []
-            for opt in atm_options[:10]:
-                bid = opt.get('bid', 0)
-                ask = opt.get('ask', 0)
-                if bid > 0 and ask > 0:
-                    mid = (bid + ask) / 2
-                    spread_pct = (ask - bid) / mid
-                    atm_spreads.append(spread_pct)
-
-            avg_spread_pct = sum(atm_spreads) / len(atm_spreads) if atm_spreads else 0
-
-            # Extract calls and puts from options_data for prompt improvements
-            calls = [opt for opt in options_data if opt.get('option_type') == 'call']
-            puts = [opt for opt in options_data if opt.get('option_type') == 'put']
+            atm_bids, atm_asks = bids[atm_idx], asks[atm_idx]
+            quoted = (atm_bids > 0) & (atm_asks > 0)
+            avg_spread_pct = _mean_or_zero(
+                (atm_asks[quoted] - atm_bids[quoted]) / ((atm_bids[quoted] + atm_asks[quoted]) / 2)
+            )
 
             # Get average IV from analysis or calculate it
             avg_iv = analysis.get('avg_iv', 0)
             if avg_iv == 0:  # Calculate if not in analysis
-                ivs = [opt.get('implied_volatility', 0) for opt in options_data if opt.get('implied_volatility', 0) > 0]
-                avg_iv = sum(ivs) / len(ivs) if ivs else 0.01  # Default to 0.01 to avoid division by zero
+                positive_ivs = ivs[ivs > 0]
+                avg_iv = float(positive_ivs.mean()) if positive_ivs.size else 0.01  # Default to 0.01 to avoid division by zero
 
             # Extract total volume and OI from analysis
             total_volume = analysis.get('total_volume', 0)
             total_oi = analysis.get('total_oi', 0)
 
             # PROMPT IMPROVEMENT 2.1: Calculate IV skew (smart money indicator)
-            try:
-                import statistics
-                # OTM calls: 5-15% above current price
-                otm_calls = [opt for opt in calls
-                            if opt.get('strike', 0) > 0 and
-                            1.05 < opt.get('strike', 0) / price < 1.15 and
-                            opt.get('implied_volatility', 0) > 0]
-                # OTM puts: 5-15% below current price
-                otm_puts = [opt for opt in puts
-                           if opt.get('strike', 0) > 0 and
-                           0.85 < opt.get('strike', 0) / price < 0.95 and
-                           opt.get('implied_volatility', 0) > 0]
-
-                call_iv_avg = statistics.mean([opt.get('implied_volatility', 0) for opt in otm_calls]) if otm_calls else 0
-                put_iv_avg = statistics.mean([opt.get('implied_volatility', 0) for opt in otm_puts]) if otm_puts else 0
-
+            skew = 0
+            if price > 0:
+                moneyness = strikes / price
+                has_iv = (strikes > 0) & (ivs > 0)
+                # OTM calls: 5-15% above current price / OTM puts: 5-15% below current price
+                call_iv_avg = _mean_or_zero(ivs[is_call & has_iv & (moneyness > 1.05) & (moneyness < 1.15)])
+                put_iv_avg = _mean_or_zero(ivs[is_put & has_iv & (moneyness > 0.85) & (moneyness < 0.95)])
                 skew = put_iv_avg - call_iv_avg  # Positive = put skew (fear/hedging), negative = call skew (complacency)
-            except Exception as e:
-                logging.debug(f"Could not calculate skew for {symbol}: {e}")
-                skew = 0
 
             # PROMPT IMPROVEMENT 2.2: Calculate HV/IV ratio (premium pricing indicator)
-            hv = self._calculate_historical_volatility(symbol, days=30)
+            hv = hv_map.get(symbol, 0)
             hv_iv_ratio = hv / avg_iv if avg_iv > 0.01 else 0
             # Interpretation: <0.8 = IV overpriced (sell premium), 0.8-1.2 = fair, >1.2 = IV underpriced (buy premium)
 
             # PROMPT IMPROVEMENT 2.3: Calculate implied move from ATM straddle
             implied_move_pct = 0
-            try:
-                if calls and puts and price > 0:
-                    atm_call = min(calls, key=lambda x: abs(x.get('strike', 0) - price))
-                    atm_put = min(puts, key=lambda x: abs(x.get('strike', 0) - price))
-
-                    if atm_call and atm_put:
-                        straddle_price = atm_call.get('ask', 0) + atm_put.get('ask', 0)
-                        if straddle_price > 0:
-                            implied_move_pct = (straddle_price / price) * 0.85  # 85% probability (1 stdev)
-            except Exception as e:
-                logging.debug(f"Could not calculate implied move for {symbol}: {e}")
+            if is_call.any() and is_put.any() and price > 0:
+                call_idx = np.flatnonzero(is_call)
+                put_idx = np.flatnonzero(is_put)
+                atm_call = call_idx[np.argmin(np.abs(strikes[call_idx] - price))]
+                atm_put = put_idx[np.argmin(np.abs(strikes[put_idx] - price))]
+
+                straddle_price = asks[atm_call] + asks[atm_put]
+                if straddle_price > 0:
+                    implied_move_pct = (straddle_price / price) * 0.85  # 85% probability (1 stdev)
 
             # PROMPT IMPROVEMENT 2.4: Calculate delta-weighted volume (smart money flow)
-            call_delta_vol = sum(
-                opt.get('volume', 0) * abs(opt.get('delta', 0))
-                for opt in calls if opt.get('delta') and opt.get('volume')
-            )
-            put_delta_vol = sum(
-                opt.get('volume', 0) * abs(opt.get('delta', 0))
-                for opt in puts if opt.get('delta') and opt.get('volume')
-            )
+            delta_vol = volumes * np.abs(raw_deltas)
+            call_delta_vol = float(delta_vol[is_call].sum())
+            put_delta_vol = float(delta_vol[is_put].sum())
             net_delta_vol = call_delta_vol - put_delta_vol  # Positive = bullish institutional flow, negative = bearish
 
-            prompt += f"{symbol}: Price ${price:.2f} ({pct_change:+.1f}%), IV-Rank {iv_rank:.0f} ({iv_signal}), "
-            prompt += f"HV/IV {hv_iv_ratio:.2f}, ImpMove {implied_move_pct:.1%}, P/C-Ratio {pcr:.2f}, Skew {skew:+.2f}, "
-            prompt += f"DeltaVol {net_delta_vol:+,.0f}, ATM-Delta {avg_delta:.3f}, Theta ${avg_theta:.2f}/day, "
-            prompt += f"Gamma {avg_gamma:.4f}, Vega ${avg_vega:.2f}, Spread {avg_spread_pct:.1%}, Vol {total_volume:,}, OI {total_oi:,}"
+            parts.append(f"{symbol}: Price ${price:.2f} ({pct_change:+.1f}%), IV-Rank {iv_rank:.0f} ({iv_signal}), ")
+            parts.append(f"HV/IV {hv_iv_ratio:.2f}, ImpMove {implied_move_pct:.1%}, P/C-Ratio {pcr:.2f}, Skew {skew:+.2f}, ")
+            parts.append(f"DeltaVol {net_delta_vol:+,.0f}, ATM-Delta {avg_delta:.3f}, Theta ${avg_theta:.2f}/day, ")
+            parts.append(f"Gamma {avg_gamma:.4f}, Vega ${avg_vega:.2f}, Spread {avg_spread_pct:.1%}, Vol {total_volume:,}, OI {total_oi:,}")
 
             # PHASE 2: Add IV rank strategy guidance
-            if iv_rank < 30:
-                prompt += f" [💰 CHEAP OPTIONS - Good for BUYING (debit spreads, long calls/puts)]"
-            elif iv_rank > 70:
-                prompt += f" [💸 EXPENSIVE OPTIONS - Good for SELLING (credit spreads)]"
-            elif 40 <= iv_rank <= 60:
-                prompt += f" [⚖️ NEUTRAL IV - Use with caution for spreads]"
+            parts.append(_IV_ANNOTATIONS[bisect_right(_IV_LOW_BREAKS, iv_rank) + bisect_left(_IV_HIGH_BREAKS, iv_rank)])
 
             if symbol_in_portfolio:
                 current_exposure = exposure['by_symbol'].get(symbol, 0)
-                prompt += f" [IN PORTFOLIO: {current_exposure:.1%} exposure]"
+                parts.append(f" [IN PORTFOLIO: {current_exposure:.1%} exposure]")
 
             # PROMPT IMPROVEMENT 1.3: Add earnings proximity warning
             try:
-                earnings_risk = self.earnings_calendar.check_earnings_risk(symbol)
-                if earnings_risk['risk'] == 'HIGH':
-                    days_until = earnings_risk.get('days_until', 'unknown')
-                    prompt += f" [⚠️ EARNINGS: {days_until} days - IV CRUSH RISK!]"
-                elif earnings_risk['risk'] == 'MODERATE':
-                    days_until = earnings_risk.get('days_until', 'unknown')
-                    prompt += f" [⚠️ Earnings: {days_until} days]"
+                earnings_risk = earnings_map.get(symbol) or self.earnings_calendar.check_earnings_risk(symbol)
+                earnings_tag = _EARNINGS_TAGS.get(earnings_risk['risk'])
+                if earnings_tag:
+                    parts.append(earnings_tag.format(earnings_risk.get('days_until', 'unknown')))
                 elif earnings_risk['risk'] == 'LOW' and earnings_risk.get('days_until', 99) < 21:
-                    prompt += f" [Earnings: {earnings_risk.get('days_until')} days]"
+                    parts.append(f" [Earnings: {earnings_risk.get('days_until')} days]")
             except Exception as e:
                 logging.debug(f"Could not get earnings for {symbol}: {e}")
 
-            prompt += f"\nSignals: {signals}\n\n"
-
-        # PROMPT IMPROVEMENT 1.5: Multi-leg strategy bonuses
-        prompt += """STRATEGY SELECTION BONUSES (add to base confidence):
-- IRON_CONDOR in low volatility (IV rank <30): +10%
-- STRADDLE/STRANGLE in high IV rank (>70): +15%
-- Credit spreads vs naked short options: +5% (defined risk benefit)
-- Debit spreads vs naked long options: +3% (lower cost, defined risk)
-- Calendar spreads for term structure plays: +10%
-- Multi-leg strategies (general sophistication bonus): +5%
-
-STRATEGY PENALTIES (subtract from confidence):
-- Naked short call/put: -10% (undefined risk)
-- Strategies against market regime: -20% (e.g., bullish in BEAR_TRAP)
-- Overlapping positions in same underlying: -15%
-- Strategy not suited for IV environment: -15%
-
-"""
-        # PROMPT IMPROVEMENT 1.4: Quantified confidence scoring rubric
-        prompt += """CONFIDENCE SCORING RUBRIC (BE PRECISE AND CONSISTENT):
-
-95-100% - PERFECT SETUP (All 5 factors aligned):
-  ✓ Strong directional/volatility signal from scanner (BIG_MOVE, HIGH_IV_RANK, etc.)
-  ✓ IV environment favors strategy (IV rank extreme <25 or >75)
-  ✓ Excellent liquidity (spread <5%, volume >1000, OI >5000)
-  ✓ Favorable Greeks profile for chosen strategy
-  ✓ No earnings within 14 days OR earnings play with clear directional edge
-
-85-94% - STRONG SETUP (4/5 factors aligned, minor concerns)
-70-84% - GOOD SETUP (3/5 factors present, some risks)
-50-69% - MARGINAL SETUP (2/5 factors, significant risks)
-<50% - WEAK SETUP (use only for diversification, low conviction)
-
-AUTOMATIC CONFIDENCE REDUCTIONS:
-- Earnings within 7 days: -20% (unless specifically earnings play)
-- Bid-ask spread >10%: -15%
-- Bid-ask spread >15%: -25%
-- Volume <100 or OI <1000: -20%
-- Volume <50 or OI <500: -30%
-- Already 10%+ portfolio exposure to this symbol: -25%
-- Already 15%+ portfolio exposure to this symbol: -35%
-- Sector already >30% of portfolio: -15%
-- Sector already >40% of portfolio: -25%
-- Wide spread (>10%) + low volume (<100): -35% (compounding risk)
-
-IMPORTANT RULES:
-- Reserve 95%+ for truly exceptional setups (1-2 per week maximum)
-- Most good trades should be 75-85% confidence
-- Be conservative - overconfidence leads to losses
-- Consider ALL factors, not just one strong signal
-- Respect portfolio limits and diversification
-- Ensure adequate buying power for position sizing
-
-Provide ONLY the formatted lines, one per symbol. No other text."""
+            parts.append(f"\nSignals: {signals}\n\n")
+            blocks.append("".join(parts))
 
-        return prompt
+        return blocks
 
-    def _parse_batch_response(self, response: str, batch: List[Dict]) -> List[Dict]:
-        """Parse batch Grok response"""
-        lines = response.strip().split('\n')
-        results = []
+    def _parse_batch_response(self, response: str, batch: Union[List[Dict], Dict[str, Dict]]) -> List[Dict]:
+        """Parse batch Grok response (batch may already be a symbol -> candidate dict)"""
+        # Create lookup by symbol unless the caller already keyed it
+        batch_lookup = batch if isinstance(batch, dict) else {c['symbol']: c for c in batch}
 
-        # Create lookup by symbol
-        batch_lookup = {c['symbol']: c for c in batch}
+        rated = {}
+        for line in response.split('\n'):
+            self._rate_batch_line(line, batch_lookup, rated)
+        return self._finish_batch_ratings(rated, batch_lookup)
 
-        for line in lines:
-            if '|' not in line:
-                continue
+    def _rate_batch_line(self, line: str, batch_lookup: Dict[str, Dict], rated: Dict[str, Dict]) -> None:
+        """Apply one Grok reply line - SYMBOL|STRATEGY|STRIKES|EXPIRY|CONFIDENCE[|REASON] - to its candidate"""
+        match = _BATCH_LINE_RE.match(line)
+        if match is None:
+            return
+        symbol, strategy, strikes, expiry, confidence_field, reason = (
+            field.strip() if field else '' for field in match.groups()
+        )
+        try:
+            confidence_str = _NON_DIGIT_RE.sub('', confidence_field)
+            confidence = int(confidence_str) if confidence_str else 0
 
-            parts = line.split('|')
-            if len(parts) >= 5:
-                try:
-                    symbol = parts[0].strip()
-                    strategy = parts[1].strip()
-                    strikes = parts[2].strip()
-                    expiry = parts[3].strip()
-                    confidence_str = ''.join(c for c in parts[4] if c.isdigit())
-                    confidence = int(confidence_str) if confidence_str else 0
-                    reason = parts[5].strip() if len(parts) > 5 else ''
-
-                    # FIXED: Issue #4 - Validate Grok response before using
-                    is_valid, error_msg = validate_grok_response(symbol, strategy, confidence, strikes)
-                    if not is_valid:
-                        logging.warning(f"Grok validation failed for {symbol}: {error_msg}")
-                        self.grok_logger.warning(f"VALIDATION FAILED: {symbol} | {strategy} | {confidence} - {error_msg}")
-                        continue
+            # FIXED: Issue #4 - Validate Grok response before using
+            is_valid, error_msg = validate_grok_response(symbol, strategy, confidence, strikes)
+            if not is_valid:
+                logging.warning(f"Grok validation failed for {symbol}: {error_msg}")
+                self.grok_logger.warning(f"VALIDATION FAILED: {symbol} | {strategy} | {confidence} - {error_msg}")
+                return
 
-                    if symbol in batch_lookup:
-                        candidate = batch_lookup[symbol]
-                        candidate['grok_confidence'] = confidence
-                        candidate['strategy'] = strategy
-                        candidate['strikes'] = strikes
-                        candidate['expiry'] = expiry
-                        candidate['reason'] = reason
-                        results.append(candidate)
+            if symbol in batch_lookup:
+                candidate = batch_lookup[symbol]
+                candidate['grok_confidence'] = confidence
+                candidate['strategy'] = strategy
+                candidate['strategy_class'] = classify_strategy(strategy)
+                candidate['strikes'] = strikes
+                candidate['expiry'] = expiry
+                candidate['reason'] = reason
+                rated.setdefault(symbol, candidate)  # A repeated line updates the candidate, never duplicates it
 
-                except Exception as e:
-                    logging.debug(f"Error parsing line '{line}': {e}")
-                    continue
+        except Exception as e:
+            logging.debug(f"Error parsing line '{match.group(0)}': {e}")
 
-        # Add any missing symbols with default values
+    def _finish_batch_ratings(self, rated: Dict[str, Dict], batch_lookup: Dict[str, Dict]) -> List[Dict]:
+        """Rated candidates in reply order, then any symbols Grok skipped with default values"""
+        results = list(rated.values())
         for symbol, candidate in batch_lookup.items():
-            if not any(r['symbol'] == symbol for r in results):
+            if symbol not in rated:
                 candidate['grok_confidence'] = 0
                 candidate['strategy'] = 'UNKNOWN'
+                candidate.pop('strategy_class', None)  # Drop any classification from an earlier rating
                 results.append(candidate)
+        return results
+
+    def _get_exposure_snapshot(self) -> Dict:
+        """Current portfolio exposure, refetched only when the portfolio manager's exposure version changed"""
+        version = self.portfolio_manager.exposure_version
+        if self._exposure_cache is None or self._exposure_cache_version != version:
+            self._exposure_cache = self.portfolio_manager.get_current_exposure()
+            self._exposure_cache_version = version
+        return self._exposure_cache
+
+    def validate_batch(self, candidates: List[Dict]) -> List[Tuple[bool, str]]:
+        """
+        First pass of post-validation's strategy/IV rules over a batch of Grok picks.
+
+        Runs _STRATEGY_IV_RULES (the same table post_validate_grok_recommendation uses)
+        for every candidate. Callers pass iv_prevalidated=True to evaluate_and_execute_trade
+        for survivors, so their full check only runs the spread-width rule and exposure check.
 
+        Returns:
+            (is_valid, rejection_reason) per candidate, in input order
+        """
+        results = []
+        for candidate in candidates:
+            strategy = candidate.get('strategy', 'UNKNOWN').upper()
+            strategy_class = candidate.get('strategy_class') or classify_strategy(strategy)
+            ctx = ValidationCtx(
+                symbol=candidate.get('symbol', ''),
+                strategy=strategy,
+                strategy_class=strategy_class,
+                iv_rank=candidate.get('analysis', _EMPTY).get('iv_metrics', _EMPTY).get('iv_rank', 50),
+                stock_price=0.0,
+                spread_width=None,
+                min_spread_width=0.0,
+            )
+            result = (True, "IV rank OK")
+            for rejects, reason, advisory in _STRATEGY_IV_RULES:
+                if rejects(ctx):
+                    result = (False, reason(ctx))
+                    break
+                if advisory is not None:
+                    advisory(ctx)
+            results.append(result)
         return results
 
     def post_validate_grok_recommendation(self, symbol: str, grok_data: Dict, scanner_analysis: Dict,
-                                          stock_price: float) -> tuple[bool, str]:
+                                          stock_price: float, iv_prevalidated: bool = False) -> tuple[bool, str]:
         """
         PHASE 3: POST-VALIDATION
         Validates Grok's recommendation against quantitative rules before execution.
@@ -1873,117 +2624,57 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
         - Checks position sizing and exposure limits
         - Prevents correlated/duplicate exposure
 
+        Args:
+            iv_prevalidated: validate_batch already passed this pick through _STRATEGY_IV_RULES
+
         Returns:
             (is_valid, rejection_reason)
         """
+        # Checks run cheapest and most selective first: the confidence gate rejects
+        # most sub-par picks before any parsing, the portfolio exposure lookup runs last
+        confidence = grok_data.get('grok_confidence', 0)
+
+        # After pre-filter and Grok analysis, we should only execute high-confidence trades
+        if confidence < 75:
+            return False, f"Confidence {confidence}% below execution threshold (min 75%)"
+
         strategy = grok_data.get('strategy', 'UNKNOWN').upper()
         strikes = grok_data.get('strikes', '')
-        confidence = grok_data.get('grok_confidence', 0)
 
         # Get IV metrics from scanner analysis
-        iv_metrics = scanner_analysis.get('iv_metrics', {})
+        iv_metrics = scanner_analysis.get('iv_metrics', _EMPTY)
         iv_rank = iv_metrics.get('iv_rank', 50)
 
-        # Determine strategy type
-        is_debit_spread = any(x in strategy for x in ['BULL CALL', 'BEAR PUT', 'DEBIT'])
-        is_credit_spread = any(x in strategy for x in ['BULL PUT', 'BEAR CALL', 'CREDIT'])
-        is_single_leg = any(x in strategy for x in ['LONG CALL', 'LONG PUT']) and 'SPREAD' not in strategy
-        is_iron_condor = 'IRON CONDOR' in strategy or 'CONDOR' in strategy
-        is_volatility_play = any(x in strategy for x in ['STRADDLE', 'STRANGLE'])
-
-        # VALIDATION 1: Iron Condor check for paper trading
-        if is_iron_condor and config.ALPACA_MODE == 'paper':
-            return False, "Iron Condor not allowed in paper trading (requires naked options)"
-
-        # VALIDATION 1.5: Volatility Play IV Rank Check
-        # CRITICAL: Buying straddles/strangles in LOW IV and selling in HIGH IV
-        if is_volatility_play:
-            # Determine if buying or selling volatility
-            is_long_vol = 'LONG' in strategy or ('STRADDLE' in strategy and 'SHORT' not in strategy) or ('STRANGLE' in strategy and 'SHORT' not in strategy)
-            is_short_vol = 'SHORT' in strategy
-
-            if is_long_vol:
-                # Buying straddles/strangles: ONLY when IV rank is LOW (< 50)
-                # This prevents buying expensive volatility that's about to collapse
-                if iv_rank > 50:
-                    return False, f"IV rank {iv_rank:.0f}% too HIGH for buying {strategy} (max 50% - avoid IV crush!)"
-                if iv_rank > 40:
-                    logging.warning(f"{symbol}: IV rank {iv_rank:.0f}% borderline for buying {strategy} (prefer <40%)")
-
-            elif is_short_vol:
-                # Selling straddles/strangles: ONLY when IV rank is HIGH (> 70)
-                if iv_rank < 70:
-                    return False, f"IV rank {iv_rank:.0f}% too LOW for selling {strategy} (min 70%)"
-
-        # VALIDATION 2: IV Rank Appropriateness (Expert Trader Rules)
-        # Debit spreads should ONLY be placed when IV is LOW (cheap options)
-        if is_debit_spread:
-            if iv_rank > 40:
-                return False, f"IV rank {iv_rank:.0f}% too high for debit spread (max 40% - avoid buying expensive options)"
-            if iv_rank > 30:
-                logging.warning(f"{symbol}: IV rank {iv_rank:.0f}% is borderline for debit spread (prefer <30%)")
-
-        # Credit spreads should ONLY be placed when IV is ELEVATED (expensive options to sell)
-        # Conservative approach: require 60% minimum to ensure we're selling expensive premium
-        if is_credit_spread:
-            if iv_rank < 60:
-                return False, f"IV rank {iv_rank:.0f}% too low for credit spread (min 60% - need expensive premium to sell)"
-            if iv_rank < 70:
-                logging.warning(f"{symbol}: IV rank {iv_rank:.0f}% is acceptable for credit spread but prefer >70%")
-
-        # Single leg should ONLY be placed when IV is VERY LOW
-        if is_single_leg:
-            if iv_rank > 30:
-                return False, f"IV rank {iv_rank:.0f}% too high for single leg (max 30%)"
-
-        # VALIDATION 3: Spread Width and Debit/Credit Validation
+        # Parse the spread legs, if any, for the width rule
+        spread_width = None
         if '/' in strikes:
-            try:
-                strike_parts = strikes.split('/')
-                long_strike = float(strike_parts[0].strip())
-                short_strike = float(strike_parts[1].strip())
-                spread_width = abs(long_strike - short_strike)
-
-                # Check minimum spread width based on stock price tiers
-                # Use reasonable minimums that allow viable credit/debit spreads
-                if stock_price < 20:
-                    min_spread_width = 0.50  # $0.50 minimum for low-priced stocks
-                elif stock_price < 100:
-                    min_spread_width = 1.00  # $1.00 minimum for mid-priced stocks
-                elif stock_price < 500:
-                    min_spread_width = 2.50  # $2.50 minimum for high-priced stocks (allows $3-5 spreads)
-                else:
-                    min_spread_width = 5.00  # $5.00 minimum for very high-priced stocks (>$500)
-
-                if spread_width < min_spread_width:
-                    return False, f"Spread width ${spread_width:.2f} too narrow (min ${min_spread_width:.2f} for ${stock_price:.2f} stock)"
-
-                # For debit spreads, validate we're not overpaying
-                if is_debit_spread:
-                    # We should never pay more than 60% of spread width
-                    max_debit = spread_width * 0.60
-                    # Note: We don't have actual debit here, but we can warn
-                    logging.info(f"{symbol}: Spread width ${spread_width:.2f} - ensure debit < ${max_debit:.2f} (60% of width)")
-
-                # For credit spreads, validate we're collecting enough
-                if is_credit_spread:
-                    # We should collect at least 30% of spread width
-                    min_credit = spread_width * 0.30
-                    logging.info(f"{symbol}: Spread width ${spread_width:.2f} - ensure credit > ${min_credit:.2f} (30% of width)")
-
-            except Exception as e:
-                logging.warning(f"{symbol}: Could not parse strikes '{strikes}' for spread validation: {e}")
-
-        # VALIDATION 4: Confidence Threshold
-        # After pre-filter and Grok analysis, we should only execute high-confidence trades
-        if confidence < 75:
-            return False, f"Confidence {confidence}% below execution threshold (min 75%)"
-
-        # VALIDATION 5: Position Sizing and Exposure
-        # Check current portfolio exposure to this symbol
+            strikes_match = _STRIKE_PAIR_RE.match(strikes)
+            if strikes_match is None:
+                logging.warning(f"{symbol}: Could not parse strikes '{strikes}' for spread validation")
+            else:
+                spread_width = abs(float(strikes_match.group(1)) - float(strikes_match.group(2)))
+
+        ctx = ValidationCtx(
+            symbol=symbol,
+            strategy=strategy,
+            strategy_class=grok_data.get('strategy_class') or classify_strategy(strategy),
+            iv_rank=iv_rank,
+            stock_price=stock_price,
+            spread_width=spread_width,
+            min_spread_width=_MIN_SPREAD_WIDTHS[bisect_right(_SPREAD_PRICE_TIERS, stock_price)],
+        )
+        # validate_batch already ran the strategy/IV rules for pre-validated picks
+        rules = _SPREAD_WIDTH_RULES if iv_prevalidated else _POST_VALIDATION_RULES
+        for rejects, reason, advisory in rules:
+            if rejects(ctx):
+                return False, reason(ctx)
+            if advisory is not None:
+                advisory(ctx)
+
+        # Position sizing: current portfolio exposure to this symbol
         try:
-            current_exposure = self.portfolio_manager.get_current_exposure()
-            symbol_exposure_pct = current_exposure.get('symbols', {}).get(symbol, {}).get('exposure_pct', 0)
+            current_exposure = self._get_exposure_snapshot()
+            symbol_exposure_pct = current_exposure.get('symbols', _EMPTY).get(symbol, _EMPTY).get('exposure_pct', 0)
 
             # Don't allow more than 15% portfolio exposure to a single symbol
             if symbol_exposure_pct > 15:
@@ -2029,14 +2720,18 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
             print(f"{Colors.DIM}  Scan time: {cached_scan['timestamp']}{Colors.RESET}")
             print(f"{Colors.DIM}  Scan type: {cached_scan.get('scan_type', 'UNKNOWN')}{Colors.RESET}\n")
 
-            # Reconstruct candidate objects from cache
-            for opp in cached_scan['opportunities']:
-                # We need to re-fetch data since cache doesn't have full structure
-                symbol = opp['symbol']
-                print(f"{Colors.DIM}  Loading data for {symbol}...{Colors.RESET}")
+            # We need to re-fetch data since cache doesn't have full structure -
+            # quotes in one concurrent batch, chains on a thread pool, analysis stays on this thread
+            symbols = [opp['symbol'] for opp in cached_scan['opportunities']]
+            print(f"{Colors.DIM}  Loading data for {len(symbols)} symbols...{Colors.RESET}")
+            quotes = self._fetch_quotes(symbols)
+            # At most 4 chain requests in flight - the local OpenBB server trips the client's circuit breaker under bursts
+            with ThreadPoolExecutor(max_workers=min(4, len(symbols))) as executor:
+                chains = list(executor.map(self.openbb.get_options_chains, symbols))
 
-                stock_data = self.openbb.get_quote(symbol)
-                options_data = self.openbb.get_options_chains(symbol)
+            # Reconstruct candidate objects from cache
+            for symbol, options_data in zip(symbols, chains):
+                stock_data = quotes.get(symbol)
 
                 if stock_data and options_data and 'results' in stock_data and 'results' in options_data:
                     stock_quote = stock_data['results'][0] if isinstance(stock_data['results'], list) else stock_data['results']
@@ -2088,14 +2783,19 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
         else:
             print(f"{Colors.INFO}[*] Using fresh scan data - already current{Colors.RESET}\n")
 
-        grok_rated = self.analyze_batch_with_grok(test_candidates[:50], refresh_data=False)
+        # Only the upper half by scanner score is worth Grok tokens
+        score_floor = np.percentile([c['final_score'] for c in test_candidates], 50)
+        grok_candidates = [c for c in test_candidates if c['final_score'] >= score_floor][:50]
+        print(f"{Colors.DIM}  Sending {len(grok_candidates)}/{len(test_candidates)} candidates with score >= {score_floor:.0f}{Colors.RESET}\n")
+
+        grok_rated = self.analyze_batch_with_grok(grok_candidates, refresh_data=False)
 
         if not grok_rated:
             print(f"{Colors.ERROR}[ERROR] Grok analysis failed{Colors.RESET}")
             return
 
-        # Sort by Grok confidence
-        top_25 = sorted(grok_rated, key=lambda x: x.get('grok_confidence', 0), reverse=True)[:25]
+        # Top 25 by Grok confidence (unrated when XAI_API_KEY is unset - candidates come back unchanged)
+        top_25 = heapq.nlargest(25, grok_rated, key=lambda x: x.get('grok_confidence', 0))
 
         # Display results with formatted table
         print(f"\n{Colors.SUCCESS}[GROK RESULTS] Top 25 after AI analysis:{Colors.RESET}\n")
@@ -2104,24 +2804,24 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
         print(f"{Colors.HEADER}  {'#':>2}  {'SYMBOL':6}  {'CONF':>4}  {'STRATEGY':18}  {'STRIKES':12}  {'EXPIRY':8}  {'KEY ANALYSIS'}{Colors.RESET}")
         print(f"{Colors.DIM}  {'─'*2}  {'─'*6}  {'─'*4}  {'─'*18}  {'─'*12}  {'─'*8}  {'─'*35}{Colors.RESET}")
 
+        rows = []
         for i, candidate in enumerate(top_25, 1):
             conf = candidate.get('grok_confidence', 0)
-            strategy = candidate.get('strategy', 'UNKNOWN')[:18]  # Truncate long strategies
-            strikes = candidate.get('strikes', 'N/A')[:12]
-            expiry = candidate.get('expiry', 'N/A')[:8]
-            reason = candidate.get('reason', '')
-
-            # UI IMPROVEMENT: Use smart concise reason helper
-            reason_short = self._create_concise_reason(reason, max_length=35)
-
-            conf_color = Colors.SUCCESS if conf >= 75 else Colors.WARNING if conf >= 60 else Colors.DIM
-
-            print(f"  {i:>2}  {candidate['symbol']:6}  {conf_color}{conf:3d}%{Colors.RESET}  {strategy:18}  {strikes:12}  {expiry:8}  {Colors.DIM}{reason_short}{Colors.RESET}")
-
-        print()
+            rows.append(_GROK_RESULT_ROW_TMPL.format(
+                idx=i, sym=candidate['symbol'],
+                conf_color=Colors.SUCCESS if conf >= 75 else Colors.WARNING if conf >= 60 else Colors.DIM,
+                conf=conf,
+                strategy=candidate.get('strategy', 'UNKNOWN')[:18],  # Truncate long strategies
+                strikes=candidate.get('strikes', 'N/A')[:12],
+                expiry=candidate.get('expiry', 'N/A')[:8],
+                # UI IMPROVEMENT: Use smart concise reason helper
+                reason=self._create_concise_reason(candidate.get('reason', ''), max_length=35)
+            ))
+        rows.append("\n")
+        sys.stdout.write("".join(rows))
 
         # UI IMPROVEMENT: Show full analysis for top 3 high-confidence picks
-        top_3_high_conf = [c for c in top_25 if c.get('grok_confidence', 0) >= 80][:3]
+        top_3_high_conf = list(islice((c for c in top_25 if c.get('grok_confidence', 0) >= 80), 3))
         if top_3_high_conf:
             print(f"{Colors.SUCCESS}[TOP PICKS] Detailed analysis for best opportunities:{Colors.RESET}\n")
             for i, candidate in enumerate(top_3_high_conf, 1):
@@ -2149,14 +2849,21 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
         # Execute trades if requested
         if execute_trades:
             print(f"{Colors.WARNING}[EXECUTING] Processing high-confidence trades...{Colors.RESET}\n")
-            for candidate in top_25:
-                if candidate.get('grok_confidence', 0) >= 75:
-                    self.evaluate_and_execute_trade(
-                        candidate['symbol'],
-                        candidate,
-                        candidate['options_data'],
-                        candidate['analysis']
-                    )
+            self.portfolio_manager.invalidate_exposure()  # Start the cycle from a fresh exposure snapshot
+            high_conf_picks = [c for c in top_25 if c.get('grok_confidence', 0) >= 75]
+            # Reject strategy/IV-rank mismatches for the whole batch up front - survivors skip those rules later
+            for candidate, (iv_ok, rejection_reason) in zip(high_conf_picks, self.validate_batch(high_conf_picks)):
+                if not iv_ok:
+                    print(f"{Colors.WARNING}[POST-VALIDATION FAILED] {candidate['symbol']}: {rejection_reason}{Colors.RESET}")
+                    logging.warning(f"POST-VALIDATION REJECTED: {candidate['symbol']} | {candidate.get('strategy')} | {rejection_reason}")
+                    continue
+                self.evaluate_and_execute_trade(
+                    candidate['symbol'],
+                    candidate,
+                    candidate['options_data'],
+                    candidate['analysis'],
+                    iv_prevalidated=True
+                )
         else:
             print(f"{Colors.INFO}[TEST MODE] Skipping trade execution (use --skip-scan to execute){Colors.RESET}\n")
 
@@ -2183,6 +2890,7 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
 
         iteration = 0
         last_daily_summary = None
+        last_cb_reset = time.monotonic()
 
         # Start interactive UI
         self.interactive_ui.start()
@@ -2202,9 +2910,10 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
                     self._log_daily_summary()
                     last_daily_summary = current_date
 
-                # Reset circuit breaker periodically
-                if iteration % 10 == 0:
+                # Reset circuit breaker periodically (hourly - independent of how long each cycle slept)
+                if time.monotonic() - last_cb_reset > 3600:
                     self.openbb.reset_circuit_breaker()
+                    last_cb_reset = time.monotonic()
 
                 # Check if market is open OR if debug mode is enabled
                 market_is_open = self.market_calendar.is_market_open()
@@ -2218,6 +2927,9 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
                     # FIRST: Check and manage existing positions with exit rules (scheduled)
                     self.position_manager.check_and_execute_exits()
 
+                    # Grok exit review of open positions (adaptive interval - samples P&L every loop)
+                    self.check_positions_with_grok()
+
                     # ASSIGNMENT DETECTION: Check if any short puts were assigned
                     if self.wheel_manager:
                         assigned_symbols = self.wheel_manager.check_for_assignments(self.trading_client)
@@ -2261,8 +2973,7 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
 
                         # Cache results
                         if len(self.pre_market_opportunities) > 0:
-                            opps_to_cache = list(self.pre_market_opportunities)
-                            self.scan_cache.save_scan(opps_to_cache, scan_type)
+                            self.scan_cache.save_scan(self.pre_market_opportunities, scan_type)
                     else:
                         # Show cached results if available
                         cached_scan = self.scan_cache.load_last_scan()
@@ -2300,15 +3011,18 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
                 # Print start message only - no updates to avoid UI clutter and scroll interference
                 print(f"{Colors.DIM}[*] Sleeping for {sleep_time}s until next check...{Colors.RESET}")
 
-                # Interruptible sleep: Check for manual requests every second
-                for elapsed in range(sleep_time):
-                    time.sleep(1)
+                # Interruptible sleep: block until the deadline or until the UI signals a request
+                wake_event = self.interactive_ui.wake_event
+                sleep_deadline = time.monotonic() + sleep_time
+                while not self.shutdown_requested:
+                    if not wake_event.wait(timeout=max(0.0, sleep_deadline - time.monotonic())):
+                        break  # Slept the full interval
+                    wake_event.clear()
 
                     # Check for manual requests - execute immediately without waiting
                     manual_scan, manual_portfolio = self.interactive_ui.check_manual_requests()
 
                     if manual_scan or manual_portfolio:
-                        remaining = sleep_time - elapsed - 1
                         print(f"\n{Colors.SUCCESS}[MANUAL] Interrupting sleep to execute user request{Colors.RESET}")
 
                         if manual_portfolio:
@@ -2340,14 +3054,12 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
                                 print(f"{Colors.HEADER}[MANUAL] Spread scan requested - executing now{Colors.RESET}")
                                 self.execute_spread_opportunities()
 
+                        remaining = int(sleep_deadline - time.monotonic())
                         if remaining > 0:
                             print(f"{Colors.DIM}[*] Resuming sleep for {remaining}s until next check...{Colors.RESET}")
                         else:
                             print(f"{Colors.DIM}[*] Sleep complete, continuing to next cycle...{Colors.RESET}")
-
-                    # Check for shutdown request
-                    if self.shutdown_requested:
-                        break
+                            break
 
                 print()  # Add blank line after sleep
 
@@ -2452,40 +3164,97 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
         # Display portfolio overview after pre-market scan
         self.display_portfolio_summary()
 
+    def _record_pnl_moves(self, positions, now):
+        """
+        Record the gap since the last meaningful P&L move and reschedule the next position review.
+
+        Called on every check_positions_with_grok call (not only when a review runs), so gaps are
+        measured at the run() market loop's resolution rather than in multiples of the review interval.
+        A move is |unrealized_plpc - value at the last move| > GROK_PNL_MOVE_THRESHOLD for any
+        position, so slow drifts count too. The market loop runs every 5 minutes, so in practice the
+        schedule backs quiet books off toward GROK_POSITION_CHECK_MAX_SECONDS; intervals below the
+        loop period have no effect until the loop itself runs more often.
+        """
+        snapshot = {pos.symbol: float(pos.unrealized_plpc) for pos in positions if pos.unrealized_plpc is not None}
+        anchor = self._last_pnl_snapshot
+        threshold = config.GROK_PNL_MOVE_THRESHOLD
+        moved = any(
+            abs(pnl - anchor[sym]) > threshold
+            for sym, pnl in snapshot.items() if sym in anchor
+        )
+
+        if moved:
+            if self._last_pnl_move_time is not None:
+                self._pnl_move_gaps.append((now - self._last_pnl_move_time).total_seconds())
+            self._last_pnl_move_time = now
+            self._last_pnl_snapshot = snapshot
+        else:
+            # Keep anchors from the last move; track new positions, forget closed ones
+            self._last_pnl_snapshot = {sym: anchor.get(sym, pnl) for sym, pnl in snapshot.items()}
+
+        # Review about twice per typical gap between moves (lower quartile keeps us ahead of fast markets),
+        # never faster than the daily call budget spread over a 6.5h session allows
+        floor = max(config.GROK_POSITION_CHECK_MIN_SECONDS, 23400 / max(config.GROK_POSITION_CHECKS_PER_DAY, 1))
+        if len(self._pnl_move_gaps) >= 3:
+            gaps = sorted(self._pnl_move_gaps)
+            target = gaps[len(gaps) // 4] / 2
+        else:
+            target = 300
+        self._position_check_interval = min(max(target, floor), config.GROK_POSITION_CHECK_MAX_SECONDS)
+
     def check_positions_with_grok(self):
-        """5-minute Grok monitoring of open positions for exit strategy re-evaluation"""
+        """Adaptive Grok monitoring of open positions for exit strategy re-evaluation"""
         now = datetime.now()
 
-        # Check if 5 minutes have passed since last position check
+        try:
+            positions, positions_by_underlying = self._get_positions_indexed()
+        except Exception as e:
+            logging.error(f"Error in Grok position monitoring: {e}")
+            return
+
+        # Sample P&L on every call, independent of whether a review is due
+        self._record_pnl_moves(positions, now)
+
+        # Interval adapts to how often P&L has been moving; starts at 5 minutes
         should_check = (
             self.last_position_grok_check is None or
-            (now - self.last_position_grok_check).total_seconds() >= 300  # 5 minutes
+            (now - self.last_position_grok_check).total_seconds() >= self._position_check_interval
         )
 
         if not should_check:
             return
 
-        try:
-            positions = self.trading_client.get_all_positions()
+        checks_date, checks_today = self._position_checks_today
+        if checks_date != now.date():
+            checks_today = 0
+        if checks_today >= config.GROK_POSITION_CHECKS_PER_DAY:
+            return
 
+        try:
             if not positions:
                 return
 
             print(f"{Colors.INFO}[GROK MONITOR] Checking {len(positions)} positions for exit signals...{Colors.RESET}")
-            logging.info(f"=== 5-MIN GROK POSITION MONITORING ===")
+            logging.info(f"=== GROK POSITION MONITORING (interval {self._position_check_interval:.0f}s) ===")
+
+            # Extract underlying symbols (remove option suffix if present) - legs of one spread share one
+            underlyings = list(dict.fromkeys(extract_underlying_symbol(pos.symbol) for pos in positions))
+
+            # Quotes download in the background while strategy info is bulk-read from the database on this thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                quotes_future = executor.submit(self._fetch_quotes, underlyings)
+                strategy_infos = self.trade_journal.get_position_strategies(underlyings)  # Omits unknown symbols
+                quotes = quotes_future.result()
 
             # Build position data for Grok with strategy context
             position_data = []
             for pos in positions:
                 symbol = pos.symbol
-                # Extract underlying symbol (remove option suffix if present)
                 underlying = extract_underlying_symbol(symbol)
-
-                # Get strategy info from database
-                strategy_info = self.trade_journal.get_position_strategy(underlying)
+                strategy_info = strategy_infos.get(underlying)
 
                 # Get current quote
-                quote = self.openbb.get_quote(underlying)
+                quote = quotes.get(underlying)
                 if not quote or 'results' not in quote:
                     continue
 
@@ -2512,32 +3281,14 @@ Provide ONLY the formatted lines, one per symbol. No other text."""
                 return
 
             # Ask Grok for exit recommendations with FULL strategy context
-            prompt = f"""You are an expert options trader. Analyze these positions and recommend exit actions.
-
-IMPORTANT: Consider the STRATEGY used for each position when making recommendations.
-- Different strategies have different exit criteria
-- Multi-leg strategies (spreads, straddles) may need both legs managed
-- Some strategies are meant to expire worthless (credit spreads)
-
-POSITIONS:
-"""
+            parts = [_GROK_POSITION_PROMPT_HEADER]
             for i, pos in enumerate(position_data, 1):
-                prompt += f"{i}. {pos['symbol']} | Strategy: {pos['strategy']} | Strikes: {pos['strikes']}\n"
-                prompt += f"   Entry: ${pos['entry_price']:.2f} | Current: ${pos['current_price']:.2f} | P&L: {pos['pnl_pct']:+.1%}\n"
-                prompt += f"   Stock Price: ${pos['stock_price']:.2f} | Original Reason: {pos['entry_reason']}\n"
+                parts.append(_GROK_POSITION_PROMPT_ROW_TMPL.format(idx=i, **pos))
                 if pos['grok_notes']:
-                    prompt += f"   Previous Notes: {pos['grok_notes']}\n"
-                prompt += "\n"
-
-            prompt += """
-For each position, respond with ONE of these actions:
-- HOLD: Keep position open
-- EXIT: Close position immediately
-- TAKE_PROFIT: Exit to lock in gains
-- CUT_LOSS: Exit to prevent further loss
-
-Format: SYMBOL|ACTION|REASON
-Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
+                    parts.append(f"   Previous Notes: {pos['grok_notes']}\n")
+                parts.append("\n")
+            parts.append(_GROK_POSITION_PROMPT_FOOTER)
+            prompt = "".join(parts)
 
             headers = {'Authorization': f'Bearer {config.XAI_API_KEY}', 'Content-Type': 'application/json'}
             payload = {
@@ -2547,69 +3298,62 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
                 'temperature': 0.3
             }
 
+            reviewed_symbols = {pos_info['symbol'] for pos_info in position_data}
+
             # Increased timeout for grok-4-fast model which may take longer
-            response = requests.post(config.XAI_BASE_URL, json=payload, headers=headers, timeout=30)
+            # Pooled keep-alive session - reuses the TLS connection across position reviews
+            response = self.http_session.post(config.XAI_BASE_URL, json=payload, headers=headers, timeout=30)
 
             if response.status_code == 200:
                 content = response.json()['choices'][0]['message']['content']
                 logging.info(f"Grok position analysis:\n{content}")
 
-                # Parse recommendations
-                for line in content.split('\n'):
-                    if '|' in line:
-                        parts = line.split('|')
-                        if len(parts) >= 3:
-                            sym = parts[0].strip()
-                            action = parts[1].strip().upper()
-                            reason = parts[2].strip()
+                # Parse recommendations - one regex sweep over SYMBOL|ACTION|REASON lines
+                for match in _POSITION_REVIEW_LINE_RE.finditer(content):
+                    sym, action, reason = (field.strip() for field in match.groups())
+                    action = action.upper()
 
-                            # Save Grok's analysis notes for all recommendations (especially HOLD for future context)
-                            try:
-                                grok_note = f"{action}: {reason}"
-                                self.trade_journal.update_grok_notes(sym, grok_note)
-                                logging.info(f"Saved Grok notes for {sym}: {grok_note}")
-                            except Exception as e:
-                                logging.warning(f"Could not save Grok notes for {sym}: {e}")
-
-                            if action in ['EXIT', 'TAKE_PROFIT', 'CUT_LOSS']:
-                                # Find matching position
-                                for pos_info in position_data:
-                                    if pos_info['symbol'] == sym:
-                                        print(f"{Colors.WARNING}[GROK EXIT] {sym}: {action} - {reason}{Colors.RESET}")
-                                        logging.info(f"*** GROK RECOMMENDS EXIT: {sym} - {action} - {reason}")
-
-                                        # Get strategy type for this position
-                                        strategy_info = self.trade_journal.get_position_strategy(sym)
-                                        strategy = strategy_info.get('strategy', 'UNKNOWN') if strategy_info else 'UNKNOWN'
-
-                                        # Check if this is a multi-leg spread strategy
-                                        multi_leg_strategies = [
-                                            'BULL_CALL_SPREAD', 'BEAR_PUT_SPREAD',
-                                            'BULL_PUT_SPREAD', 'BEAR_CALL_SPREAD',
-                                            'IRON_CONDOR', 'STRADDLE', 'STRANGLE'
-                                        ]
-
-                                        if strategy in multi_leg_strategies:
-                                            # Close spread atomically using multi-leg order manager
-                                            logging.info(f"Closing {strategy} spread for {sym} atomically")
-                                            result = self.multi_leg_order_manager.close_spread(sym, strategy, positions)
-
-                                            if result['success']:
-                                                logging.info(f"✓ Spread closed successfully: {sym} - {result['legs_closed']} legs @ ${result.get('limit_price', 'N/A')}")
-                                                # Remove from active tracking
-                                                self.trade_journal.remove_active_position(sym)
-                                            else:
-                                                logging.error(f"Failed to close spread {sym}: {result['error']}")
-                                        else:
-                                            # Single-leg position - close individually
-                                            for pos in positions:
-                                                underlying = extract_underlying_symbol(pos.symbol)
-                                                if underlying == sym:
-                                                    self.position_manager._execute_exit(pos, f"GROK_{action}: {reason}")
-                                                    break
-                                        break
+                    # Save Grok's analysis notes for all recommendations (especially HOLD for future context)
+                    try:
+                        grok_note = f"{action}: {reason}"
+                        self.trade_journal.update_grok_notes(sym, grok_note)
+                        logging.info(f"Saved Grok notes for {sym}: {grok_note}")
+                    except Exception as e:
+                        logging.warning(f"Could not save Grok notes for {sym}: {e}")
+
+                    if action in ['EXIT', 'TAKE_PROFIT', 'CUT_LOSS']:
+                        # Find matching position
+                        if sym in reviewed_symbols:
+                            print(f"{Colors.WARNING}[GROK EXIT] {sym}: {action} - {reason}{Colors.RESET}")
+                            logging.info(f"*** GROK RECOMMENDS EXIT: {sym} - {action} - {reason}")
+
+                            # Get strategy type for this position (loaded while building position_data)
+                            strategy_info = strategy_infos.get(sym)
+                            strategy = strategy_info.get('strategy', 'UNKNOWN') if strategy_info else 'UNKNOWN'
+
+                            # Check if this is a multi-leg spread strategy
+                            if strategy in _ATOMIC_CLOSE_STRATEGIES:
+                                # Close spread atomically using multi-leg order manager
+                                logging.info(f"Closing {strategy} spread for {sym} atomically")
+                                result = self.multi_leg_order_manager.close_spread(sym, strategy, positions)
+
+                                if result['success']:
+                                    logging.info(f"✓ Spread closed successfully: {sym} - {result['legs_closed']} legs @ ${result.get('limit_price', 'N/A')}")
+                                    # Remove from active tracking
+                                    self.trade_journal.remove_active_position(sym)
+                                else:
+                                    logging.error(f"Failed to close spread {sym}: {result['error']}")
+                            else:
+                                # Single-leg position - close individually
+                                symbol_positions = positions_by_underlying.get(sym)
+                                if symbol_positions:
+                                    self.position_manager._execute_exit(symbol_positions[0], f"GROK_{action}: {reason}")
+
+                # Exits may have been submitted
+                self._invalidate_broker_state()
 
             self.last_position_grok_check = now
+            self._position_checks_today = (now.date(), checks_today + 1)
 
         except Exception as e:
             logging.error(f"Error in Grok position monitoring: {e}")
@@ -2700,8 +3444,66 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
         # Display portfolio overview after each scan to show position changes
         self.display_portfolio_summary()
 
-    def evaluate_and_execute_trade(self, symbol: str, grok_data: Dict, options_data: List[Dict], scanner_analysis: Dict):
-        """Evaluate trade with full risk management and execute"""
+    def _build_expected_occ_symbols(self, strategy: str, symbol: str, strikes: str, expiry: str,
+                                    is_multi_leg: bool) -> frozenset:
+        """
+        OCC symbols of every leg a Grok trade would open, for exact-duplicate order detection.
+
+        Cached per trading day ("30DTE" expiries resolve against today's date) - the same
+        picks are re-evaluated scan after scan. Empty if the expiry or legs can't be parsed.
+        """
+        cache_key = (strategy, symbol, strikes, expiry, is_multi_leg, datetime.now().date().isoformat())
+        cached = self._occ_symbols_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Convert expiry to date format - handle both "30DTE" and "YYYY-MM-DD" formats
+        try:
+            if 'DTE' in expiry.upper():
+                # Extract days from "30DTE" format
+                days = int(_NON_DIGIT_RE.sub('', expiry))
+                exp_date = datetime.now() + timedelta(days=days)
+            else:
+                # Parse as date string
+                exp_date = _parse_expiration(expiry)
+            exp_str = exp_date.strftime('%y%m%d')
+        except Exception as e:
+            logging.error(f"Failed to parse expiry '{expiry}': {e}")
+            # Skip duplicate check if we can't parse expiry
+            return frozenset()
+
+        expected_occ_symbols = set()
+        if is_multi_leg:
+            # For multi-leg, parse the strikes to get all leg symbols
+            strategy_details = self.multi_leg_manager.parse_multi_leg_strategy(
+                strategy, symbol, strikes, expiry, 0
+            )
+            # Properly check if strategy_details and legs exist and are iterable
+            legs_data = strategy_details.get('legs') if strategy_details else None
+            if legs_data is not None and isinstance(legs_data, list) and len(legs_data) > 0:
+                for leg in legs_data:
+                    # Build OCC symbol: SYMBOL + YYMMDD + C/P + STRIKE (8 digits)
+                    opt_type = 'C' if leg['type'].upper() == 'CALL' else 'P'
+                    strike_str = f"{int(leg['strike'] * 1000):08d}"
+                    expected_occ_symbols.add(f"{symbol}{exp_str}{opt_type}{strike_str}")
+            else:
+                logging.warning(f"Could not parse multi-leg strategy {strategy} for {symbol} - skipping duplicate check")
+        else:
+            # For single-leg, build the single OCC symbol
+            opt_type = 'C' if 'CALL' in strategy.upper() else 'P'
+            strike_value = float(strikes.split('/')[0]) if '/' in strikes else float(strikes)
+            strike_str = f"{int(strike_value * 1000):08d}"
+            expected_occ_symbols.add(f"{symbol}{exp_str}{opt_type}{strike_str}")
+
+        result = frozenset(expected_occ_symbols)
+        if len(self._occ_symbols_cache) >= 1024:
+            self._occ_symbols_cache.clear()  # Drops previous days' entries too
+        self._occ_symbols_cache[cache_key] = result
+        return result
+
+    def evaluate_and_execute_trade(self, symbol: str, grok_data: Dict, options_data: List[Dict], scanner_analysis: Dict,
+                                   iv_prevalidated: bool = False):
+        """Evaluate trade with full risk management and execute (iv_prevalidated: passed validate_batch)"""
         confidence = grok_data.get('grok_confidence', grok_data.get('confidence', 0))
         strategy = grok_data.get('strategy', 'UNKNOWN')
         strikes = grok_data.get('strikes', '')
@@ -2710,8 +3512,19 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
         logging.info(f"=== EVALUATING TRADE: {symbol} ===")
         logging.info(f"Strategy: {strategy} | Confidence: {confidence}% | Strikes: {strikes} | Expiry: {expiry}")
 
+        # Cash gate - with no cash to trade, skip validation, broker and DB work entirely
+        try:
+            account = self._get_account_cached()
+            cash_available = float(account.cash) if account.cash is not None else 0.0
+            if cash_available < config.MIN_TRADE_CASH:
+                print(f"{Colors.WARNING}[SKIP] {symbol}: Cash ${cash_available:,.2f} below minimum ${config.MIN_TRADE_CASH:,.2f}{Colors.RESET}")
+                logging.info(f"[SKIP] {symbol}: Cash ${cash_available:,.2f} < MIN_TRADE_CASH ${config.MIN_TRADE_CASH:,.2f}")
+                return
+        except Exception as e:
+            logging.debug(f"Could not pre-check cash for {symbol}: {e}")  # Layer 4 re-checks the account
+
         # PHASE 3: POST-VALIDATION - Final safety check before execution
-        stock_data = scanner_analysis.get('stock_data', {})
+        stock_data = scanner_analysis.get('stock_data', _EMPTY)
         stock_price = stock_data.get('price', 0)
 
         if stock_price == 0:
@@ -2721,7 +3534,7 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
 
         if stock_price > 0:
             is_valid, rejection_reason = self.post_validate_grok_recommendation(
-                symbol, grok_data, scanner_analysis, stock_price
+                symbol, grok_data, scanner_analysis, stock_price, iv_prevalidated=iv_prevalidated
             )
 
             if not is_valid:
@@ -2730,7 +3543,8 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
                 self.grok_logger.warning(f"POST-VALIDATION REJECTED: {symbol} | {strategy} | {confidence}% | {rejection_reason}")
                 return
             else:
-                print(f"{Colors.SUCCESS}[POST-VALIDATION PASSED] {symbol}: {rejection_reason}{Colors.RESET}")
+                if self.verbose:
+                    print(f"{Colors.SUCCESS}[POST-VALIDATION PASSED] {symbol}: {rejection_reason}{Colors.RESET}")
                 logging.info(f"POST-VALIDATION PASSED: {symbol} | {strategy}")
         else:
             logging.warning(f"{symbol}: Could not get stock price for post-validation, proceeding with caution")
@@ -2744,187 +3558,127 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
 
         # VALIDATION LAYER 0: Duplicate Position/Order Check
 
-        # Define multi-leg strategies that allow multiple positions on same symbol
-        MULTI_LEG_STRATEGIES = ['SPREAD', 'STRADDLE', 'STRANGLE', 'BUTTERFLY', 'CONDOR', 'COLLAR']
-        is_multi_leg = any(strat in strategy.upper() for strat in MULTI_LEG_STRATEGIES)
+        # Multi-leg strategies allow multiple positions on same symbol
+        is_multi_leg = _is_multi_leg_strategy(strategy)
 
         try:
-            # Check for existing positions
-            positions = self.trading_client.get_all_positions()
-
-            # Handle case where get_all_positions returns None
-            if positions is None:
-                positions = []
-
-            existing_positions_count = 0
-
-            for position in positions:
-                # Extract underlying symbol from OCC format or use symbol directly
-                pos_symbol = position.symbol
-                underlying = extract_underlying_symbol(pos_symbol)
-
-                if underlying == symbol or pos_symbol == symbol:
-                    existing_positions_count += 1
-
-                    # For single-leg strategies, skip if we already have a position
-                    if not is_multi_leg:
-                        print(f"{Colors.WARNING}[SKIP] {symbol}: Already have position in this symbol ({pos_symbol}){Colors.RESET}")
-                        logging.info(f"[SKIP] {symbol}: Already have position ({pos_symbol}) and strategy '{strategy}' is not multi-leg")
-                        return
+            # Check for existing positions (stock or options) on this underlying
+            _, positions_by_underlying = self._get_positions_indexed()
+            symbol_positions = positions_by_underlying.get(symbol, ())
+            existing_positions_count = len(symbol_positions)
+
+            # For single-leg strategies, skip if we already have a position
+            if symbol_positions and not is_multi_leg:
+                pos_symbol = symbol_positions[0].symbol
+                print(f"{Colors.WARNING}[SKIP] {symbol}: Already have position in this symbol ({pos_symbol}){Colors.RESET}")
+                logging.info(f"[SKIP] {symbol}: Already have position ({pos_symbol}) and strategy '{strategy}' is not multi-leg")
+                return
 
             # For multi-leg strategies, log that we're allowing multiple positions
             if is_multi_leg and existing_positions_count > 0:
-                print(f"{Colors.INFO}[MULTI-LEG] {symbol}: {strategy} allows multiple positions (existing: {existing_positions_count}){Colors.RESET}")
+                if self.verbose:
+                    print(f"{Colors.INFO}[MULTI-LEG] {symbol}: {strategy} allows multiple positions (existing: {existing_positions_count}){Colors.RESET}")
                 logging.info(f"Multi-leg strategy '{strategy}' - allowing position despite {existing_positions_count} existing position(s)")
 
-            # Check for pending orders on this symbol
-            from alpaca.trading.requests import GetOrdersRequest
-            from alpaca.trading.enums import QueryOrderStatus
-
-            order_filter = GetOrdersRequest(status=QueryOrderStatus.OPEN)
-            orders = self.trading_client.get_orders(filter=order_filter)
-
-            # Handle case where get_orders returns None
-            if orders is None:
-                orders = []
+            # Check for pending orders on this symbol - every expected OCC symbol below shares its underlying
+            _, orders_by_underlying = self._get_open_orders_indexed()
+            orders = orders_by_underlying.get(symbol, ())
 
             # Build a set of expected OCC symbols for this trade to detect exact duplicates
-            expected_occ_symbols = set()
+            expected_occ_symbols = self._build_expected_occ_symbols(strategy, symbol, strikes, expiry, is_multi_leg)
+            if expected_occ_symbols:
+                logging.info(f"Expected OCC symbols: {', '.join(sorted(expected_occ_symbols))}")
+
+            # EXACT DUPLICATE CHECK: an order for the exact same contract is already pending -
+            # skip this trade entirely, before canceling/replacing anything
+            exact_dups = [order for order in orders if order.symbol in expected_occ_symbols]
+            if exact_dups:
+                for order in exact_dups:
+                    print(f"{Colors.WARNING}[DUPLICATE] {symbol}: Exact same order already pending (Order ID: {order.id}, Contract: {order.symbol}){Colors.RESET}")
+                    logging.warning(f"[SKIP] {symbol}: Duplicate order detected - {order.symbol} already pending (Order ID: {order.id})")
+                print(f"{Colors.WARNING}[SKIP] {symbol}: Cannot place order - exact duplicate already exists{Colors.RESET}")
+                logging.info(f"[SKIP] {symbol}: Skipping trade due to duplicate order")
+                return
 
-            # Convert expiry to date format - handle both "30DTE" and "YYYY-MM-DD" formats
-            try:
-                if 'DTE' in expiry.upper():
-                    # Extract days from "30DTE" format
-                    days = int(''.join(filter(str.isdigit, expiry)))
-                    exp_date = datetime.now() + timedelta(days=days)
-                else:
-                    # Parse as date string
-                    exp_date = datetime.strptime(expiry, '%Y-%m-%d')
-                exp_str = exp_date.strftime('%y%m%d')
-            except Exception as e:
-                logging.error(f"Failed to parse expiry '{expiry}': {e}")
-                # Skip duplicate check if we can't parse expiry
-                expected_occ_symbols = set()
-                exp_str = None
-
-            if exp_str:
-                if is_multi_leg:
-                    # For multi-leg, parse the strikes to get all leg symbols
-                    strategy_details = self.multi_leg_manager.parse_multi_leg_strategy(
-                        strategy, symbol, strikes, expiry, 0
-                    )
-                    # Properly check if strategy_details and legs exist and are iterable
-                    legs_data = strategy_details.get('legs') if strategy_details else None
-                    if legs_data is not None and isinstance(legs_data, list) and len(legs_data) > 0:
-                        for leg in legs_data:
-                            # Build OCC symbol: SYMBOL + YYMMDD + C/P + STRIKE (8 digits)
-                            opt_type = 'C' if leg['type'].upper() == 'CALL' else 'P'
-                            strike_str = f"{int(leg['strike'] * 1000):08d}"
-                            occ_symbol = f"{symbol}{exp_str}{opt_type}{strike_str}"
-                            expected_occ_symbols.add(occ_symbol)
-                            logging.info(f"Expected leg OCC symbol: {occ_symbol}")
-                    else:
-                        logging.warning(f"Could not parse multi-leg strategy {strategy} for {symbol} - skipping duplicate check")
-                else:
-                    # For single-leg, build the single OCC symbol
-                    opt_type = 'C' if 'CALL' in strategy.upper() else 'P'
-                    strike_value = float(strikes.split('/')[0]) if '/' in strikes else float(strikes)
-                    strike_str = f"{int(strike_value * 1000):08d}"
-                    occ_symbol = f"{symbol}{exp_str}{opt_type}{strike_str}"
-                    expected_occ_symbols.add(occ_symbol)
-                    logging.info(f"Expected OCC symbol: {occ_symbol}")
-
-            # Check each pending order
-            duplicate_found = False
+            # Remaining pending orders on this underlying
             for order in orders:
-                order_symbol = order.symbol
-                underlying = extract_underlying_symbol(order_symbol)
-
-                # EXACT DUPLICATE CHECK: Check if this order is for the exact same contract
-                if order_symbol in expected_occ_symbols:
-                    duplicate_found = True
-                    print(f"{Colors.WARNING}[DUPLICATE] {symbol}: Exact same order already pending (Order ID: {order.id}, Contract: {order_symbol}){Colors.RESET}")
-                    logging.warning(f"[SKIP] {symbol}: Duplicate order detected - {order_symbol} already pending (Order ID: {order.id})")
-                    # Don't place duplicate - skip this trade entirely
-                    continue
-
-                if underlying == symbol and not duplicate_found:
-                    # For single-leg strategies, cancel and replace with better trade
-                    if not is_multi_leg:
-                        print(f"{Colors.WARNING}[CANCEL] {symbol}: Canceling existing order (ID: {order.id}) for better opportunity{Colors.RESET}")
-                        logging.info(f"Canceling order {order.id} for {symbol} - replacing with {confidence}% confidence trade")
-                        try:
-                            self.trading_client.cancel_order_by_id(order.id)
-                            print(f"{Colors.SUCCESS}  ✓ Order {order.id} canceled{Colors.RESET}")
-                        except Exception as e:
-                            logging.error(f"Failed to cancel order {order.id}: {e}")
-                    else:
-                        # PHASE 2: Multi-leg - use intelligent replacement analysis
-                        # Check if order is part of tracked multi-leg strategy
-                        strategy_id = self.multi_leg_tracker.get_strategy_by_leg_id(order.id)
-                        if strategy_id:
-                            logging.info(f"Found multi-leg order {order.id} - part of strategy {strategy_id}")
-                            strategy_status = self.multi_leg_tracker.get_strategy_status(strategy_id)
-
-                            # PHASE 2: Run intelligent replacement analysis
-                            new_opportunity = {
-                                'symbol': symbol,
-                                'strategy': strategy,
-                                'confidence': confidence,
-                                'strikes': strikes,
-                                'expiry': expiry
-                            }
+                # For single-leg strategies, cancel and replace with better trade
+                if not is_multi_leg:
+                    print(f"{Colors.WARNING}[CANCEL] {symbol}: Canceling existing order (ID: {order.id}) for better opportunity{Colors.RESET}")
+                    logging.info(f"Canceling order {order.id} for {symbol} - replacing with {confidence}% confidence trade")
+                    try:
+                        self.trading_client.cancel_order_by_id(order.id)
+                        self._invalidate_broker_state()
+                        print(f"{Colors.SUCCESS}  ✓ Order {order.id} canceled{Colors.RESET}")
+                    except Exception as e:
+                        logging.error(f"Failed to cancel order {order.id}: {e}")
+                else:
+                    # PHASE 2: Multi-leg - use intelligent replacement analysis
+                    # Check if order is part of tracked multi-leg strategy
+                    strategy_id = self.multi_leg_tracker.get_strategy_by_leg_id(order.id)
+                    if strategy_id:
+                        logging.info(f"Found multi-leg order {order.id} - part of strategy {strategy_id}")
+                        strategy_status = self.multi_leg_tracker.get_strategy_status(strategy_id)
+
+                        # PHASE 2: Run intelligent replacement analysis
+                        new_opportunity = {
+                            'symbol': symbol,
+                            'strategy': strategy,
+                            'confidence': confidence,
+                            'strikes': strikes,
+                            'expiry': expiry
+                        }
 
-                            market_conditions = {
-                                'regime': scanner_analysis.get('regime', 'NEUTRAL'),
-                                'iv_rank': scanner_analysis.get('iv_rank', 50),
-                                'price_change_pct': scanner_analysis.get('price_change_pct', 0),
-                                'avg_bid_ask_spread': scanner_analysis.get('avg_bid_ask_spread', 0.05)
-                            }
+                        market_conditions = {
+                            'regime': scanner_analysis.get('regime', 'NEUTRAL'),
+                            'iv_rank': scanner_analysis.get('iv_rank', 50),
+                            'price_change_pct': scanner_analysis.get('price_change_pct', 0),
+                            'avg_bid_ask_spread': scanner_analysis.get('avg_bid_ask_spread', 0.05)
+                        }
 
-                            # Add confidence to existing strategy status for comparison
-                            existing_strategy = strategy_status.copy() if strategy_status else {}
-                            existing_strategy['confidence'] = existing_strategy.get('confidence', 70)  # Default if unknown
+                        # Existing strategy status with a confidence for comparison - the analyzer only
+                        # reads it, so the tracker's dict is passed as-is when it already has one
+                        strategy_status = strategy_status or {}
+                        if 'confidence' in strategy_status:
+                            existing_strategy = strategy_status
+                        else:
+                            existing_strategy = {**strategy_status, 'confidence': 70}  # Default if unknown
 
-                            # Run Phase 2 analysis
-                            replacement_decision = self.replacement_analyzer.should_replace_order(
-                                existing_strategy,
-                                new_opportunity,
-                                market_conditions
-                            )
+                        # Run Phase 2 analysis
+                        replacement_decision = self.replacement_analyzer.should_replace_order(
+                            existing_strategy,
+                            new_opportunity,
+                            market_conditions
+                        )
 
+                        if self.verbose:
                             print(f"{Colors.INFO}[PHASE 2] Replacement Analysis Score: {replacement_decision['confidence_score']}/100{Colors.RESET}")
 
-                            if replacement_decision['should_replace']:
-                                logging.info(f"PHASE 2 DECISION: Replace existing order (score: {replacement_decision['confidence_score']}/100)")
-                                print(f"{Colors.SUCCESS}[PHASE 2] ✓ Replacement recommended:{Colors.RESET}")
-                                for reason in replacement_decision['reasons'][:3]:  # Show top 3 reasons
-                                    print(f"  • {reason}")
-
-                                # Attempt safe cancellation
-                                cancel_result = self.cancel_multi_leg_order_safely(strategy_id)
-                                if cancel_result['success']:
-                                    print(f"{Colors.SUCCESS}  ✓ Safely cancelled multi-leg strategy {strategy_id}{Colors.RESET}")
-                                elif cancel_result['had_fills']:
-                                    print(f"{Colors.ERROR}  ✗ Cannot cancel {strategy_id} - has filled legs{Colors.RESET}")
-                                    logging.warning(f"Skipping {symbol} - existing multi-leg has fills, cannot replace")
-                                    return  # Don't replace if existing has fills
-                            else:
-                                logging.info(f"PHASE 2 DECISION: Keep existing order (score: {replacement_decision['confidence_score']}/100)")
-                                print(f"{Colors.WARNING}[PHASE 2] ✗ Replacement not recommended:{Colors.RESET}")
-                                for risk in replacement_decision['risk_factors'][:2]:  # Show top 2 risks
-                                    print(f"  • {risk}")
-                                logging.info(f"Skipping {symbol} - Phase 2 analysis recommends keeping existing order")
-                                return  # Don't replace
+                        if replacement_decision['should_replace']:
+                            logging.info(f"PHASE 2 DECISION: Replace existing order (score: {replacement_decision['confidence_score']}/100)")
+                            print(f"{Colors.SUCCESS}[PHASE 2] ✓ Replacement recommended:{Colors.RESET}")
+                            for reason in replacement_decision['reasons'][:3]:  # Show top 3 reasons
+                                print(f"  • {reason}")
+
+                            # Attempt safe cancellation
+                            cancel_result = self.cancel_multi_leg_order_safely(strategy_id)
+                            self._invalidate_broker_state()
+                            if cancel_result['success']:
+                                print(f"{Colors.SUCCESS}  ✓ Safely cancelled multi-leg strategy {strategy_id}{Colors.RESET}")
+                            elif cancel_result['had_fills']:
+                                print(f"{Colors.ERROR}  ✗ Cannot cancel {strategy_id} - has filled legs{Colors.RESET}")
+                                logging.warning(f"Skipping {symbol} - existing multi-leg has fills, cannot replace")
+                                return  # Don't replace if existing has fills
                         else:
-                            # Legacy multi-leg order not in tracker - keep it for safety
-                            logging.info(f"Existing order {order.id} on {symbol} allowed - multi-leg strategy '{strategy}' (not tracked)")
-
-            # If we found an exact duplicate, skip this trade
-            if duplicate_found:
-                print(f"{Colors.WARNING}[SKIP] {symbol}: Cannot place order - exact duplicate already exists{Colors.RESET}")
-                logging.info(f"[SKIP] {symbol}: Skipping trade due to duplicate order")
-                return
+                            logging.info(f"PHASE 2 DECISION: Keep existing order (score: {replacement_decision['confidence_score']}/100)")
+                            print(f"{Colors.WARNING}[PHASE 2] ✗ Replacement not recommended:{Colors.RESET}")
+                            for risk in replacement_decision['risk_factors'][:2]:  # Show top 2 risks
+                                print(f"  • {risk}")
+                            logging.info(f"Skipping {symbol} - Phase 2 analysis recommends keeping existing order")
+                            return  # Don't replace
+                    else:
+                        # Legacy multi-leg order not in tracker - keep it for safety
+                        logging.info(f"Existing order {order.id} on {symbol} allowed - multi-leg strategy '{strategy}' (not tracked)")
 
         except Exception as e:
             logging.error(f"Error checking for duplicate positions/orders: {e}")
@@ -2961,7 +3715,11 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
             iv_metrics = {}
 
         # Get current exposure ONCE
-        exposure = self.portfolio_manager.get_current_exposure()
+        exposure = self._get_exposure_snapshot()
+        # From here on this candidate may place orders - later candidates must see fresh exposure,
+        # positions and open orders
+        self.portfolio_manager.invalidate_exposure()
+        self._invalidate_broker_state()
 
         # Calculate optimal position size
         position_size_pct = self.portfolio_manager.calculate_optimal_position_size(confidence, exposure)
@@ -2988,7 +3746,7 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
 
         # VALIDATION LAYER 4: Account Balance & Options Buying Power Check
         try:
-            account = self.trading_client.get_account()
+            account = self._get_account_cached()
             total_equity = float(account.equity) if account.equity is not None else 0.0
             buying_power = float(account.buying_power) if account.buying_power is not None else 0.0
             options_bp = float(account.options_buying_power) if hasattr(account, 'options_buying_power') and account.options_buying_power is not None else buying_power
@@ -3029,11 +3787,14 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
 
         # Display trade decision
         print(f"{Colors.SUCCESS}[APPROVED] {symbol}: {strategy}{Colors.RESET}")
-        print(f"  Confidence: {confidence}%")
-        print(f"  Position Size: {position_size_pct:.1%}")
-        print(f"  IV Rank: {iv_rank:.0f}")
-        print(f"  Earnings Risk: {earnings_check['risk']}")
-        print(f"  Portfolio Allocated: {exposure['total_allocated']:.1%}")
+        if self.verbose:
+            sys.stdout.write(
+                f"  Confidence: {confidence}%\n"
+                f"  Position Size: {position_size_pct:.1%}\n"
+                f"  IV Rank: {iv_rank:.0f}\n"
+                f"  Earnings Risk: {earnings_check['risk']}\n"
+                f"  Portfolio Allocated: {exposure['total_allocated']:.1%}\n"
+            )
 
         logging.info(f"*** [APPROVED] {symbol}: {strategy} | Confidence: {confidence}% | Position Size: {position_size_pct:.1%} | IV Rank: {iv_rank:.0f}")
 
@@ -3900,10 +4661,10 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
             logging.info(f"Validating Grok strategy: {strategy} for {symbol}")
 
             # Get current market context
-            current_price = grok_data.get('stock_data', {}).get('price', 0)
+            current_price = grok_data.get('stock_data', _EMPTY).get('price', 0)
             scanner_signals = scanner_analysis.get('signals', [])
             pcr = scanner_analysis.get('put_call_ratio', 1.0)
-            iv_rank = scanner_analysis.get('iv_metrics', {}).get('iv_rank', 50)
+            iv_rank = scanner_analysis.get('iv_metrics', _EMPTY).get('iv_rank', 50)
 
             strikes = grok_data.get('strikes', '')
             expiry = grok_data.get('expiry', '30DTE')
@@ -3983,8 +4744,8 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
                     logging.debug(f"Call-based strategy {strategy} in put-dominant environment (PCR: {pcr})")
 
             # VALIDATION 6: Market regime check
-            regime = self.regime_analyzer.analyze_market_regime()
-            regime_bias = regime.get('implications', {}).get('bias', 'neutral')
+            regime = self._memo('regime', self.regime_analyzer.analyze_market_regime)
+            regime_bias = regime.get('implications', _EMPTY).get('bias', 'neutral')
 
             # Check regime alignment
             if 'BULL' in strategy.upper() and regime_bias == 'bearish':
@@ -3994,7 +4755,7 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
 
             # For volatility plays, high volatility is good
             if 'STRADDLE' in strategy.upper() or 'STRANGLE' in strategy.upper():
-                volatility_regime = regime.get('implications', {}).get('vol_play', 'neutral')
+                volatility_regime = regime.get('implications', _EMPTY).get('vol_play', 'neutral')
                 if volatility_regime == 'buy_straddles':
                     logging.info(f"Straddle/Strangle strategy perfectly aligned with market regime")
 
@@ -4808,7 +5569,7 @@ Example: AAPL|EXIT|Stock momentum reversed, exit signal"""
         """
         try:
             expiration_str = position['expiration']
-            expiration_date = datetime.strptime(expiration_str, '%Y-%m-%d')
+            expiration_date = _parse_expiration(expiration_str)
             dte = (expiration_date - datetime.now()).days
             return max(0, dte)
         except Exception as e:
@@ -4,9 +4,13 @@ OpenBB API Server - Server Management and Health Checking
 Manages the OpenBB REST API server:
 - Server status checking with retries
 - Server health validation
+- Non-blocking (asyncio) health polling with exponential backoff
 """
 
+import asyncio
+import logging
 import time
+import aiohttp
 import requests
 
 
@@ -30,3 +34,28 @@ class OpenBBAPIServer:
                 if attempt < retries - 1:
                     time.sleep(wait)
         return False
+
+    async def wait_until_running_async(self, delays=(0.5, 1, 2, 4, 8, 8)) -> bool:
+        """
+        Poll the API server without blocking the event loop.
+
+        Checks once, then again after each backoff delay, so other startup
+        work (e.g. Alpaca account checks) can overlap with a cold OpenBB start.
+        """
+        url = f'http://{self.host}:{self.port}/'
+        timeout = aiohttp.ClientTimeout(total=2)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            for attempt, delay in enumerate((0,) + tuple(delays)):
+                if delay:
+                    logging.info(f"OpenBB API not ready (attempt {attempt}/{len(delays)}), retrying in {delay}s")
+                    await asyncio.sleep(delay)
+                try:
+                    async with session.get(url) as response:
+                        if response.status in (200, 404):
+                            self.running = True
+                            return True
+                except Exception:
+                    pass
+
+        return False
@@ -4,13 +4,15 @@ Determines when scans should run and when market is open/closed.
 """
 import datetime
 from typing import Tuple, Optional
-import pytz
+from zoneinfo import ZoneInfo
+
+EASTERN = ZoneInfo('America/New_York')
 
 class MarketCalendar:
     """US Stock Market Calendar with Holiday Awareness"""
 
     def __init__(self):
-        self.eastern = pytz.timezone('US/Eastern')
+        self.eastern = EASTERN
         self.holidays = [
             '2025-01-01', '2025-01-20', '2025-02-17', '2025-04-18',
             '2025-05-26', '2025-06-19', '2025-07-04', '2025-09-01',
@@ -4,7 +4,7 @@ Enables faster testing and avoids redundant API calls.
 """
 import json
 import os
-from typing import Optional, Dict
+from typing import Collection, Optional, Dict
 import datetime
 
 class ScanResultCache:
@@ -13,8 +13,8 @@ class ScanResultCache:
     def __init__(self, cache_file='scan_results.json'):
         self.cache_file = cache_file
 
-    def save_scan(self, opportunities: list, scan_type: str):
-        """Save scan results to disk"""
+    def save_scan(self, opportunities: Collection[Dict], scan_type: str):
+        """Save scan results to disk (any sized collection - lists and deques are read in place, not copied)"""
         try:
             # Ensure logs directory exists
             os.makedirs('logs', exist_ok=True)
@@ -101,6 +101,17 @@ class TradeJournal:
             )
         """)
 
+        # Daily realized-volatility cache (closes only change once per trading day)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS historical_volatility (
+                symbol TEXT NOT NULL,
+                trade_date TEXT NOT NULL,
+                days INTEGER NOT NULL,
+                hv REAL NOT NULL,
+                PRIMARY KEY (symbol, trade_date, days)
+            )
+        """)
+
         self.conn.commit()
 
     def log_trade(self, trade_data: Dict) -> int:
@@ -176,6 +187,35 @@ class TradeJournal:
         except Exception as e:
             print(f"[ERROR] Failed to track active position: {e}")
 
+    def track_active_positions_bulk(self, positions: List[Dict]):
+        """Track many active positions in one transaction (single commit instead of one per row)"""
+        if not positions:
+            return
+
+        entry_timestamp = datetime.datetime.now().isoformat()
+        try:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO active_positions (
+                    symbol, occ_symbol, strategy, entry_timestamp, entry_price,
+                    quantity, confidence, strikes, expiry, reason
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(
+                position_data.get('symbol'),
+                position_data.get('occ_symbol'),
+                position_data.get('strategy'),
+                entry_timestamp,
+                position_data.get('entry_price'),
+                position_data.get('quantity'),
+                position_data.get('confidence'),
+                position_data.get('strikes'),
+                position_data.get('expiry'),
+                position_data.get('reason')
+            ) for position_data in positions])
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            print(f"[ERROR] Failed to track active positions: {e}")
+
     def get_position_strategy(self, symbol: str) -> Optional[Dict]:
         """Get strategy info for an active position"""
         # Try multiple ways to match the symbol
@@ -207,6 +247,78 @@ class TradeJournal:
 
         return None
 
+    def get_position_strategies(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Bulk version of get_position_strategy - one query for many symbols.
+
+        Applies the same match priority per symbol (symbol, then occ_symbol,
+        then occ_symbol prefix) and omits symbols with no strategy.
+        """
+        wanted = set(symbols)
+        if not wanted:
+            return {}
+
+        try:
+            # active_positions only holds open positions, so one ordered scan beats N lookups
+            cursor = self.conn.execute("""
+                SELECT symbol, occ_symbol, strategy, entry_timestamp, confidence, strikes, expiry, reason, grok_notes
+                FROM active_positions
+                ORDER BY entry_timestamp DESC
+            """)
+            rows = cursor.fetchall()
+        except Exception as e:
+            print(f"[ERROR] Failed to bulk fetch position strategies: {e}")
+            return {}
+
+        by_symbol = {}
+        by_occ = {}
+        for row in rows:
+            by_symbol.setdefault(row[0], row)
+            if row[1]:
+                by_occ.setdefault(row[1], row)
+
+        strategies = {}
+        for symbol in wanted:
+            row = by_symbol.get(symbol) or by_occ.get(symbol)
+            if row is None:
+                prefix = symbol.upper()
+                row = next((r for r in rows if r[1] and r[1].upper().startswith(prefix)), None)
+            if row:
+                strategies[symbol] = {
+                    'strategy': row[2],
+                    'entry_timestamp': row[3],
+                    'confidence': row[4],
+                    'strikes': row[5],
+                    'expiry': row[6],
+                    'reason': row[7],
+                    'grok_notes': row[8]
+                }
+
+        return strategies
+
+    def get_cached_volatility(self, symbol: str, days: int, trade_date: str) -> Optional[float]:
+        """Get historical volatility already computed for symbol on trade_date (YYYY-MM-DD)"""
+        try:
+            row = self.conn.execute(
+                "SELECT hv FROM historical_volatility WHERE symbol = ? AND trade_date = ? AND days = ?",
+                (symbol, trade_date, days)
+            ).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            print(f"[ERROR] Failed to read cached volatility: {e}")
+            return None
+
+    def save_volatility(self, symbol: str, days: int, trade_date: str, hv: float):
+        """Store historical volatility for symbol on trade_date (YYYY-MM-DD)"""
+        try:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO historical_volatility (symbol, trade_date, days, hv) VALUES (?, ?, ?, ?)",
+                (symbol, trade_date, days, hv)
+            )
+            self.conn.commit()
+        except Exception as e:
+            print(f"[ERROR] Failed to cache volatility: {e}")
+
     def remove_active_position(self, symbol: str):
         """Remove position from active tracking when closed"""
         try:
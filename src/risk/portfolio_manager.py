@@ -43,6 +43,10 @@ class PortfolioManager:
         self.MAX_PORTFOLIO_DELTA = 100  # Max net delta exposure
         self.MAX_PORTFOLIO_THETA = -500  # Max daily theta decay ($)
 
+        # Bumped whenever positions/orders may have changed - callers caching
+        # get_current_exposure() snapshots compare against it
+        self.exposure_version = 0
+
         # Sector mappings
         self.sectors = {
             'SPY': 'BROAD_MARKET', 'QQQ': 'TECH', 'IWM': 'SMALL_CAP',
@@ -56,6 +60,10 @@ class PortfolioManager:
             'COP': 'ENERGY', 'BA': 'INDUSTRIAL', 'CAT': 'INDUSTRIAL'
         }
 
+    def invalidate_exposure(self):
+        """Mark cached exposure snapshots stale (call when an order may be placed or a position changes)"""
+        self.exposure_version += 1
+
     def get_current_exposure(self) -> Dict:
         """Calculate current portfolio exposure including Greeks and pending orders"""
         try:
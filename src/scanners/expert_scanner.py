@@ -624,7 +624,7 @@ class ExpertMarketScanner:
                             options_data = chain['results']
                             ivs = [opt.get('implied_volatility', 0) for opt in options_data[:20] if opt.get('implied_volatility')]
                             if ivs:
-                                avg_iv = statistics.mean(ivs)
+                                avg_iv = sum(ivs) / len(ivs)
                                 iv_metrics = self.iv_analyzer.calculate_iv_metrics(symbol, avg_iv, options_data)
                                 iv_rank = iv_metrics.get('iv_rank', 50)
 
@@ -1456,7 +1456,7 @@ class ExpertMarketScanner:
         gammas = [opt.get('gamma', 0) for opt in options_data[:50] if opt.get('gamma')]
 
         if gammas:
-            avg_gamma = statistics.mean(gammas)
+            avg_gamma = sum(gammas) / len(gammas)
             if avg_gamma > 0.05:  # High gamma = explosive moves possible
                 score += 20
                 signals.append("HIGH_GAMMA")
@@ -1464,7 +1464,7 @@ class ExpertMarketScanner:
         # 3. IV ANALYSIS
         ivs = [opt.get('implied_volatility', 0) for opt in options_data[:50] if opt.get('implied_volatility')]
         if ivs:
-            avg_iv = statistics.mean(ivs)
+            avg_iv = sum(ivs) / len(ivs)
             # Pass options_chain to avoid duplicate API call
             iv_metrics = self.iv_analyzer.calculate_iv_metrics(symbol, avg_iv, options_chain_for_iv or options_data)
 
@@ -1569,7 +1569,6 @@ class ExpertMarketScanner:
         # TIER 2.3: IV SKEW ANALYSIS
         if price > 0 and calls and puts:
             try:
-                import statistics as stats
                 # OTM calls: 5-15% above current price
                 otm_calls = [opt for opt in calls
                             if opt.get('strike', 0) > 0 and
@@ -1582,8 +1581,8 @@ class ExpertMarketScanner:
                            opt.get('implied_volatility', 0) > 0]
 
                 if otm_calls and otm_puts:
-                    call_iv_avg = stats.mean([opt.get('implied_volatility', 0) for opt in otm_calls])
-                    put_iv_avg = stats.mean([opt.get('implied_volatility', 0) for opt in otm_puts])
+                    call_iv_avg = sum(opt.get('implied_volatility', 0) for opt in otm_calls) / len(otm_calls)
+                    put_iv_avg = sum(opt.get('implied_volatility', 0) for opt in otm_puts) / len(otm_puts)
                     iv_skew = put_iv_avg - call_iv_avg
 
                     # Score based on skew
@@ -1621,7 +1620,7 @@ class ExpertMarketScanner:
                         atm_spreads.append(spread_pct)
 
             if atm_spreads:
-                avg_spread_pct = statistics.mean(atm_spreads)
+                avg_spread_pct = sum(atm_spreads) / len(atm_spreads)
 
                 # QUALITY GATE: Wide spreads are a major red flag
                 if avg_spread_pct > 0.25:  # >25% spread = very illiquid
@@ -2024,8 +2023,6 @@ class ExpertMarketScanner:
         if not options_chain or not stock_price or stock_price <= 0:
             return 0.0
 
-        import statistics
-
         # Find ATM options (strike within 5% of stock price)
         atm_options = [
             opt for opt in options_chain
@@ -2043,7 +2040,7 @@ class ExpertMarketScanner:
 
         if atm_options:
             ivs = [opt['implied_volatility'] for opt in atm_options]
-            return statistics.mean(ivs)
+            return sum(ivs) / len(ivs)
 
         return 0.0
 
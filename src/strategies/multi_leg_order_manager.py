@@ -10,6 +10,7 @@ Manages complex multi-leg order operations:
 
 import logging
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from alpaca.trading.enums import OrderSide, OrderType, TimeInForce
@@ -259,15 +260,28 @@ class MultiLegOrderManager:
             cancelled_count = 0
             failed_cancellations = []
 
-            for order_id in unfilled_leg_ids:
+            # Send every leg's cancel at once (Alpaca's bulk cancel_orders() would cancel the
+            # whole account's orders); tracker updates stay on this thread
+            def cancel_leg(order_id):
                 try:
                     self.trading_client.cancel_order_by_id(order_id)
+                    return None
+                except Exception as e:
+                    return e
+
+            errors = []
+            if unfilled_leg_ids:
+                with ThreadPoolExecutor(max_workers=len(unfilled_leg_ids)) as executor:
+                    errors = list(executor.map(cancel_leg, unfilled_leg_ids))
+
+            for order_id, error in zip(unfilled_leg_ids, errors):
+                if error is None:
                     self.multi_leg_tracker.update_leg_status(strategy_id, order_id, 'CANCELLED')
                     cancelled_count += 1
                     logging.info(f"Cancelled leg order {order_id} from strategy {strategy_id}")
-                except Exception as e:
+                else:
                     failed_cancellations.append(order_id)
-                    logging.error(f"Failed to cancel leg order {order_id}: {e}")
+                    logging.error(f"Failed to cancel leg order {order_id}: {error}")
 
             result['success'] = cancelled_count > 0
             result['cancelled_legs'] = cancelled_count
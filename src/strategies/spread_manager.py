@@ -246,6 +246,34 @@ class SpreadManager:
 
         self.conn.commit()
 
+    def update_spread_values(self, updates: List[tuple]):
+        """
+        Bulk version of update_spread_value - one transaction for many spreads.
+
+        Args:
+            updates: (spread_id, current_value) pairs
+        """
+        if not updates:
+            return
+
+        now = datetime.now().isoformat()
+        try:
+            # P&L is derived in SQL from each row's own credit/max profit (no per-spread SELECT)
+            self.conn.executemany("""
+                UPDATE spread_positions
+                SET current_value = ?,
+                    unrealized_pnl = (total_credit - ?) * 100,
+                    unrealized_pnl_pct = CASE WHEN max_profit > 0
+                                              THEN (total_credit - ?) * 100 / max_profit * 100
+                                              ELSE 0 END,
+                    updated_at = ?
+                WHERE id = ?
+            """, [(value, value, value, now, spread_id) for spread_id, value in updates])
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logging.error(f"[SPREAD] Failed to update spread values: {e}")
+
     def close_spread_position(self, spread_id: int, exit_price: float, exit_reason: str):
         """Close a spread position and record P&L"""
         now = datetime.now().isoformat()
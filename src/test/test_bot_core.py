@@ -0,0 +1,39 @@
+"""
+Unit tests for OptionsBot pre-Grok candidate filtering
+"""
+import pytest
+import logging
+
+bot_core = pytest.importorskip('src.bot_core')
+OptionsBot = bot_core.OptionsBot
+
+
+@pytest.fixture
+def bot():
+    """OptionsBot without __init__ (no broker/OpenBB connections) - tests set the state they need"""
+    bot = OptionsBot.__new__(OptionsBot)
+    bot.grok_logger = logging.getLogger('grok.test')
+    return bot
+
+
+class TestQualityGateFastPath:
+    """The small-slate fast path must apply the same source-diversity cap as the full path"""
+
+    def test_fast_path_applies_correlation_filter(self, bot):
+        # 32 candidates for 30 slots -> fast path; the 8 best all come from one source
+        candidates = [
+            {'symbol': f'S{i}', 'final_score': 100 - i,
+             'stock_data': {'source': 'unusual_volume' if i < 8 else f'source_{i}'}}
+            for i in range(32)
+        ]
+
+        filtered = bot._apply_pre_grok_quality_gate(candidates, target_count=30)
+
+        sources = [c['stock_data']['source'] for c in filtered]
+        assert sources.count('unusual_volume') == 5
+        assert len(filtered) == 27
+        assert 'quality_score' not in filtered[0]  # Multi-factor scoring was skipped
+
+    def test_slate_at_target_is_unchanged(self, bot):
+        candidates = [{'symbol': f'S{i}', 'final_score': i} for i in range(30)]
+        assert bot._apply_pre_grok_quality_gate(candidates, target_count=30) is candidates
@@ -0,0 +1,75 @@
+"""
+Unit tests for parsing Grok batch replies (streamed line by line)
+"""
+import pytest
+import logging
+
+bot_core = pytest.importorskip('src.bot_core')
+OptionsBot = bot_core.OptionsBot
+
+
+@pytest.fixture
+def bot():
+    """OptionsBot without __init__ (no broker/OpenBB connections) - tests set the state they need"""
+    bot = OptionsBot.__new__(OptionsBot)
+    bot.grok_logger = logging.getLogger('grok.test')
+    return bot
+
+
+class TestRateBatchLine:
+    """Streaming Grok batch-reply parsing"""
+
+    @pytest.fixture(autouse=True)
+    def _accept_responses(self, monkeypatch):
+        # Parsing is under test here, not response validation
+        monkeypatch.setattr(bot_core, 'validate_grok_response', lambda *args: (True, "Valid"))
+
+    def test_rates_matching_candidate(self, bot):
+        lookup = {'AAPL': {'symbol': 'AAPL'}}
+        rated = {}
+
+        bot._rate_batch_line('AAPL|BULL PUT SPREAD|180/175|2026-11-20|85%|Strong support at 175', lookup, rated)
+
+        candidate = rated['AAPL']
+        assert candidate is lookup['AAPL']
+        assert candidate['grok_confidence'] == 85
+        assert candidate['strategy'] == 'BULL PUT SPREAD'
+        assert candidate['strikes'] == '180/175'
+        assert candidate['expiry'] == '2026-11-20'
+        assert candidate['reason'] == 'Strong support at 175'
+        assert candidate['strategy_class'].is_credit_spread
+
+    def test_reason_is_optional(self, bot):
+        lookup = {'MSFT': {'symbol': 'MSFT'}}
+        rated = {}
+        bot._rate_batch_line('MSFT|LONG CALL|400|2026-11-20|70', lookup, rated)
+        assert rated['MSFT']['grok_confidence'] == 70
+        assert rated['MSFT']['reason'] == ''
+
+    def test_repeated_line_updates_without_duplicating(self, bot):
+        lookup = {'AAPL': {'symbol': 'AAPL'}}
+        rated = {}
+        bot._rate_batch_line('AAPL|BULL PUT SPREAD|180/175|2026-11-20|60|first', lookup, rated)
+        bot._rate_batch_line('AAPL|BULL PUT SPREAD|180/175|2026-11-20|90|second', lookup, rated)
+        assert list(rated) == ['AAPL']
+        assert rated['AAPL']['grok_confidence'] == 90
+
+    def test_ignores_unknown_symbols_and_malformed_lines(self, bot):
+        lookup = {'AAPL': {'symbol': 'AAPL'}}
+        rated = {}
+        bot._rate_batch_line('TSLA|LONG CALL|250|2026-11-20|90|not in batch', lookup, rated)
+        bot._rate_batch_line('Here are my recommendations:', lookup, rated)
+        bot._rate_batch_line('AAPL|BULL PUT SPREAD|180/175', lookup, rated)
+        assert rated == {}
+
+    def test_finish_fills_defaults_for_skipped_symbols(self, bot):
+        lookup = {'AAPL': {'symbol': 'AAPL'}, 'MSFT': {'symbol': 'MSFT', 'strategy_class': object()}}
+        rated = {}
+        bot._rate_batch_line('AAPL|BULL PUT SPREAD|180/175|2026-11-20|85|ok', lookup, rated)
+
+        results = bot._finish_batch_ratings(rated, lookup)
+
+        assert [c['symbol'] for c in results] == ['AAPL', 'MSFT']
+        assert results[1]['grok_confidence'] == 0
+        assert results[1]['strategy'] == 'UNKNOWN'
+        assert 'strategy_class' not in results[1]
@@ -0,0 +1,109 @@
+"""
+Unit tests for the OpenBB client's opt-in quote/options-chain TTL cache
+"""
+import pytest
+
+openbb_client = pytest.importorskip('src.analyzers.openbb_client')
+TTLCache = openbb_client.TTLCache
+OpenBBClient = openbb_client.OpenBBClient
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for TTL expiry"""
+    now = [1000.0]
+    monkeypatch.setattr(openbb_client.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client whose network layer returns a new quote per request and counts the calls"""
+    client = OpenBBClient()
+    client.requests = []
+
+    def fake_quote(symbol):
+        client.requests.append(symbol)
+        return {'results': [{'symbol': symbol, 'last_price': 100.0 + len(client.requests)}]}
+
+    monkeypatch.setattr(client, '_raw_get_quote', fake_quote)
+    return client
+
+
+class TestTTLCache:
+    """TTLCache expiry, size bound and copy semantics"""
+
+    def test_expires_after_ttl(self, clock):
+        cache = TTLCache(ttl=30)
+        cache.set('AAPL', {'price': 1})
+        clock[0] += 29
+        assert cache.get('AAPL') == {'price': 1}
+        clock[0] += 2
+        assert cache.get('AAPL') is None
+
+    def test_none_is_not_cached(self, clock):
+        cache = TTLCache(ttl=30)
+        cache.set('AAPL', None)
+        assert len(cache) == 0
+
+    def test_values_are_copied_in_and_out(self, clock):
+        cache = TTLCache(ttl=30)
+        quote = {'results': [{'price': 1}]}
+        cache.set('AAPL', quote)
+
+        quote['results'][0]['price'] = 2  # Caller mutates what it stored
+        first = cache.get('AAPL')
+        first['results'][0]['price'] = 3  # Caller mutates what it read
+
+        assert cache.get('AAPL') == {'results': [{'price': 1}]}
+
+    def test_evicts_when_full(self, clock):
+        cache = TTLCache(ttl=30, maxsize=2)
+        cache.set('A', 1)
+        cache.set('B', 2)
+        cache.set('C', 3)
+        assert len(cache) == 2
+        assert cache.get('A') is None
+        assert cache.get('C') == 3
+
+
+class TestClientCaching:
+    """Fresh by default; only cached=True callers may see a TTL-old value"""
+
+    def test_get_quote_is_fresh_by_default(self, client, clock):
+        first = client.get_quote('AAPL')
+        second = client.get_quote('AAPL')
+        assert client.requests == ['AAPL', 'AAPL']
+        assert first != second
+
+    def test_cached_get_quote_reuses_recent_fetch(self, client, clock):
+        fresh = client.get_quote('AAPL')  # Fresh fetches still fill the cache
+        assert client.get_quote('AAPL', cached=True) == fresh
+        assert client.requests == ['AAPL']
+
+        clock[0] += client.quote_cache.ttl + 1
+        client.get_quote('AAPL', cached=True)
+        assert client.requests == ['AAPL', 'AAPL']
+
+    def test_cached_quote_is_a_copy(self, client, clock):
+        client.get_quote('AAPL')
+        client.get_quote('AAPL', cached=True)['results'][0]['last_price'] = 0
+        assert client.get_quote('AAPL', cached=True)['results'][0]['last_price'] == 101.0
+
+    def test_cached_get_quotes_skips_network_for_cached_symbols(self, client, clock):
+        client.get_quote('AAPL')
+        quotes = client.get_quotes(['AAPL'], cached=True)
+        assert quotes['AAPL']['results'][0]['last_price'] == 101.0
+        assert client.requests == ['AAPL']
+
+    def test_options_chain_is_fresh_by_default(self, client, clock, monkeypatch):
+        calls = []
+        monkeypatch.setattr(client, '_handle_request', lambda *args, **kwargs: calls.append(args) or {'results': []})
+        monkeypatch.setattr(openbb_client.time, 'sleep', lambda seconds: None)
+
+        client.get_options_chains('AAPL')
+        client.get_options_chains('AAPL')
+        assert len(calls) == 2
+
+        client.get_options_chains('AAPL', cached=True)
+        assert len(calls) == 2
@@ -0,0 +1,81 @@
+"""
+Unit tests for the adaptive Grok position-review schedule
+"""
+import pytest
+import logging
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+bot_core = pytest.importorskip('src.bot_core')
+OptionsBot = bot_core.OptionsBot
+
+
+@pytest.fixture
+def bot():
+    """OptionsBot without __init__ (no broker/OpenBB connections) - tests set the state they need"""
+    bot = OptionsBot.__new__(OptionsBot)
+    bot.grok_logger = logging.getLogger('grok.test')
+    return bot
+
+
+class TestPnlMoveScheduler:
+    """Adaptive position-review interval from gaps between meaningful P&L moves"""
+
+    @pytest.fixture(autouse=True)
+    def _scheduler_state(self, bot, monkeypatch):
+        monkeypatch.setattr(bot_core.config, 'GROK_PNL_MOVE_THRESHOLD', 0.05)
+        monkeypatch.setattr(bot_core.config, 'GROK_POSITION_CHECK_MIN_SECONDS', 60)
+        monkeypatch.setattr(bot_core.config, 'GROK_POSITION_CHECK_MAX_SECONDS', 900)
+        monkeypatch.setattr(bot_core.config, 'GROK_POSITION_CHECKS_PER_DAY', 1000)
+        bot._pnl_move_gaps = bot_core.deque(maxlen=50)
+        bot._last_pnl_snapshot = {}
+        bot._last_pnl_move_time = None
+        bot._position_check_interval = 300
+
+    @staticmethod
+    def _positions(pnl):
+        return [SimpleNamespace(symbol='AAPL261120P00175000', unrealized_plpc=pnl)]
+
+    def test_no_history_keeps_default_interval(self, bot):
+        bot._record_pnl_moves(self._positions(0.0), datetime(2026, 10, 15, 10, 0))
+        assert bot._position_check_interval == 300
+        assert not bot._pnl_move_gaps
+
+    def test_gaps_shorter_than_review_interval_shrink_it(self, bot):
+        start = datetime(2026, 10, 15, 10, 0)
+        for step in range(5):  # A 6-point move every 100s, sampled every call
+            bot._record_pnl_moves(self._positions(0.06 * step), start + timedelta(seconds=100 * step))
+
+        assert list(bot._pnl_move_gaps) == [100.0, 100.0, 100.0]
+        assert bot._position_check_interval == 60  # half of 100s, clamped to the minimum
+
+    def test_slow_drift_counts_from_last_move(self, bot):
+        start = datetime(2026, 10, 15, 10, 0)
+        bot._record_pnl_moves(self._positions(0.00), start)
+        bot._record_pnl_moves(self._positions(0.03), start + timedelta(seconds=60))
+        assert bot._last_pnl_move_time is None  # 3 points from the anchor - not a move yet
+
+        bot._record_pnl_moves(self._positions(0.06), start + timedelta(seconds=120))
+        assert bot._last_pnl_move_time == start + timedelta(seconds=120)
+
+    def test_quiet_positions_back_off_to_maximum(self, bot):
+        start = datetime(2026, 10, 15, 10, 0)
+        for step in range(5):  # One move per hour
+            bot._record_pnl_moves(self._positions(0.06 * step), start + timedelta(hours=step))
+        assert bot._position_check_interval == 900
+
+    def test_daily_budget_sets_the_floor(self, bot, monkeypatch):
+        monkeypatch.setattr(bot_core.config, 'GROK_POSITION_CHECKS_PER_DAY', 39)  # 23400s / 39 = 600s
+        start = datetime(2026, 10, 15, 10, 0)
+        for step in range(5):
+            bot._record_pnl_moves(self._positions(0.06 * step), start + timedelta(seconds=100 * step))
+        assert bot._position_check_interval == 600
+
+    def test_check_samples_pnl_even_when_review_not_due(self, bot):
+        positions = self._positions(0.02)
+        bot._get_positions_indexed = lambda: (positions, {})
+        bot.last_position_grok_check = datetime.now()  # Just reviewed - not due
+
+        bot.check_positions_with_grok()
+
+        assert bot._last_pnl_snapshot == {'AAPL261120P00175000': 0.02}
@@ -0,0 +1,96 @@
+"""
+Unit tests for Grok post-validation (batch pre-check and per-candidate rules)
+"""
+import pytest
+import logging
+
+bot_core = pytest.importorskip('src.bot_core')
+OptionsBot = bot_core.OptionsBot
+
+
+@pytest.fixture
+def bot(monkeypatch):
+    """OptionsBot without __init__ (no broker/OpenBB connections), paper mode, no current exposure"""
+    monkeypatch.setattr(bot_core.config, 'ALPACA_MODE', 'paper')
+    bot = OptionsBot.__new__(OptionsBot)
+    bot.grok_logger = logging.getLogger('grok.test')
+    bot._get_exposure_snapshot = lambda: {}
+    return bot
+
+
+def _candidate(symbol, strategy='BULL PUT SPREAD', iv_rank=50, **extra):
+    candidate = {
+        'symbol': symbol,
+        'strategy': strategy,
+        'grok_confidence': 80,
+        'strikes': '',
+        'analysis': {'iv_metrics': {'iv_rank': iv_rank}},
+    }
+    candidate.update(extra)
+    return candidate
+
+
+class TestValidateBatch:
+    """validate_batch must agree with post_validate_grok_recommendation and not re-run its rules"""
+
+    CASES = [
+        ('BULL PUT SPREAD', 75), ('BULL PUT SPREAD', 40),    # credit spread
+        ('BULL CALL SPREAD', 20), ('BULL CALL SPREAD', 55),  # debit spread
+        ('LONG CALL', 20), ('LONG CALL', 45),                # single leg
+        ('LONG STRADDLE', 30), ('LONG STRADDLE', 65),        # long volatility
+        ('SHORT STRANGLE', 80), ('SHORT STRANGLE', 50),      # short volatility
+        ('IRON CONDOR', 80),
+    ]
+
+    @pytest.mark.parametrize('strategy,iv_rank', CASES)
+    def test_matches_post_validation(self, bot, strategy, iv_rank):
+        candidate = _candidate('AAPL', strategy, iv_rank)
+
+        [(batch_ok, batch_reason)] = bot.validate_batch([candidate])
+        single_ok, single_reason = bot.post_validate_grok_recommendation(
+            'AAPL', candidate, candidate['analysis'], 150.0
+        )
+
+        assert batch_ok == single_ok
+        if not single_ok:
+            assert batch_reason == single_reason
+
+    def test_iron_condor_rejected_in_paper_mode(self, bot):
+        [(ok, reason)] = bot.validate_batch([_candidate('SPY', 'IRON CONDOR', 80)])
+        assert not ok
+        assert 'Iron Condor' in reason
+
+    def test_does_not_mutate_candidates(self, bot):
+        candidate = _candidate('AAPL', 'BULL PUT SPREAD', 75)
+        before = dict(candidate)
+        bot.validate_batch([candidate])
+        assert candidate == before
+
+    def test_prevalidated_pick_skips_strategy_rules(self, bot, monkeypatch):
+        candidate = _candidate('AAPL', 'BULL PUT SPREAD', 75)
+        [(ok, _)] = bot.validate_batch([candidate])
+        assert ok
+
+        calls = []
+        strategy_rules = tuple(
+            (lambda ctx, rejects=rejects: calls.append(ctx) or rejects(ctx), reason, advisory)
+            for rejects, reason, advisory in bot_core._STRATEGY_IV_RULES
+        )
+        monkeypatch.setattr(bot_core, '_POST_VALIDATION_RULES', strategy_rules + bot_core._SPREAD_WIDTH_RULES)
+
+        ok, _ = bot.post_validate_grok_recommendation('AAPL', candidate, candidate['analysis'], 150.0,
+                                                      iv_prevalidated=True)
+        assert ok
+        assert calls == []
+
+        # Without the explicit keyword the full table runs again
+        bot.post_validate_grok_recommendation('AAPL', candidate, candidate['analysis'], 150.0)
+        assert calls
+
+    def test_prevalidated_pick_still_checks_spread_width(self, bot):
+        candidate = _candidate('AAPL', 'BULL PUT SPREAD', 75, strikes='150/149.5')
+
+        ok, reason = bot.post_validate_grok_recommendation('AAPL', candidate, candidate['analysis'], 150.0,
+                                                           iv_prevalidated=True)
+        assert not ok
+        assert 'too narrow' in reason
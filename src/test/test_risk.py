@@ -64,7 +64,7 @@ def test_calculate_dynamic_limit_price():
 
     # Test wide spread buy
     bid, ask = 4.80, 5.20
-    spread_pct = (5.20 - 4.80) / 5.0 = 0.08
+    # spread_pct = (5.20 - 4.80) / 5.0 = 0.08
     buy_limit = calculate_dynamic_limit_price(bid, ask, 'buy')
     assert buy_limit == 5.20 + (0.40 * 0.10)  # Should add buffer for wide spread
 
@@ -32,6 +32,8 @@ class InteractiveUI:
         self.ui_thread = None
         self.manual_scan_requested = False
         self.manual_portfolio_requested = False
+        # Set on every request so the bot's main loop wakes from its sleep immediately
+        self.wake_event = threading.Event()
 
     def start(self):
         """Start the interactive UI in a separate thread"""
@@ -101,12 +103,14 @@ class InteractiveUI:
             # Manual scan requested
             print(f"\n{Fore.YELLOW}[MANUAL] Wheel scan requested - will execute on next cycle{Style.RESET_ALL}")
             self.manual_scan_requested = True
+            self.wake_event.set()
             logging.info("[UI] Manual Wheel scan requested by user")
 
         elif key == 'p':
             # Manual portfolio evaluation requested
             print(f"\n{Fore.YELLOW}[MANUAL] Portfolio evaluation requested - will execute on next cycle{Style.RESET_ALL}")
             self.manual_portfolio_requested = True
+            self.wake_event.set()
             logging.info("[UI] Manual portfolio evaluation requested by user")
 
         elif key == 'q':
@@ -114,6 +118,7 @@ class InteractiveUI:
             print(f"\n{Fore.RED}[SHUTDOWN] Graceful shutdown requested...{Style.RESET_ALL}")
             self.running = False
             self.bot.shutdown_requested = True
+            self.wake_event.set()
 
         elif key == 'h' or key == '?':
             # Help
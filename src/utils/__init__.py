@@ -19,7 +19,7 @@ from .validators import (
     validate_symbol
 )
 
-from .circuit_breaker import CircuitBreaker, APICache, RateLimiter
+from .circuit_breaker import CircuitBreaker, APICache, RateLimiter, TokenBucket
 from .greeks_calculator import GreeksCalculator
 from .grok_data_fetcher import GrokDataFetcher
 
@@ -35,6 +35,7 @@ __all__ = [
     'CircuitBreaker',
     'APICache',
     'RateLimiter',
+    'TokenBucket',
     'GreeksCalculator',
     'GrokDataFetcher',
 ]
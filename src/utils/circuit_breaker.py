@@ -7,6 +7,7 @@ Provides robust API interaction utilities:
 - Rate limiting to prevent API throttling
 """
 
+import asyncio
 import logging
 import time
 from typing import Dict, Optional, Callable, Any
@@ -104,3 +105,29 @@ class RateLimiter:
         self.request_times.append(current_time)
 
 
+class TokenBucket:
+    """
+    Async token-bucket rate limiting - allows short bursts up to `capacity`,
+    then paces callers at `rate` requests per second. Only sleeps when the
+    bucket is actually empty, so slow responses don't pay for idle pacing.
+    """
+
+    def __init__(self, rate: float = 2.0, capacity: int = 4):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+
+    async def acquire(self):
+        """Take one token, sleeping until it is available"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+        # Reserve the token before sleeping (no await above), so concurrent
+        # callers on the same event loop queue up behind each other
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+
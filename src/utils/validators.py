@@ -2,9 +2,16 @@
 Option contract and strategy validation functions
 """
 
+import re
+from functools import lru_cache
 from typing import Dict, Tuple, List
 from config import config
 
+# Precompiled once - these run per candidate/signal in the prompt-building loops
+_SYMBOL_RE = re.compile(r'[A-Z]{1,5}')
+_STRIKES_RE = re.compile(r'[\d\./\s-]+')
+_UNSAFE_PROMPT_CHARS_RE = re.compile(r'[^A-Z0-9 .\-_/(),%]')
+
 
 def validate_contract_liquidity(contract: Dict, paper_mode: bool = None) -> Tuple[bool, str]:
     """
@@ -145,8 +152,7 @@ def validate_grok_response(symbol: str, strategy: str, confidence: int, strikes:
     if not symbol or not isinstance(symbol, str):
         return False, "Symbol cannot be empty"
 
-    import re
-    if not re.match(r'^[A-Z]{1,5}$', symbol.strip().upper()):
+    if not _SYMBOL_RE.fullmatch(symbol.strip().upper()):
         return False, f"Invalid symbol format: {symbol}"
 
     # Validate strategy
@@ -165,7 +171,7 @@ def validate_grok_response(symbol: str, strategy: str, confidence: int, strikes:
         return False, "Strikes cannot be empty"
 
     # Check strikes contain only valid characters
-    if not re.match(r'^[\d\./\s-]+$', strikes.strip()):
+    if not _STRIKES_RE.fullmatch(strikes.strip()):
         return False, f"Invalid strikes format: {strikes}"
 
     return True, "Valid"
@@ -176,9 +182,13 @@ def sanitize_for_prompt(text: str, max_length: int = 100) -> str:
     if text is None:
         return ""
 
-    safe_chars = set('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .-_/(),%')
-    sanitized = ''.join(c for c in str(text).upper() if c in safe_chars)
-    return sanitized[:max_length]
+    return _sanitize_str(str(text), max_length)
+
+
+@lru_cache(maxsize=2048)
+def _sanitize_str(text: str, max_length: int) -> str:
+    """Cached core of sanitize_for_prompt - the same symbols/reasons recur every scan"""
+    return _UNSAFE_PROMPT_CHARS_RE.sub('', text.upper())[:max_length]
 
 
 def validate_symbol(symbol: str) -> bool:
@@ -186,6 +196,4 @@ def validate_symbol(symbol: str) -> bool:
     if not symbol or not isinstance(symbol, str):
         return False
 
-    import re
-    pattern = r'^[A-Z]{1,5}$'
-    return bool(re.match(pattern, symbol.strip().upper()))
+    return _SYMBOL_RE.fullmatch(symbol.strip().upper()) is not None